@@ -0,0 +1,107 @@
+import sys
+import os
+import socket
+import signal
+import struct
+
+# Thin client for server.py. It imports neither fpp nor anything heavier
+# than socket, so a short script costs a Python start and one round trip.
+# stdin, stdout and stderr are handed to the server as file descriptors,
+# which lets the script read and write this terminal directly. Without a
+# running server the script runs here through run.py.
+#
+# A request is a list of NUL-terminated fields ending with an empty one:
+# 'run', script path, working directory, then search directories; or just
+# 'stop'. The server answers with 'pid <n>' and 'status <n>' lines.
+
+def socket_path():
+    if 'FPP_SOCKET' in os.environ:
+        return os.environ['FPP_SOCKET']
+    if os.environ.get('XDG_RUNTIME_DIR'):
+        return os.path.join(os.environ['XDG_RUNTIME_DIR'], f'fpp-{os.getuid()}.sock')
+    # /tmp is shared by every user, so the socket goes in a directory that
+    # only its owner can enter (server.bind creates it with mode 0700)
+    return os.path.join('/tmp', f'fpp-{os.getuid()}', 'server.sock')
+
+def peer_is_owner(sock, path):
+    # The client hands its terminal to the server and trusts its replies,
+    # so the process listening must run as this user
+    if hasattr(socket, 'SO_PEERCRED'):
+        credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+        pid, uid, gid = struct.unpack('3i', credentials)
+        return uid == os.getuid()
+    try:
+        return os.lstat(path).st_uid == os.getuid()
+    except OSError:
+        return False
+
+def server_available():
+    return hasattr(socket, 'AF_UNIX') and hasattr(socket, 'send_fds')
+
+def encode_request(fields):
+    return b''.join(os.fsencode(field) + b'\0' for field in fields) + b'\0'
+
+def decode_request(message):
+    return [os.fsdecode(field) for field in message[:-2].split(b'\0')]
+
+def submit(fields, path=None):
+    # Returns the exit status of the job, or None if no server is listening.
+    # Ctrl-C is passed on to the process running the job.
+    if not server_available():
+        return None
+    path = path or socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except (FileNotFoundError, ConnectionRefusedError, NotADirectoryError):
+        sock.close()
+        return None
+    if not peer_is_owner(sock, path):
+        sock.close()
+        print(f"Ignoring the fpp server on {path}: it belongs to another user", file=sys.stderr)
+        return None
+
+    with sock:
+        socket.send_fds(sock, [encode_request(fields)], [0, 1, 2])
+        reader = sock.makefile('rb')
+        pid = None
+        while True:
+            try:
+                line = reader.readline()
+            except KeyboardInterrupt:
+                if pid is not None:
+                    os.kill(pid, signal.SIGINT)
+                continue
+            if not line:
+                return 1
+            key, value = line.split()
+            if key == b'status':
+                return int(value)
+            pid = int(value)
+
+def main():
+    args = sys.argv[1:]
+    search_dirs = []
+    while len(args) > 1 and args[0] in ('-I', '--path'):
+        search_dirs.append(args[1])
+        args = args[2:]
+
+    if args == ['--stop']:
+        if submit(['stop']) is None:
+            print("No fpp server is running")
+        return 0
+    if len(args) != 1:
+        print("Usage: python client.py [-I <dir>]... <filename>")
+        print("       python client.py --stop")
+        return 2
+
+    status = submit(['run', os.path.abspath(args[0]), os.getcwd()] + [os.path.abspath(d) for d in search_dirs])
+    if status is None:
+        from run import run_file, load_image
+        load_image(os.environ.get('FPP_IMAGE'))
+        run_file(args[0], search_dirs)
+        return 0
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
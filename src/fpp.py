@@ -1,3074 +1,6385 @@
-#######################################
-# IMPORTS
-#######################################
-
-from strings_with_arrows import *
-
-import string
-
-import math
-
-import sys
-
-import random
-
-import time
-
-import gc
-
-import os
-
-import importlib.util
-
-#######################################
-# CONSTANTS
-#######################################
-
-DIGITS = '0123456789'
-LETTERS = string.ascii_letters
-LETTERS_DIGITS = LETTERS + DIGITS
-
-#######################################
-# ERRORS
-#######################################
-
-class Error:
-    def __init__(self, pos_start, pos_end, error_name, details):
-        self.pos_start = pos_start
-        self.pos_end = pos_end
-        self.error_name = error_name
-        self.details = details
-    
-    def as_string(self):
-        result  = f'{self.error_name}: {self.details}\n'
-        result += f'File {self.pos_start.fn}, line {self.pos_start.ln + 1}'
-        result += '\n\n' + string_with_arrows(self.pos_start.ftxt, self.pos_start, self.pos_end)
-        return result
-
-class IllegalCharError(Error):
-    def __init__(self, pos_start, pos_end, details):
-        super().__init__(pos_start, pos_end, 'Illegal Character', details)
-
-class ExpectedCharError(Error):
-    def __init__(self, pos_start, pos_end, details):
-        super().__init__(pos_start, pos_end, 'Expected character' , details)
-
-class InvalidSyntaxError(Error):
-    def __init__(self, pos_start, pos_end, details=''):
-        super().__init__(pos_start, pos_end, 'Invalid Syntax', details)
-
-class RTError(Error):
-    def __init__(self, pos_start, pos_end, details, context):
-        super().__init__(pos_start, pos_end, 'Runtime Error', details)
-        self.context = context
-
-    def as_string(self):
-        result  = self.generate_traceback()
-        result += f'{self.error_name}: {self.details}'
-        result += '\n\n' + string_with_arrows(self.pos_start.ftxt, self.pos_start, self.pos_end)
-        return result
-
-    def generate_traceback(self):
-        result = ''
-        pos = self.pos_start
-        ctx = self.context
-
-        while ctx:
-            result = f'  File {pos.fn}, line {str(pos.ln + 1)}, in {ctx.display_name}\n' + result
-            pos = ctx.parent_entry_pos
-            ctx = ctx.parent
-
-        return 'Traceback (most recent call last):\n' + result
-
-#######################################
-# POSITION
-#######################################
-
-class Position:
-    def __init__(self, idx, ln, col, fn, ftxt):
-        self.idx = idx
-        self.ln = ln
-        self.col = col
-        self.fn = fn
-        self.ftxt = ftxt
-
-    def advance(self, current_char=None):
-        self.idx += 1
-        self.col += 1
-
-        if (current_char == '\n'):
-            self.ln += 1
-            self.col = 0
-
-        return self
-
-    def copy(self):
-        return Position(self.idx, self.ln, self.col, self.fn, self.ftxt)
-
-#######################################
-# TOKENS
-#######################################
-
-TT_INT                = 'INT'
-TT_FLOAT        = 'FLOAT'
-TT_STRING			= 'STRING'
-TT_IDENTIFIER    = 'IDENTIFIER'
-TT_KEYWORD        = 'KEYWORD'
-TT_PLUS        = 'PLUS'
-TT_MINUS        = 'MINUS'
-TT_MUL        = 'MUL'
-TT_DIV        = 'DIV'
-TT_POW            = 'POW'
-TT_EQ            = 'EQ'
-TT_LPAREN        = 'LPAREN'
-TT_RPAREN        = 'RPAREN'
-TT_LBRACET       = 'LBRACET'
-TT_RBRACET       = 'RBRACET'
-TT_LSQUARE       = 'LSQUARE'
-TT_RSQUARE       = 'RSQUARE'
-TT_EE            = 'EE'
-TT_NE            = 'NE'
-TT_LT            = 'LT'
-TT_GT            = 'GT'
-TT_LTE        = 'LTE'
-TT_GTE        = 'GTE'
-TT_COMMA          = 'COMMMA'
-TT_NEWLINE          = 'NEWLINE'
-TT_ARROW          ='ARROW'
-TT_TWODOT           = 'TWODOT'
-TT_EOF            = 'EOF'
-
-KEYWORDS = [
-    'let',
-    'and',
-    'or',
-    'not',
-    'if',
-    'elif',
-    'else',
-    'for',
-    'to',
-    'step',
-    'while',
-    'func',
-    'add',
-    'remove',
-    'with',
-    'get',
-    'endf',
-    'const',
-    'int',
-    'str',
-    'bool',
-    'arr',
-    'float',
-    'continue',
-    'break',
-    'use'
-]
-
-
-class Token:
-    def __init__(self, type_, value=None, pos_start=None, pos_end=None):
-        self.type = type_
-        self.value = value
-
-        if pos_start:
-            self.pos_start = pos_start.copy()
-            self.pos_end = pos_start.copy()
-            self.pos_end.advance()
-
-        if pos_end:
-            self.pos_end = pos_end.copy()
-
-    def matches(self, type_, value):
-        return self.type == type_ and self.value == value
-    
-    def __repr__(self):
-        if self.value: return f'{self.type}:{self.value}'
-        return f'{self.type}'
-
-#######################################
-# LEXER
-#######################################
-
-class Lexer:
-    def __init__(self, fn, text):
-        self.fn = fn
-        self.text = text
-        self.pos = Position(-1, 0, -1, fn, text)
-        self.current_char = None
-        self.advance()
-    
-    def advance(self):
-        self.pos.advance(self.current_char)
-        self.current_char = self.text[self.pos.idx] if self.pos.idx < len(self.text) else None
-
-    def make_tokens(self):
-        tokens = []
-
-        while self.current_char != None:
-            if self.current_char in ' \t':
-                self.advance()
-            elif self.current_char in ';\n':
-                tokens.append(Token(TT_NEWLINE, pos_start=self.pos))
-                self.advance()
-            elif self.current_char in DIGITS:
-                tokens.append(self.make_number())
-            elif self.current_char in LETTERS:
-                tokens.append(self.make_identifier())
-            elif self.current_char == '"':
-                tokens.append(self.make_string())
-            elif self.current_char == '+':
-                tokens.append(Token(TT_PLUS, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == '-':
-                tokens.append(Token(TT_MINUS, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == '*':
-                tokens.append(Token(TT_MUL, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == '/':
-                tokens.append(Token(TT_DIV, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == '^':
-                tokens.append(Token(TT_POW, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == '(':
-                tokens.append(Token(TT_LPAREN, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == ')':
-                tokens.append(Token(TT_RPAREN, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == '[':
-                tokens.append(Token(TT_LSQUARE, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == ']':
-                tokens.append(Token(TT_RSQUARE, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == ',':
-                tokens.append(Token(TT_COMMA, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == '{':
-                tokens.append(Token(TT_LBRACET, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == '}':
-                tokens.append(Token(TT_RBRACET, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == ':':
-                tokens.append(Token(TT_TWODOT, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == '!':
-                token, error = self.make_not_equals()
-                if error: 
-                    return [], error
-                tokens.append(token)
-            elif self.current_char == '=':
-                tokens.append(self.make_equals_or_arrow())
-            elif self.current_char == '<':
-                tokens.append(self.make_less_than())
-                self.advance()
-            elif self.current_char == '>':
-                tokens.append(self.make_greater_than())
-                self.advance()
-            else:
-                pos_start = self.pos.copy()
-                char = self.current_char
-                self.advance()
-                return [], IllegalCharError(pos_start, self.pos, "'" + char + "'")
-
-        tokens.append(Token(TT_EOF, pos_start=self.pos))
-        return tokens, None
-
-    def make_number(self):
-        num_str = ''
-        dot_count = 0
-        pos_start = self.pos.copy()
-
-        while self.current_char != None and self.current_char in DIGITS + '.':
-            if self.current_char == '.':
-                if dot_count == 1: break
-                dot_count += 1
-            num_str += self.current_char
-            self.advance()
-
-        if dot_count == 0:
-            return Token(TT_INT, int(num_str), pos_start, self.pos)
-        else:
-            return Token(TT_FLOAT, float(num_str), pos_start, self.pos)
-
-    def make_string(self):
-        string = ''
-        pos_start = self.pos.copy()
-        escape_character = False
-        self.advance()
-
-        escape_characters = {
-            'n': '\n',
-            't': '\t'
-        }
-
-        while self.current_char != None and (self.current_char != '"' or escape_character):
-            if escape_character:
-                string += escape_characters.get(self.current_char, self.current_char)
-                escape_character = False
-            else:
-                if self.current_char == '\\':
-                    escape_character = True
-                else:
-                    string += self.current_char
-            self.advance()
-
-            escape_character = False
-		
-        self.advance()
-        return Token(TT_STRING, string, pos_start, self.pos)
-
-    def make_identifier(self):
-        id_str = ''
-        pos_start = self.pos.copy()
-
-        while self.current_char != None and self.current_char in LETTERS_DIGITS + '_' + '.':
-            id_str += self.current_char
-            self.advance()
-
-        tok_type = TT_KEYWORD if id_str.lower() in [k.lower() for k in KEYWORDS] else TT_IDENTIFIER
-        return Token(tok_type, id_str.lower(), pos_start, self.pos)
-    
-    def make_equals_or_arrow(self):
-        pos_start = self.pos.copy()
-        self.advance()
-        if self.current_char == '=':
-            self.advance()
-            return Token(TT_EE, pos_start=pos_start, pos_end=self.pos)
-        elif self.current_char == '>':
-            self.advance()
-            return Token(TT_ARROW, pos_start=pos_start, pos_end=self.pos)
-        return Token(TT_EQ, pos_start=pos_start, pos_end=self.pos)
-
-    def make_not_equals(self):
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == '=':
-            self.advance()
-            return Token(TT_NE, pos_start=pos_start, pos_end=self.pos), None
-
-        self.advance()
-        return None, ExpectedCharError(pos_start, self.pos, "'=' (after '!')")
-
-    def make_equals(self):
-        tok_type = TT_EQ
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == '=':
-            self.advance()
-            tok_type = TT_EE
-
-        return Token(tok_type, pos_start=pos_start, pos_end=self.pos)
-
-    def make_less_than(self):
-        tok_type = TT_LT
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == '=':
-            self.advance()
-            tok_type = TT_LTE
-
-        return Token(tok_type, pos_start=pos_start, pos_end=self.pos)
-
-    def make_greater_than(self):
-        tok_type = TT_GT
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == '=':
-            self.advance()
-            tok_type = TT_GTE
-
-        return Token(tok_type, pos_start=pos_start, pos_end=self.pos)
-
-#######################################
-# NODES
-#######################################
-
-class StringNode:
-    def __init__(self, tok):
-        self.tok = tok
-
-        self.pos_start = self.tok.pos_start
-        self.pos_end = self.tok.pos_end
-
-    def __repr__(self):
-        return f'{self.tok}'
-
-class NumberNode:
-    def __init__(self, tok):
-        self.tok = tok
-
-        self.pos_start = self.tok.pos_start
-        self.pos_end = self.tok.pos_end
-
-    def __repr__(self):
-        return f'{self.tok}'
-    
-class ListNode:
-    def __init__(self, elementNodes, pos_start, pos_end):
-        self.elementNodes = elementNodes
-        
-        self.pos_start = pos_start
-        self.pos_end = pos_end
-
-class VarAccessNode:
-    def __init__(self, var_name_tok):
-        self.var_name_tok = var_name_tok
-
-        self.pos_start = self.var_name_tok.pos_start
-        self.pos_end = self.var_name_tok.pos_end
-
-class VarAssignNode:
-    def __init__(self, var_name_tok, value_node, is_const=False, var_type=None):
-        self.var_name_tok = var_name_tok
-        self.value_node = value_node
-        self.is_const = is_const
-        self.var_type = var_type
-
-        self.pos_start = self.var_name_tok.pos_start
-        self.pos_end = self.value_node.pos_end
-
-class BinOpNode:
-    def __init__(self, left_node, op_tok, right_node):
-        self.left_node = left_node
-        self.op_tok = op_tok
-        self.right_node = right_node
-
-        self.pos_start = self.left_node.pos_start
-        self.pos_end = self.right_node.pos_end
-
-    def __repr__(self):
-        return f'({self.left_node}, {self.op_tok}, {self.right_node})'
-
-class UnaryOpNode:
-    def __init__(self, op_tok, node):
-        self.op_tok = op_tok
-        self.node = node
-
-        self.pos_start = self.op_tok.pos_start
-        self.pos_end = node.pos_end
-
-    def __repr__(self):
-        return f'({self.op_tok}, {self.node})'
-    
-class ifNode:
-    def __init__(self, cases, else_case):
-        self.cases = cases
-        self.else_case = else_case
-
-        self.pos_start = cases[0][0].pos_start
-        if self.else_case:
-            node = self.else_case[0] if isinstance(self.else_case, tuple) else self.else_case
-            self.pos_end = node.pos_end
-        else:
-            self.pos_end = self.cases[-1][1].pos_end
-
-    def __repr__(self):
-        return f'if: ({self.cases}, else: {self.else_case})'
-
-    
-class forNode:
-    def __init__(self, var_name_tok, start_value_node, end_value_node, step_value_node, body_node, should_return_null=False):
-        self.var_name_tok = var_name_tok
-        self.start_value_node = start_value_node
-        self.end_value_node = end_value_node 
-        self.step_value_node = step_value_node
-        self.body_node = body_node
-        self.should_return_null = should_return_null
-
-        self.pos_start = self.var_name_tok.pos_start
-        self.pos_end = self.body_node.pos_end
-
-class whileNode:
-    def __init__(self, condition_node, body_node):
-        self.condition_node = condition_node
-        self.body_node = body_node
-
-        self.pos_start = self.condition_node.pos_start
-        self.pos_end = self.body_node.pos_end
-
-class FuncDefNode:
-    def __init__(self, var_name_tok, arg_names_toks, body_node):
-        self.var_name_tok = var_name_tok
-        self.arg_names_toks = arg_names_toks
-        self.body_node = body_node
-
-        if self.var_name_tok:
-            self.pos_start = self.var_name_tok.pos_start
-        elif len(self.arg_names_toks) > 0:
-            self.pos_start = self.arg_names_toks[0].pos_start
-        else:
-            self.pos_start = self.body_node.pos_start
-
-        self.pos_end = self.body_node.pos_end
-        
-class BreakNode:
-    def __init__(self, tok):
-        self.tok = tok
-        self.pos_start = self.tok.pos_start
-        self.pos_end = self.tok.pos_end
-
-class ContinueNode:
-    def __init__(self, tok):
-        self.tok = tok
-        self.pos_start = self.tok.pos_start
-        self.pos_end = self.tok.pos_end
-        
-class ImportNode:
-    def __init__(self, module_name_tok):
-        self.module_name_tok = module_name_tok
-        self.pos_start = self.module_name_tok.pos_start
-        self.pos_end = self.module_name_tok.pos_end
-
-class CallNode:
-    def __init__(self, node_to_call, arg_nodes):
-        self.node_to_call = node_to_call
-        self.arg_nodes = arg_nodes
-
-        self.pos_start = self.node_to_call.pos_start
-        if len(self.arg_nodes) > 0:
-            self.pos_end = self.arg_nodes[len(self.arg_nodes)-1].pos_end
-        else:
-            self.pos_end = self.node_to_call.pos_end
-
-
-###################################
-# PARSE RESULT
-#######################################
-
-class ParseResult:
-    def __init__(self):
-        self.error = None
-        self.node = None
-        self.advance_count = 0
-        self.to_reverse_count = 0
-
-    def register_advancement(self):
-        self.advance_count += 1
-
-    def register(self, res):
-        self.advance_count += res.advance_count
-        if res.error: self.error = res.error
-        return res.node
-    
-    def try_register(self, res):
-        if res.error:
-            self.to_reverse_count = res.advance_count
-            return None
-        return self.register(res)
-
-    def success(self, node):
-        self.node = node
-        return self
-
-    def failure(self, error):
-        if not self.error or self.advance_count == 0:
-            self.error = error
-        return self
-
-#######################################
-# PARSER
-#######################################
-
-class Parser:
-    def __init__(self, tokens):
-        self.tokens = tokens
-        self.tok_idx = -1
-        self.advance()
-
-    def advance(self, ):
-        self.tok_idx += 1
-        self.update_current_tok()
-        return self.current_tok
-    
-    def reverse(self, amount=1):
-        self.tok_idx -= amount
-        self.update_current_tok()
-        return self.current_tok
-    
-    def update_current_tok(self):
-        if self.tok_idx >= 0 and self.tok_idx < len(self.tokens):
-            self.current_tok = self.tokens[self.tok_idx]
-
-    def parse(self):
-        res = self.statements()
-        if not res.error and self.current_tok.type != TT_EOF:
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                "Expected '+', '-', '*', '/' or '^'"
-            ))
-        return res
-
-    ###################################
-    
-    def statements(self):
-        res = ParseResult()
-        statements = []
-        pos_start = self.current_tok.pos_start.copy()
-        
-        while self.current_tok.type == TT_NEWLINE:
-            res.register_advancement()
-            self.advance()
-
-        statement = res.register(self.statement())
-        if res.error: return res
-        statements.append(statement)
-
-        more_statements = True
-
-        while more_statements:
-            newline_count = 0
-            while self.current_tok.type == TT_NEWLINE:
-                res.register_advancement()
-                self.advance()
-                newline_count += 1
-            
-            if newline_count == 0:
-                more_statements = False
-                continue
-
-            statement = res.try_register(self.statement())
-            if not statement:
-                self.reverse(res.to_reverse_count)
-                more_statements = False
-                continue
-            statements.append(statement)
-
-        return res.success(ListNode(
-            statements,
-            pos_start,
-            self.current_tok.pos_end.copy()
-        ))
-        
-    def statement(self):
-        res = ParseResult()
-        pos_start = self.current_tok.pos_start.copy()
-
-        if self.current_tok.matches(TT_KEYWORD, 'continue'):
-            res.register_advancement()
-            self.advance()
-            return res.success(ContinueNode(self.current_tok))
-            
-        if self.current_tok.matches(TT_KEYWORD, 'break'):
-            res.register_advancement()
-            self.advance()
-            return res.success(BreakNode(self.current_tok))
-        
-        if self.current_tok.matches(TT_KEYWORD, 'use'):
-            self.advance()
-            if self.current_tok.type != TT_IDENTIFIER:
-                return ParseResult().failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end,
-                    "Expected identifier"
-                ))
-            module_name = self.current_tok
-            self.advance()
-            return ParseResult().success(ImportNode(module_name))
-        
-
-        if self.current_tok.matches(TT_KEYWORD, 'while'):
-            while_expr = res.register(self.while_expr())
-            if res.error: return res
-            return res.success(while_expr)
-        
-        if self.current_tok.matches(TT_KEYWORD, 'while'):
-            while_expr = res.register(self.while_expr())
-            if res.error: return res
-            return res.success(while_expr)
-
-        expr = res.register(self.expr())
-        if res.error:
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                "Expected 'continue', 'break', 'let', 'const', 'if', 'for', 'while', 'func', int, float, identifier, '+', '-', '(', '[' or 'not'"
-            ))
-        return res.success(expr)
-    
-    def comp_expr(self):
-        res = ParseResult()
-
-        if self.current_tok.matches(TT_KEYWORD, 'not'):
-            op_tok = self.current_tok
-            res.register_advancement()
-            self.advance()
-
-            node = res.register(self.comp_expr())
-            if res.error:
-                return res
-            return res.success(UnaryOpNode(op_tok, node))
-        
-        node = res.register(self.bin_op(self.arith_expr, (TT_EE, TT_NE, TT_LT, TT_GT, TT_LTE, TT_GTE)))
-
-        if res.error:
-            return res.failure(InvalidSyntaxError(self.current_tok.pos_start, self.current_tok.pos_end, "Expected int, float, identifier, '+', '-', '(' or 'not' "))
-
-        return res.success(node)
-    
-    def expr(self):
-        res = ParseResult()
-
-        if self.current_tok.matches(TT_KEYWORD, 'if'):
-                if_expr = res.register(self.if_expr())
-                if res.error: return res
-                return res.success(if_expr)
-        
-        if self.current_tok.matches(TT_KEYWORD, 'while'):
-            expr = res.register(self.while_expr())
-            if res.error: return res
-            return res.success(expr)
-
-        if self.current_tok.matches(TT_KEYWORD, 'let') or self.current_tok.matches(TT_KEYWORD, 'const'):
-            is_const = self.current_tok.matches(TT_KEYWORD, 'const')
-            res.register_advancement()
-            self.advance()
-            
-            var_type = None
-            if self.current_tok.matches(TT_KEYWORD, 'int') or self.current_tok.matches(TT_KEYWORD, 'str') or self.current_tok.matches(TT_KEYWORD, 'bool')  or self.current_tok.matches(TT_KEYWORD, 'arr') or self.current_tok.matches(TT_KEYWORD, 'float'):
-                var_type = self.current_tok.value
-                res.register_advancement()
-                self.advance()
-
-            if self.current_tok.type != TT_IDENTIFIER:
-                return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end,
-                    "Expected identifier"
-                ))
-
-            var_name = self.current_tok
-            res.register_advancement()
-            self.advance()
-
-
-            if self.current_tok.type != TT_EQ:
-                return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end,
-                    "Expected '='"
-                ))
-
-            res.register_advancement()
-            self.advance()
-            expr = res.register(self.expr())
-            if res.error: return res
-            return res.success(VarAssignNode(var_name, expr, is_const, var_type))
-
-        node = res.register(self.bin_op(self.comp_expr, ((TT_KEYWORD, 'and'), (TT_KEYWORD, 'or'))))
-
-        if res.error:
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                "Expected 'let', 'const','if', int, float, identifier, '+', '-', '(' or 'not'"
-            ))
-
-        return res.success(node)
-
-
-    def power(self):
-        return self.bin_op(self.call, (TT_POW, ), self.factor)
-
-    def call(self):
-        res = ParseResult()
-        atom = res.register(self.atom())
-        if res.error: return res
-
-        if self.current_tok.type == TT_LPAREN:
-            res.register_advancement()
-            self.advance()
-            arg_nodes = []
-
-            if self.current_tok.type == TT_RPAREN:
-                res.register_advancement()
-                self.advance()
-            else:
-                arg_nodes.append(res.register(self.expr()))
-                if res.error:
-                    return res.failure(InvalidSyntaxError(
-                        self.current_tok.pos_start, self.current_tok.pos_end,
-                        "Expected ')', 'let', 'if', 'for', 'while', 'func', int, float, identifier, '+', '-', '(', '[' or 'not'"
-                    ))
-
-                while self.current_tok.type == TT_COMMA:
-                    res.register_advancement()
-                    self.advance()
-
-                    arg_nodes.append(res.register(self.expr()))
-                    if res.error: return res
-
-                if self.current_tok.type != TT_RPAREN:
-                    return res.failure(InvalidSyntaxError(
-                        self.current_tok.pos_start, self.current_tok.pos_end,
-                        f"Expected ',' or ')'"
-                    ))
-
-                res.register_advancement()
-                self.advance()
-            return res.success(CallNode(atom, arg_nodes))
-        return res.success(atom)
-
-    def factor(self):
-        res = ParseResult()
-        tok = self.current_tok
-
-        if tok.type in (TT_PLUS, TT_MINUS):
-            res.register_advancement()
-            self.advance()
-            factor = res.register(self.factor())
-            if res.error: return res
-            return res.success(UnaryOpNode(tok, factor))
-
-        return self.power()
-
-    def term(self):
-        return self.bin_op(self.factor, (TT_MUL, TT_DIV))
-
-    def arith_expr(self):
-        return self.bin_op(self.term, (TT_PLUS, TT_MINUS))
-
-    
-    def atom(self):
-        res = ParseResult()
-        tok = self.current_tok
-
-        if tok.type in (TT_INT, TT_FLOAT):
-            res.register_advancement()
-            self.advance()
-            return res.success(NumberNode(tok))
-
-        elif tok.type == TT_STRING:
-            res.register_advancement()
-            self.advance()
-            return res.success(StringNode(tok))
-
-        elif tok.type == TT_IDENTIFIER:
-            res.register_advancement()
-            self.advance()
-            return res.success(VarAccessNode(tok))
-        
-        elif tok.type == TT_KEYWORD:
-            if tok.value == 'break':
-                res.register_advancement()
-                self.advance()
-                return res.success(BreakNode(tok))
-            elif tok.value == 'continue':
-                res.register_advancement()
-                self.advance()
-                return res.success(ContinueNode(tok))
-
-        elif tok.type == TT_LPAREN:
-            res.register_advancement()
-            self.advance()
-            expr = res.register(self.expr())
-            if res.error: return res
-            if self.current_tok.type == TT_RPAREN:
-                res.register_advancement()
-                self.advance()
-                return res.success(expr)
-            else:
-                return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end,
-                    "Expected ')'"
-                ))
-
-        elif tok.type == TT_LSQUARE:
-            list_expr = res.register(self.list_expr())
-            if res.error: return res
-            return res.success(list_expr)
-
-        elif tok.matches(TT_KEYWORD, 'if'):
-            if_expr = res.register(self.if_expr())
-            if res.error: return res
-            return res.success(if_expr)
-
-        elif tok.matches(TT_KEYWORD, 'for'):
-            for_expr = res.register(self.for_expr())
-            if res.error: return res
-            return res.success(for_expr)
-
-        elif tok.matches(TT_KEYWORD, 'while'):
-            while_expr = res.register(self.while_expr())
-            if res.error: return res
-            return res.success(while_expr)
-
-        elif tok.matches(TT_KEYWORD, 'func'):
-            func_def = res.register(self.func_def())
-            if res.error: return res
-            return res.success(func_def)
-
-        return res.failure(InvalidSyntaxError(
-            tok.pos_start, tok.pos_end,
-            "Expected int, float, identifier, string, 'let', 'while', 'for', 'if', '+', '-', '{', '[' or '('"
-        ))
-
-        
-        
-
-    ################################### 
-    
-    def list_expr(self):
-        res = ParseResult()
-        element_nodes = []
-        pos_start = self.current_tok.pos_start.copy()
-
-        if self.current_tok.type != TT_LSQUARE:
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end, "Expected '['"
-            ))
-
-        res.register_advancement()
-        self.advance()
-
-        if self.current_tok.type == TT_RSQUARE:
-            res.register_advancement()
-            self.advance()
-            return res.success(ListNode(element_nodes, pos_start, self.current_tok.pos_end.copy()))
-
-        element_nodes.append(res.register(self.expr()))
-        if res.error: return res
-
-        while self.current_tok.type == TT_COMMA:
-            res.register_advancement()
-            self.advance()
-
-            element_nodes.append(res.register(self.expr()))
-            if res.error: return res
-
-        if self.current_tok.type != TT_RSQUARE:
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                "Expected ',' or ']'"
-            ))
-
-        res.register_advancement()
-        self.advance()
-        return res.success(ListNode(element_nodes, pos_start, self.current_tok.pos_end.copy()))
-
-    def if_expr(self):
-        res = ParseResult()
-        all_cases = res.register(self.if_expr_cases("if"))
-        if res.error:
-            return res
-        cases, else_case = all_cases
-        return res.success(ifNode(cases, else_case))
-
-    def if_expr_b(self):
-        return self.if_expr_cases("elif")
-
-    def if_expr_c(self):
-        res = ParseResult()
-        else_case = None
-
-        if self.current_tok.matches(TT_KEYWORD, "else"):
-            res.register_advancement()
-            self.advance()
-
-            if self.current_tok.type == TT_LBRACET or self.current_tok.type == TT_NEWLINE:
-                if self.current_tok.type == TT_LBRACET:
-                    res.register_advancement()
-                    self.advance()
-                else:  # NEWLINE branch
-                    res.register_advancement()
-                    self.advance()
-                statements = res.register(self.statements())
-                if res.error: 
-                    return res
-                else_case = (statements, True)  
-                if self.current_tok.type != TT_RBRACET:
-                    return res.failure(InvalidSyntaxError(
-                        self.current_tok.pos_start, self.current_tok.pos_end, "Expected '}'"
-                    ))
-                res.register_advancement()
-                self.advance()
-            else:
-                # Otherwise, a single expression branch
-                expr = res.register(self.expr())
-                if res.error:
-                    return res
-                else_case = (expr, False)
-        else:
-            # If no "else" keyword, parse a single expression (or raise error)
-            expr = res.register(self.expr())
-            if res.error:
-                return res
-            else_case = (expr, False)
-        return res.success(else_case)
-    def if_expr_b_or_c(self):
-        res = ParseResult()
-        cases, else_case = [], None
-
-        if self.current_tok.matches(TT_KEYWORD, "elif"):
-            all_cases = res.register(self.if_expr_b())
-            if res.error:
-                return res
-            cases, else_case = all_cases
-        else:
-            else_case = res.register(self.if_expr_c())
-            if res.error:
-                return res
-            
-        # Wrap the two values in a tuple (a single argument to success)
-        return res.success((cases, else_case))
-
-    def if_expr_cases(self, case_keyword):
-        res = ParseResult()
-        cases = []
-        else_case = None
-
-        if not self.current_tok.matches(TT_KEYWORD, case_keyword):
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end, f"Expected '{case_keyword}'"
-            ))
-
-        res.register_advancement()
-        self.advance()
-
-        condition = res.register(self.expr())
-        if res.error: return res
-
-        if self.current_tok.type != TT_LBRACET:
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end, "Expected '{'"
-            ))
-
-        res.register_advancement()
-        self.advance()
-
-        if self.current_tok.type == TT_NEWLINE:
-            res.register_advancement()
-            self.advance()
-
-            statements = res.register(self.statements())
-            if res.error: return res
-            cases.append((condition, statements, True))  # true indicates the branch is a block
-
-            if self.current_tok.type == TT_RBRACET:
-                res.register_advancement()
-                self.advance()
-            else:
-                all_cases = res.register(self.if_expr_b_or_c())
-                if res.error: return res
-                new_cases, else_case = all_cases
-                cases.extend(new_cases)
-        else:
-            expr = res.register(self.expr())
-            if res.error: return res
-            cases.append((condition, expr, False))  # false indicates a single-expression branch
-                
-            if self.current_tok.type != TT_RBRACET:
-                return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end, "Expected '}'"
-                ))
-            res.register_advancement()
-            self.advance()
-
-            all_cases = res.register(self.if_expr_b_or_c())
-            if res.error: return res
-            new_cases, else_case = all_cases
-            cases.extend(new_cases)
-
-        return res.success((cases, else_case))
-        
-    def for_expr(self):
-        res = ParseResult()
-
-        if not self.current_tok.matches(TT_KEYWORD, 'for'):
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                "Expected 'for'"
-            ))
-
-        res.register_advancement()
-        self.advance()
-
-        if self.current_tok.type != TT_IDENTIFIER:
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                "Expected identifier"
-            ))
-
-        var_name = self.current_tok
-        res.register_advancement()
-        self.advance()
-
-        # Check for equals sign
-        if self.current_tok.type != TT_EQ:
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                "Expected '='"
-            ))
-
-        res.register_advancement()
-        self.advance()
-        
-        # Parse start value
-        start_value = res.register(self.expr())
-        if res.error: return res
-
-        # Check for 'to' keyword
-        if not self.current_tok.matches(TT_KEYWORD, 'to'):
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                "Expected 'to'"
-            ))
-
-        res.register_advancement()
-        self.advance()
-        
-        # Parse end value
-        end_value = res.register(self.expr())
-        if res.error: return res
-
-        # Check for optional 'step' keyword
-        if self.current_tok.matches(TT_KEYWORD, 'step'):
-            res.register_advancement()
-            self.advance()
-
-            step_value = res.register(self.expr())
-            if res.error: return res
-        else:
-            step_value = None
-
-        # Look for opening curly brace (your syntax uses { } instead of THEN/END)
-        if self.current_tok.type != TT_LBRACET:
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                "Expected '{'"
-            ))
-
-        res.register_advancement()
-        self.advance()
-
-        # Check if it's a block of statements or a single expression
-        if self.current_tok.type == TT_NEWLINE:
-            res.register_advancement()
-            self.advance()
-
-            body = res.register(self.statements())
-            if res.error: return res
-
-            if self.current_tok.type != TT_RBRACET:
-                return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end,
-                    "Expected '}'"
-                ))
-
-            res.register_advancement()
-            self.advance()
-
-            return res.success(forNode(var_name, start_value, end_value, step_value, body, True))
-        else:
-            # Single expression body
-            body = res.register(self.expr())
-            if res.error: return res
-
-            if self.current_tok.type != TT_RBRACET:
-                return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end,
-                    "Expected '}'"
-                ))
-
-            res.register_advancement()
-            self.advance()
-
-            return res.success(forNode(var_name, start_value, end_value, step_value, body, False))
-
-    
-    def func_def(self):
-        res = ParseResult()
-
-        if not self.current_tok.matches(TT_KEYWORD, 'func'):
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end, f"Expected 'func'"
-            ))
-
-        res.register_advancement()
-        self.advance()
-
-        if self.current_tok.type == TT_IDENTIFIER:
-            var_name_tok = self.current_tok
-            res.register_advancement()
-            self.advance()
-            if self.current_tok.type != TT_LPAREN:
-                return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end, f"Expected '('"
-                ))
-            
-        else:
-            var_name_tok = None
-            if self.current_tok.type != TT_LPAREN:
-                return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end, f"Expected identifier or '('"
-                ))
-            
-        res.register_advancement()
-        self.advance()
-        arg_name_toks = []
-
-        if self.current_tok.type == TT_IDENTIFIER:
-            arg_name_toks.append(self.current_tok)
-            res.register_advancement()
-            self.advance()
-
-            while self.current_tok.type == TT_COMMA:
-                res.register_advancement()
-                self.advance()
-
-                if self.current_tok.type != TT_IDENTIFIER:
-                    return res.failure(InvalidSyntaxError(
-                        self.current_tok.pos_start, self.current_tok.pos_end,
-                        "Expected identifier"
-                    ))
-
-                arg_name_toks.append(self.current_tok)
-                res.register_advancement()
-                self.advance()
-
-            if self.current_tok.type != TT_RPAREN:
-                return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end, f"Expected ',' or ')'"
-                ))
-            
-        else:
-            if self.current_tok.type != TT_RPAREN:
-                return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end, f"Expected identifier or ')'"
-                ))
-            
-        res.register_advancement()
-        self.advance()
-
-        if self.current_tok.type == TT_ARROW:
-            res.register_advancement()
-            self.advance()
-            node_to_return = res.register(self.expr())
-            if res.error: return res
-
-            return res.success(FuncDefNode(
-                var_name_tok,
-                arg_name_toks,
-                node_to_return
-            ))
-            
-        if self.current_tok.type != TT_TWODOT:
-            return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end, f"Expected ':'"
-                ))
-        
-        res.register_advancement()
-        self.advance()
-        
-        # Передача на багаторядковий варіант
-        if self.current_tok.type == TT_NEWLINE:
-            res.register_advancement()
-            self.advance()
-            
-            # Парсимо тіло функції як блок операторів
-            body = res.register(self.statements())
-            if res.error: return res
-            
-            # Перевіряємо наявність закриваючої дужки
-            if self.current_tok.type != TT_RBRACET:
-                return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end,
-                    "Expected '}'"
-                ))
-            
-            res.register_advancement()
-            self.advance()
-            
-            # Повертаємо вузол функції
-            return res.success(FuncDefNode(
-                var_name_tok,
-                arg_name_toks,
-                body
-            ))
-        else:
-            # Однорядковий варіант
-            body = res.register(self.expr())
-            if res.error: return res
-            
-            if self.current_tok.type != TT_RBRACET:
-                return res.failure(InvalidSyntaxError(
-                    self.current_tok.pos_start, self.current_tok.pos_end,
-                    "Expected '}'"
-                ))
-            
-            res.register_advancement()
-            self.advance()
-            
-            return res.success(FuncDefNode(
-                var_name_tok,
-                arg_name_toks,
-                body
-            ))
-            
-        
-
-    def bin_op(self, func_a, ops, func_b=None):
-        if func_b == None:
-            func_b = func_a
-        
-        res = ParseResult()
-        left = res.register(func_a())
-        if res.error: return res
-
-        while self.current_tok.type in ops or (self.current_tok.type, self.current_tok.value) in ops:
-            op_tok = self.current_tok
-            res.register_advancement()
-            self.advance()
-            right = res.register(func_b())
-            if res.error: return res
-            left = BinOpNode(left, op_tok, right)
-
-        return res.success(left)
-
-    def while_expr(self):
-        res = ParseResult()
-
-        if not self.current_tok.matches(TT_KEYWORD, 'while'):
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                f"Expected 'while'"
-            ))
-
-        res.register_advancement()
-        self.advance()
-
-        condition = res.register(self.expr())
-        if res.error: return res
-
-        if not self.current_tok.type == TT_LBRACET:
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                f"Expected '{{'"
-            ))
-
-        res.register_advancement()
-        self.advance()
-
-        body = res.register(self.statements())
-        if res.error: return res
-
-        if not self.current_tok.type == TT_RBRACET:
-            return res.failure(InvalidSyntaxError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                f"Expected '}}'"
-            ))
-
-        res.register_advancement()
-        self.advance()  
-        return res.success(whileNode(condition, body))
-    
-    
-
-#######################################
-# RUNTIME RESULT
-#######################################
-
-class RTResult:
-    def __init__(self):
-        self.reset()
-        
-    def reset(self):
-        self.value = None
-        self.error = None
-        self.func_return_value = None
-        self.loop_should_continue = False
-        self.loop_should_break = False
-
-    def register(self, res):
-        if res is None:
-            return None
-        if isinstance(res, RTResult):
-            if res.error: 
-                self.error = res.error
-            self.func_return_value = res.func_return_value
-            self.loop_should_continue = res.loop_should_continue
-            self.loop_should_break = res.loop_should_break
-            return res.value
-        return res
-
-
-    def success(self, value):
-        self.reset()
-        self.value = value
-        return self
-    
-    def success_continue(self):
-        self.reset()
-        self.loop_should_continue = True
-        return self
-
-    def success_break(self):
-        self.reset()
-        self.loop_should_break = True
-        return self
-
-    def failure(self, error):
-        self.reset()
-        self.error = error
-        return self
-    
-    def should_return(self):
-        return (
-            self.error or
-            self.func_return_value or
-            self.loop_should_continue or
-            self.loop_should_break
-        )
-
-#######################################
-# VALUES
-#######################################
-
-class Value:
-    def __init__(self):
-        self.set_pos()
-        self.set_context()
-
-    def set_pos(self, pos_start=None, pos_end=None):
-        self.pos_start = pos_start
-        self.pos_end = pos_end
-        return self
-
-    def set_context(self, context=None):
-        self.context = context
-        return self
-
-    def added_to(self, other):
-        return None, self.illegal_operation(other)
-
-    def subbed_by(self, other):
-        return None, self.illegal_operation(other)
-
-    def multed_by(self, other):
-        return None, self.illegal_operation(other)
-
-    def dived_by(self, other):
-        return None, self.illegal_operation(other)
-
-    def powed_by(self, other):
-        return None, self.illegal_operation(other)
-
-    def get_comparison_eq(self, other):
-        return None, self.illegal_operation(other)
-
-    def get_comparison_ne(self, other):
-        return None, self.illegal_operation(other)
-
-    def get_comparison_lt(self, other):
-        return None, self.illegal_operation(other)
-
-    def get_comparison_gt(self, other):
-        return None, self.illegal_operation(other)
-
-    def get_comparison_lte(self, other):
-        return None, self.illegal_operation(other)
-
-    def get_comparison_gte(self, other):
-        return None, self.illegal_operation(other)
-
-    def anded_by(self, other):
-        return None, self.illegal_operation(other)
-
-    def ored_by(self, other):
-        return None, self.illegal_operation(other)
-
-    def notted(self):
-        return None, self.illegal_operation(other)
-
-    def execute(self, args):
-        return RTResult().failure(self.illegal_operation())
-
-    def copy(self):
-        raise Exception('No copy method defined')
-
-    def is_true(self):
-        return False
-
-    def illegal_operation(self, other=None):
-        if not other:
-            other = self
-        return RTError(
-            self.pos_start, other.pos_end,
-            'Illegal operation',
-            self.context
-        )
-
-class Number(Value):
-    def __init__(self, value):
-        super().__init__()
-        self.value = value
-
-    def added_to(self, other):
-        if isinstance(other, Number):
-            return Number(self.value + other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def subbed_by(self, other):
-        if isinstance(other, Number):
-            return Number(self.value - other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def multed_by(self, other):
-        if isinstance(other, Number):
-            return Number(self.value * other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def dived_by(self, other):
-        if isinstance(other, Number):
-            if other.value == 0:
-                return None, RTError(
-                    other.pos_start, other.pos_end,
-                    'Division by zero',
-                    self.context
-                )
-
-            return Number(self.value / other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def powed_by(self, other):
-        if isinstance(other, Number):
-            return Number(self.value ** other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def get_comparison_eq(self, other):
-        if isinstance(other, Number):
-            return Boolean(self.value == other.value).set_context(self.context), None
-        elif isinstance(other, Boolean):
-            return Boolean((1 if self.value else 0) == other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def get_comparison_ne(self, other):
-        if isinstance(other, Number):
-            return Boolean(self.value != other.value).set_context(self.context), None
-        elif isinstance(other, Boolean):
-            return Boolean((1 if self.value else 0) != other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def get_comparison_lt(self, other):
-        if isinstance(other, Number):
-            return Boolean(self.value < other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def get_comparison_gt(self, other):
-        if isinstance(other, Number):
-            return Boolean(self.value > other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def get_comparison_lte(self, other):
-        if isinstance(other, Number):
-            return Boolean(self.value <= other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def get_comparison_gte(self, other):
-        if isinstance(other, Number):
-            return Boolean(self.value >= other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def anded_by(self, other):
-        if isinstance(other, Number):
-            return Boolean(self.value != 0 and other.value != 0).set_context(self.context), None
-        elif isinstance(other, Boolean):
-            return Boolean(self.value != 0 and other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def ored_by(self, other):
-        if isinstance(other, Number):
-            return Boolean(self.value != 0 or other.value != 0).set_context(self.context), None
-        elif isinstance(other, Boolean):
-            return Boolean(self.value != 0 or other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def notted(self):
-        return Boolean(self.value == 0).set_context(self.context), None
-
-    
-    def __lt__(self, other):
-        if isinstance(other, Number):
-            return self.value < other.value
-        return NotImplemented
-    
-    def __eq__(self, other):
-        if isinstance(other, Number):
-            return self.value == other.value
-        return False
-
-
-    def copy(self):
-        copy = Number(self.value)
-        copy.set_pos(self.pos_start, self.pos_end)
-        copy.set_context(self.context)
-        return copy
-    
-    def __eq__(self, other):
-        if isinstance(other, Number):
-            return self.value == other.value
-        return False
-
-    def is_true(self):
-        return self.value != 0
-    
-    def is_float(self):
-        return isinstance(self.value, float)
-    
-    def __repr__(self):
-        return str(self.value)
-
-Number.null = Number(0)
-Number.true = Number(1)
-Number.false = Number(0)
-Number.PI = Number(math.pi)
-Number.E = Number(math.e)
-     
-class String(Value):
-    def __init__(self, value):
-        super().__init__()
-        self.value = value
-
-    def added_to(self, other):
-        if isinstance(other, String):
-            return String(self.value + other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-        
-    def multed_by(self, other):
-        if isinstance(other, Number):
-            return String(self.value * other.value).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-        
-    def get_comparison_eq(self, other):
-        if isinstance(other, String):
-            return Number(1 if self.value == other.value else 0).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-
-    def get_comparison_ne(self, other):
-        if isinstance(other, String):
-            return Number(1 if self.value != other.value else 0).set_context(self.context), None
-        else:
-            return None, Value.illegal_operation(self, other)
-        
-    def is_true(self):
-        return len(self.value) > 0
-    
-    def __eq__(self, other):
-        if isinstance(other, String):
-            return self.value == other.value
-        return False
-    
-    def copy(self):
-        copy = String(self.value)
-        copy.set_pos(self.pos_start, self.pos_end)
-        copy.set_context(self.context)
-        return copy
-    
-    def __str__(self):
-        return self.value
-
-    def __repr__(self):
-        return f'"{self.value}"'
-    
-    
-class Boolean(Value):
-    def __init__(self, value):
-        super().__init__()
-        self.value = 1 if value else 0
-        
-    def added_to(self, other):
-        return None, Value.illegal_operation(self, other)
-
-    def subbed_by(self, other):
-        return None, Value.illegal_operation(self, other)
-
-    def multed_by(self, other):
-        return None, Value.illegal_operation(self, other)
-
-    def dived_by(self, other):
-        return None, Value.illegal_operation(self, other)
-    
-    def powed_by(self, other):
-        return None, Value.illegal_operation(self, other)
-
-    def get_comparison_eq(self, other):
-        if isinstance(other, Boolean):
-            return Boolean(self.value == other.value).set_context(self.context), None
-        elif isinstance(other, Number):
-            return Boolean(self.value == (1 if other.value else 0)).set_context(self.context), None
-        return None, Value.illegal_operation(self, other)
-    
-    def get_comparison_ne(self, other):
-        if isinstance(other, Boolean):
-            return Boolean(self.value != other.value).set_context(self.context), None
-        elif isinstance(other, Number):
-            return Boolean(self.value != (1 if other.value else 0)).set_context(self.context), None
-        return None, Value.illegal_operation(self, other)
-
-    def anded_by(self, other):
-        if isinstance(other, Boolean):
-            return Boolean(self.value and other.value).set_context(self.context), None
-        elif isinstance(other, Number):
-            return Boolean(self.value and other.value != 0).set_context(self.context), None
-        return None, Value.illegal_operation(self, other)
-
-    def ored_by(self, other):
-        if isinstance(other, Boolean):
-            return Boolean(self.value or other.value).set_context(self.context), None
-        elif isinstance(other, Number):
-            return Boolean(self.value or other.value != 0).set_context(self.context), None
-        return None, Value.illegal_operation(self, other)
-
-    def notted(self):
-        return Boolean(not self.value).set_context(self.context), None
-
-    def copy(self):
-        copy = Boolean(self.value)
-        copy.set_pos(self.pos_start, self.pos_end)
-        copy.set_context(self.context)
-        return copy
-
-    def is_true(self):
-        return self.value == 1
-
-    def __repr__(self):
-        return "true" if self.value else "false"
-    
-Boolean.true = Boolean(True)
-Boolean.false = Boolean(False)
-    
-class BaseFunction(Value):
-    
-    def __init__(self, name):
-        super().__init__()
-        self.name = name or "<lambda>"
-        
-    def generate_new_context(self):
-        new_context = Context(self.name, self.context, self.pos_start)
-        new_context.symbol_table = SymbolTable(new_context.parent.symbol_table)
-        return new_context
-    
-    def check_args(self, arg_names, args):
-        res = RTResult()
-        if len(args) > len(arg_names):
-            return res.failure(RTError(
-                self.pos_start, self.pos_end,
-                f"{len(args) - len(arg_names)} too many args passed into '{self.name}'",
-                self.context
-            ))
-
-        if len(args) < len(arg_names):
-            return res.failure(RTError(
-                self.pos_start, self.pos_end,
-                f"{len(arg_names) - len(args)} too few args passed into '{self.name}'",
-                self.context
-            ))
-        return res.success(None)
-    
-    def populate_args(self, arg_names, args, exec_ctx):
-        for i in range(len(args)):
-            arg_name = arg_names[i]
-            arg_value = args[i]
-            arg_value.set_context(exec_ctx)
-            exec_ctx.symbol_table.set(arg_name, arg_value)
-            
-    def check_and_populate_args(self, arg_names, args, exec_ctx):
-        res = RTResult()
-        res.register(self.check_args(arg_names, args))
-        if res.error: return res
-        self.populate_args(arg_names, args, exec_ctx)
-        return res.success(None)
-
-class Function(BaseFunction):
-    def __init__(self, name, body_node, arg_names):
-        super().__init__(name)
-        self.body_node = body_node
-        self.arg_names = arg_names
-
-    def execute(self, args):
-        res = RTResult()
-        interpreter = Interpreter()
-        exec_ctx = self.generate_new_context()
-
-        res.register(self.check_and_populate_args(self.arg_names, args, exec_ctx))
-        if res.error: return res
-
-        value = res.register(interpreter.visit(self.body_node, exec_ctx))
-        if res.error: return res
-        return res.success(value)
-
-    def copy(self):
-        copy = Function(self.name, self.body_node, self.arg_names)
-        copy.set_context(self.context)
-        copy.set_pos(self.pos_start, self.pos_end)
-        return copy
-
-    def __repr__(self):
-        return f"<function {self.name}>"
-    
-class List(Value):
-    def __init__(self, elements):
-        super().__init__()
-        self.elements = elements
-        
-    def __len__(self):
-        return len(self.elements)
-    
-    def __sum__(self):
-        return sum(self.elements)
-    
-    def __reversed__(self):
-        return reversed(self.elements)
-        
-    def added_to(self, other):
-        new_list = self.copy()
-        new_list.elements.append(other)
-        return new_list, None
-    
-    def __sort__(self):
-        return sorted(self.elements)
-    
-    def subbed_by(self, other):
-        if isinstance(other, Number):
-            new_list = self.copy()
-            try:
-                new_list.elements.pop(other.value)
-                return new_list, None
-            except:
-                return None, RTError(
-                    other.pos_start, other.pos_end,
-                    'Element in this index cannot be removed from list because index is out of range',
-                    self.context
-                )
-        else:
-            return None, Value.illegal_operation(self, other)
-    
-    def multed_by(self, other):
-        if isinstance(other, List):
-            new_list = self.copy()
-            new_list.elements.extend(other.elements)
-            return new_list, None
-        else:
-            return None, Value.illegal_operation(self, other)
-        
-    def dived_by(self, other):
-        if isinstance(other, Number):
-            try:
-                return self.elements[other.value], None
-            except:
-                return None, RTError(
-                    other.pos_start, other.pos_end,
-                    'Element in this index cannot be got from list because index is out of range',
-                    self.context
-                )
-        else:
-            return None, Value.illegal_operation(self, other)
-        
-    def __str__(self):
-        return f'[{", ".join([str(x) for x in self.elements])}]'
-    
-    def __repr__(self):
-        return f'{", ".join([str(x) for x in self.elements])}'
-
-    def copy(self):
-        copy = List(self.elements)
-        copy.set_pos(self.pos_start, self.pos_end)
-        copy.set_context(self.context)
-        return copy
-    
-class BuiltInFunction(BaseFunction):
-    def __init__(self, name):
-        super().__init__(name)
-        
-    def execute(self, args):
-        res = RTResult()
-        exec_ctx = self.generate_new_context()
-        
-        method_name = f'execute_{self.name}'
-        method = getattr(self, method_name, self.no_visit_method)
-        
-        res.register(self.check_and_populate_args(method.arg_names, args, exec_ctx))
-        if res.error: return res
-        
-        return_value = res.register(method(exec_ctx))
-        if res.error: return res
-        return res.success(return_value)
-    
-    def no_visit_method(self, node, context):
-        raise Exception(f'No execute_{self.name} method defined')
-    
-    def copy(self):
-        copy = BuiltInFunction(self.name)
-        copy.set_context(self.context)
-        copy.set_pos(self.pos_start,self.pos_end)
-        return copy
-    
-    def __repr__(self):
-        return f'<built-in function {self.name}>'
-    
-    ##############################################################
-    
-    def execute_write(self, exec_ctx):
-        print(str(exec_ctx.symbol_table.get('value')))
-        return RTResult().success(Number.null)
-    execute_write.arg_names = ['value']  
-    
-    def execute_return_(self, exec_ctx):
-        return RTResult().success(exec_ctx.symbol_table.get('value'))
-    execute_return_.arg_names = ['value'] 
-    
-    def execute_tostr(self, exec_ctx):
-        return RTResult().success(String(str(exec_ctx.symbol_table.get('value'))))
-    execute_tostr.arg_names = ['value']  
-    
-    def execute_input(self, exec_ctx):
-        text = input()
-        return RTResult().success(String(text))
-    execute_input.arg_names = []  
-    
-    def execute_inputn(self, exec_ctx):
-        while True:
-            text = input()
-            try:
-                number = int(text)
-                break
-            except ValueError:
-                print(f"'{text}' must be integer. Try again!")
-        return RTResult().success(Number(number))
-    execute_inputn.arg_names = [] 
-    
-    def execute_is_num(self, exec_ctx):
-        is_num = isinstance(exec_ctx.symbol_table.get("value"), Number)
-        return RTResult().success(Boolean(is_num))
-    execute_is_num.arg_names = ['value']
-
-    def execute_is_str(self, exec_ctx):
-        is_str = isinstance(exec_ctx.symbol_table.get("value"), String)
-        return RTResult().success(Boolean(is_str))
-    execute_is_str.arg_names = ['value']
-
-    def execute_is_array(self, exec_ctx):
-        is_array = isinstance(exec_ctx.symbol_table.get("value"), List)
-        return RTResult().success(Boolean(is_array))
-    execute_is_array.arg_names = ['value']
-    
-    def execute_append(self, exec_ctx):
-        list_ = exec_ctx.symbol_table.get("list")
-        value = exec_ctx.symbol_table.get("value")
-        
-        if not isinstance(list_ , List):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Firts argument must be a list",
-                exec_ctx
-            ))
-            
-        list_.elements.append(value)
-        return RTResult().success(Number.null)
-    execute_append.arg_names = ['list', 'value']
-    
-    def execute_pop(self, exec_ctx):
-        list_ = exec_ctx.symbol_table.get("list")
-        index = exec_ctx.symbol_table.get("index")
-        
-        if not isinstance(list_ , List):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Firts argument must be a list",
-                exec_ctx
-            ))
-            
-        if not isinstance(index , Number):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Second argument must be a number",
-                exec_ctx
-            ))    
-            
-        try:
-            element = list_.elements.pop(index.value)
-        except:
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Element with this index could not be removed because index out of range!",
-                exec_ctx
-            ))
-        return RTResult().success(element)
-    execute_pop.arg_names = ['list', 'index']
-    
-    def execute_collect(self, exec_ctx):
-        listA = exec_ctx.symbol_table.get("listA")
-        listB = exec_ctx.symbol_table.get("listB")
-        
-        if not isinstance(listA , List):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Firts argument must be a list",
-                exec_ctx
-            ))
-            
-        if not isinstance(listB , List):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Second argument must be a list",
-                exec_ctx
-            ))
-            
-        listA.elements.extend(listB.elements)
-        return RTResult().success(Number.null)    
-    execute_collect.arg_names = ["listA", "listB"]    
-    
-    def execute_unite(self, exec_ctx):
-        listA = exec_ctx.symbol_table.get("listA")
-        listB = exec_ctx.symbol_table.get("listB")
-        
-        if not isinstance(listA , List):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Firts argument must be a list",
-                exec_ctx
-            ))
-            
-        if not isinstance(listB , List):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Second argument must be a list",
-                exec_ctx
-            ))
-            
-        listC = List(listA.elements + listB.elements)
-        return RTResult().success(listC)    
-    execute_unite.arg_names = ["listA", "listB"] 
-    
-    def execute_exit(self, exec_ctx):
-        index = exec_ctx.symbol_table.get('index')
-        if isinstance(index, Number):
-            if index.value == 1:
-                sys.exit(1)
-            if index.value == 0:
-                pass
-            else:
-                return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "This function accepts only 1 or 0!",
-                exec_ctx
-            ))
-        else:
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Index is not number",
-                exec_ctx
-            ))
-        return RTResult().success(None)    
-    execute_exit.arg_names = ['index']
-    
-    def execute_len(self, exec_ctx):
-        list_ = exec_ctx.symbol_table.get("list_")
-        
-        if not isinstance(list_ , List):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Argument must be a list",
-                exec_ctx
-            ))
-            
-        return RTResult().success(Number(len(list_)))
-            
-    execute_len.arg_names = ['list_']
-    
-    def execute_sqrt(self, exec_ctx):
-        num = exec_ctx.symbol_table.get("num")
-        
-        if not isinstance(num , Number):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Argument must be a num",
-                exec_ctx
-            ))
-            
-        return RTResult().success(Number(math.sqrt(num.value)))
-            
-    execute_sqrt.arg_names = ['num']
-    
-    def execute_abs(self, exec_ctx):
-        num = exec_ctx.symbol_table.get("num")
-        
-        if not isinstance(num , Number):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Argument must be a num",
-                exec_ctx
-            ))
-            
-        return RTResult().success(Number(abs(num.value)))
-            
-    execute_abs.arg_names = ['num']
-    
-    def execute_round(self, exec_ctx):
-        num = exec_ctx.symbol_table.get("num")
-        
-        if not isinstance(num , Number):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Argument must be a num",
-                exec_ctx
-            ))
-            
-        return RTResult().success(Number(round(num.value)))
-            
-    execute_round.arg_names = ['num']
-    
-
-    
-    def execute_root(self, exec_ctx):
-        num1 = exec_ctx.symbol_table.get("num1")
-        num2 = exec_ctx.symbol_table.get("num2")
-        
-        if not isinstance(num1 , Number):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "First argument must be a num",
-                exec_ctx
-            ))
-            
-        if not isinstance(num2 , Number):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Second argument must be a num",
-                exec_ctx
-            ))
-            
-        return RTResult().success(Number(math.pow(num1.value, 1 / num2.value)))
-            
-    execute_root.arg_names = ['num1', 'num2']
-    
-    def execute_reverse(self, exec_ctx):
-        list_ = exec_ctx.symbol_table.get("list_")
-        
-        if not isinstance(list_ , List):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Argument must be a list",
-                exec_ctx
-            ))
-        rev_el = list(reversed(list_.elements))
-        return RTResult().success(List(rev_el).set_context(exec_ctx).set_pos(self.pos_start, self.pos_end))
-            
-    execute_reverse.arg_names = ['list_']
-    
-    def execute_sum(self, exec_ctx):
-        list_ = exec_ctx.symbol_table.get("list_")
-        
-        if not isinstance(list_ , List):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Argument must be a list",
-                exec_ctx
-            ))
-        
-        total = Number(0)
-        for element in list_.elements:
-            if not isinstance(element, Number):
-                return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "All elements must be numbers",
-                exec_ctx
-            ))
-            total, _ = total.added_to(element)
-    
-        return RTResult().success(total)
-            
-    execute_sum.arg_names = ['list_']
-    
-    def execute_type(self, exec_ctx):
-        value = exec_ctx.symbol_table.get("value")
-        value_ = "undefined"
-        if isinstance(value, Number):
-            if value.is_float():
-                value_ = "float"
-            else:
-                value_ = "int"
-        elif isinstance(value, String):
-            value_ = "string"
-        elif isinstance(value, Boolean):
-            value_ = "bool"
-        elif isinstance(value, List):
-            value_ = "array"
-        elif isinstance(value, Function):
-            value_ = "function"
-        else:
-            value_ = "undefined"
-        
-        return RTResult().success(String(value_).set_context(exec_ctx).set_pos(self.pos_start, self.pos_end))
-    execute_type.arg_names = ['value']
-    
-    def execute_sort(self, exec_ctx):
-        list_ = exec_ctx.symbol_table.get("list_")
-        
-        if not isinstance(list_ , List):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Argument must be a list",
-                exec_ctx
-            ))
-        sort_el = list(sorted(list_.elements))
-        return RTResult().success(List(sort_el).set_context(exec_ctx).set_pos(self.pos_start, self.pos_end))
-            
-    execute_sort.arg_names = ['list_']
-    
-    def execute_sleep(self, exec_ctx):
-        sec = exec_ctx.symbol_table.get("sec")
-        
-        if not isinstance(sec , Number):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Argument must be number (sleep works with seconds)",
-                exec_ctx
-            ))
-        time.sleep(sec.value)
-        return RTResult().success(Number.null)
-    execute_sleep.arg_names = ['sec']
-    
-    def execute_random(self, exec_ctx):
-        return RTResult().success(Number(random.random()))
-    execute_random.arg_names = []
-    
-    def execute_now(self, exec_ctx):
-        current_time = time.localtime()
-        formatted_time = time.strftime("%Y-%m-%d %H:%M:%S", current_time)
-        return RTResult().success(String(formatted_time))
-    execute_now.arg_names = []
-    
-    def execute_id(self, exec_ctx):
-        value = exec_ctx.symbol_table.get("value")
-        
-        if value is None:
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Argument 'value' is missing",
-                exec_ctx
-            ))
-        
-        if isinstance(value, (Number, String, List, Boolean, Function, BaseFunction)):
-            return RTResult().success(String(str(id(value))))
-        else:
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                f"Cannot get id of type {type(value).__name__}",
-                exec_ctx
-            ))
-            
-        return RTResult().success(String(str(id(value))))
-    execute_id.arg_names = ['value']
-    
-    def execute_random_num(self, exec_ctx):
-        a = exec_ctx.symbol_table.get("a")
-        b = exec_ctx.symbol_table.get("b")
-        
-        if not isinstance(a , Number):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "First argument must be a num",
-                exec_ctx
-            ))
-            
-        if not isinstance(b , Number):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Second argument must be a num",
-                exec_ctx
-            ))
-        return RTResult().success(Number(random.randint(int(a.value), int(b.value))))
-    execute_random_num.arg_names = ['a', 'b']
-    
-    def execute_split(self, exec_ctx):
-        string = exec_ctx.symbol_table.get("string")
-        sep = exec_ctx.symbol_table.get("sep")
-        
-        if not isinstance(string, String):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "First argument must be a string",
-                exec_ctx
-            ))
-            
-        if not isinstance(sep, String):
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Second argument must be a string",
-                exec_ctx
-            ))
-            
-        return RTResult().success(List([String(x) for x in string.value.split(sep.value)]))
-    execute_split.arg_names = ['string', 'sep']
-    
-    def execute_swap(self, exec_ctx):
-        value1 = exec_ctx.symbol_table.get("value1")
-        value2 = exec_ctx.symbol_table.get("value2")
-        
-        if value1 is None:
-                return RTResult().failure(RTError(
-                    self.pos_start, self.pos_end,
-                    "Argument 'value' is missing",
-                    exec_ctx
-                ))
-                
-        if value2 is None:
-                return RTResult().failure(RTError(
-                    self.pos_start, self.pos_end,
-                    "Argument 'value' is missing",
-                    exec_ctx
-                ))
-            
-        var_name1 = exec_ctx.symbol_table.get_variable_name(value1)
-        var_name2 = exec_ctx.symbol_table.get_variable_name(value2)
-        exec_ctx.symbol_table.set(var_name1, value2)
-        exec_ctx.symbol_table.set(var_name2, value1)
-
-        return RTResult().success(Number.null)
-
-    execute_swap.arg_names = ['value1', 'value2']
-    
-    
-    def execute_comp(self, exec_ctx):
-        value1 = exec_ctx.symbol_table.get("value1")
-        value2 = exec_ctx.symbol_table.get("value2")
-        
-        if value1 is None:
-                return RTResult().failure(RTError(
-                    self.pos_start, self.pos_end,
-                    "Argument 'value' is missing",
-                    exec_ctx
-                ))
-                
-        if value2 is None:
-                return RTResult().failure(RTError(
-                    self.pos_start, self.pos_end,
-                    "Argument 'value' is missing",
-                    exec_ctx
-                ))
-        
-        if value1 == value2:
-            return RTResult().success(Boolean(True))
-        else:
-            return RTResult().success(Boolean(False))
-        
-    execute_comp.arg_names = ['value1', 'value2']
-    
-    def execute_gc_clean(self, exec_ctx):
-        gc.collect()
-        return RTResult().success(Number.null)
-    execute_gc_clean.arg_names = []
-    
-    def execute_gc_count(self, exec_ctx):
-        return RTResult().success(Number(gc.collect()))
-    execute_gc_count.arg_names = []
-    
-    def execute_del_(self, exec_ctx):
-        value = exec_ctx.symbol_table.get('value')
-    
-        if isinstance(value, String) or isinstance(value, Number):
-            var_name = exec_ctx.symbol_table.get_variable_name(value)
-        else:
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Argument must be a variable",
-                exec_ctx
-            ))
-        
-        if var_name is None:
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                "Could not determine variable name",
-                exec_ctx
-            ))
-        
-        if exec_ctx.symbol_table.remove(var_name):
-            return RTResult().success(String(f"deleted {var_name}"))
-        else:
-            return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
-                f"Variable '{var_name}' not found",
-                exec_ctx
-            ))
-
-    execute_del_.arg_names = ['value']
-    
-    def execute_os_name(self, exec_ctx):
-        return RTResult().success(String(os.name))
-    execute_os_name.arg_names = []
-    
-    def execute_memory(self, exec_ctx):
-        memory_state = exec_ctx.symbol_table.get_memory_state()
-        result = "Current memory state:\n"
-        for var_name, value in memory_state.items():
-            result += f"{var_name}: {value}\n"
-        return RTResult().success(String(result))
-
-    execute_memory.arg_names = []
-            
-    
-BuiltInFunction.write       = BuiltInFunction("write")
-BuiltInFunction.return_     = BuiltInFunction("return_")
-BuiltInFunction.tostr       = BuiltInFunction("tostr")
-BuiltInFunction.input       = BuiltInFunction("input")
-BuiltInFunction.inputn      = BuiltInFunction("inputn")
-BuiltInFunction.is_num      = BuiltInFunction("is_num")
-BuiltInFunction.is_str      = BuiltInFunction("is_str")
-BuiltInFunction.is_array    = BuiltInFunction("is_array")
-BuiltInFunction.append      = BuiltInFunction("append")
-BuiltInFunction.pop         = BuiltInFunction("pop")
-BuiltInFunction.collect     = BuiltInFunction("collect")
-BuiltInFunction.unite       = BuiltInFunction("unite")
-BuiltInFunction.exit        = BuiltInFunction("exit")
-BuiltInFunction.len         = BuiltInFunction("len")
-BuiltInFunction.sqrt        = BuiltInFunction("sqrt")
-BuiltInFunction.reverse     = BuiltInFunction("reverse")
-BuiltInFunction.root        = BuiltInFunction("root")
-BuiltInFunction.abs         = BuiltInFunction("abs")
-BuiltInFunction.round       = BuiltInFunction("round")
-BuiltInFunction.sum         = BuiltInFunction("sum")
-BuiltInFunction.type        = BuiltInFunction("type")
-BuiltInFunction.sort        = BuiltInFunction("sort")
-BuiltInFunction.random      = BuiltInFunction("random")
-BuiltInFunction.sleep       = BuiltInFunction("sleep")
-BuiltInFunction.random_num  = BuiltInFunction("random_num")
-BuiltInFunction.now         = BuiltInFunction("now")
-BuiltInFunction.id          = BuiltInFunction("id")
-BuiltInFunction.split       = BuiltInFunction("split")
-BuiltInFunction.swap        = BuiltInFunction("swap")
-BuiltInFunction.comp        = BuiltInFunction("comp")
-BuiltInFunction.gc_clean    = BuiltInFunction("gc_clean")
-BuiltInFunction.gc_count    = BuiltInFunction("gc_count")
-BuiltInFunction.del_        = BuiltInFunction("del_")
-BuiltInFunction.os_name     = BuiltInFunction("os_name")
-BuiltInFunction.memory      = BuiltInFunction("memory")
-
-    
-#######################################
-# CONTEXT
-#######################################
-
-class Context:
-    def __init__(self, display_name, parent=None, parent_entry_pos=None):
-        self.display_name = display_name
-        self.parent = parent
-        self.parent_entry_pos = parent_entry_pos
-        self.symbol_table = None
-
-#######################################
-# SYMBOL TABLE
-#######################################
-
-class SymbolTable:
-    def __init__(self, parent=None):
-        self.symbols = {}
-        self.constants = set()
-        self.var_types = {}
-        self.parent = parent
-
-    def get_variable_name(self, value):
-        for name, val in self.symbols.items():
-            if val == value:
-                return name
-        if self.parent:
-            return self.parent.get_variable_name(value)
-        return None
-
-    def get(self, name):
-        value = self.symbols.get(name, None)
-        if value == None and self.parent:
-            return self.parent.get(name)
-        return value
-
-    def set(self, name, value, var_type=None):
-        if name in self.constants:
-            return False
-        
-        parent = self.parent
-        while parent:
-            if hasattr(parent, 'const') and name in parent.constants:
-                return False
-            parent = parent.parent
-        
-        self.symbols[name] = value
-        if var_type:
-            self.var_types[name] = var_type
-        return True
-    
-    def set_constant(self, name, value, var_type=None):
-        if name in self.symbols:
-            return False
-            
-        self.symbols[name] = value
-        self.constants.add(name)
-        if var_type:
-            self.var_types[name] = var_type
-        return True
-    
-    def is_constant(self, name):
-        if name in self.constants:
-            return True
-        
-        parent = self.parent
-        while parent:
-            if hasattr(parent, 'const') and name in parent.constants:
-                return True
-            parent = parent.parent
-
-        return False
-    
-    def get_memory_state(self):
-        memory_state = {}
-        current = self
-        while current:
-            for name, value in current.symbols.items():
-                if name not in memory_state:
-                    memory_state[name] = value
-            current = current.parent
-        return memory_state
-    
-    def get_type(self, name):
-        if name in self.var_types:
-            return self.var_types[name]
-        parent = self.parent
-        while parent:
-            if hasattr(parent, 'var_types') and name in parent.var_types:
-                return parent.var_types[name]
-            parent = parent.parent
-            
-        return None
-
-    def remove(self, name):
-        if name in self.symbols:
-            del self.symbols[name]
-            return True
-        elif self.parent:
-            return self.parent.remove(name)
-        return False
-        
-        
-#######################################
-# Import
-#######################################
-
-class ImportSystem:
-    def __init__(self):
-        self.modules = {}
-        self.stdlib_path = os.path.join(os.path.dirname(__file__), 'stdlib')
-
-    def import_module(self, module_name):
-        if module_name in self.modules:
-            return RTResult().success(self.modules[module_name])
-
-        file_path = f"{module_name}.fpp"
-        stdlib_file_path = os.path.join(self.stdlib_path, file_path)
-
-        if os.path.exists(file_path):
-            return self._load_module(module_name, file_path)
-        elif os.path.exists(stdlib_file_path):
-            return self._load_module(module_name, stdlib_file_path)
-        else:
-            return RTResult().failure(RTError(
-                Position(0, 0, 0, file_path, ""),
-                Position(0, 0, 0, file_path, ""),
-                f"Module '{module_name}' not found",
-                Context(module_name)
-            ))
-
-    def _load_module(self, module_name, file_path):
-        try:
-            with open(file_path, 'r') as file:
-                module_code = file.read()
-
-            lexer = Lexer(file_path, module_code)
-            tokens, error = lexer.make_tokens()
-            if error: return RTResult().failure(error)
-
-            parser = Parser(tokens)
-            ast = parser.parse()
-            if ast.error: return RTResult().failure(ast.error)
-
-            context = Context(module_name)
-            context.symbol_table = SymbolTable()
-            interpreter = Interpreter()
-            result = interpreter.visit(ast.node, context)
-            if result.error: return result
-
-            module = Module(module_name, context.symbol_table)
-            self.modules[module_name] = module
-            return RTResult().success(module)
-        except Exception as e:
-            return RTResult().failure(RTError(
-                Position(0, 0, 0, file_path, module_code),
-                Position(0, 0, 0, file_path, module_code),
-                f"Failed to import module '{module_name}': {str(e)}",
-                Context(module_name)
-            ))
-            
-    def _load_py_module(self, module_name, file_path):
-        try:
-            spec = importlib.util.spec_from_file_location(module_name, file_path)
-            py_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(py_module)
-
-            symbol_table = SymbolTable()
-            for name, value in py_module.__dict__.items():
-                if callable(value) and not name.startswith('_'):
-                    symbol_table.set(name, BuiltInFunction(name))
-
-            module = Module(module_name, symbol_table)
-            self.modules[module_name] = module
-            return RTResult().success(module)
-        except Exception as e:
-            return RTResult().failure(RTError(
-                Position(0, 0, 0, file_path, ""),
-                Position(0, 0, 0, file_path, ""),
-                f"Failed to import Python module '{module_name}': {str(e)}",
-                Context(module_name)
-            ))
-
-global_import_system = ImportSystem()
-
-class Module:
-    def __init__(self, name, symbol_table):
-        self.name = name
-        self.symbol_table = symbol_table
-
-    def get_function(self, name):
-        return self.symbol_table.get(name)
-
-#######################################
-# INTERPRETER
-#######################################
-
-class Interpreter:
-    def visit(self, node, context):
-        method_name = f'visit_{type(node).__name__}'
-        method = getattr(self, method_name, self.no_visit_method)
-        return method(node, context)
-
-    def no_visit_method(self, node, context):
-        raise Exception(f'No visit_{type(node).__name__} method defined')
-
-    ###################################
-
-    def visit_NumberNode(self, node, context):
-        return RTResult().success(
-            Number(node.tok.value).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
-    
-    def visit_StringNode(self, node, context):
-        return RTResult().success(
-            String(node.tok.value).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
-        
-    def visit_ListNode(self, node, context):
-        res = RTResult()
-        elements = []
-
-        for element_node in node.elementNodes:
-            elements.append(res.register(self.visit(element_node, context)))
-            if res.error: return res
-
-        return res.success(
-            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
-
-    def visit_VarAccessNode(self, node, context):
-        res = RTResult()
-        var_name = node.var_name_tok.value
-        value = context.symbol_table.get(var_name)
-
-        if not value:
-            return res.failure(RTError(
-                node.pos_start, node.pos_end,
-                f"'{var_name}' is not defined",
-                context
-            ))
-
-        value = value.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
-        return res.success(value)
-
-    def visit_VarAssignNode(self, node, context):
-        res = RTResult()
-        var_name = node.var_name_tok.value
-        value = res.register(self.visit(node.value_node, context))
-        if res.error: return res
-
-        if node.var_type:
-            if node.var_type == 'int':
-                if not isinstance(value, Number):
-                    return res.failure(RTError(
-                        node.pos_start, node.pos_end,
-                        f"Expected integer for variable '{var_name}'",
-                        context
-                    ))
-            elif node.var_type == 'str':
-                if not isinstance(value, String):
-                    return res.failure(RTError(
-                        node.pos_start, node.pos_end,
-                        f"Expected string for variable '{var_name}'",
-                        context
-                    ))
-            elif node.var_type == 'bool':
-                if isinstance(value, Boolean):
-                    pass
-                elif not isinstance(value, Number) and value.value not in (0, 1):
-                    value = Boolean(value.value == 1)
-                else:
-                    return res.failure(RTError(
-                        node.pos_start, node.pos_end,
-                        f"Expected boolean for variable '{var_name}'",
-                        context
-                    )) 
-            elif node.var_type == 'arr':
-                if isinstance(value, List):
-                    pass
-                else:
-                   return res.failure(RTError(
-                        node.pos_start, node.pos_end,
-                        f"Expected array for variable '{var_name}'",
-                        context
-                    )) 
-                   
-            elif node.var_type == 'float':
-                if isinstance(value, Number) and value.is_float():
-                    pass
-                else:
-                   return res.failure(RTError(
-                        node.pos_start, node.pos_end,
-                        f"Expected float num for variable '{var_name}'",
-                        context
-                    ))   
-
-        if node.is_const:
-            success = context.symbol_table.set_constant(var_name, value)
-            if not success:
-                return res.failure(RTError(
-                    node.pos_start, node.pos_end,
-                    f"Cannot change value of constant '{var_name}'",
-                    context
-                ))
-        else:
-            if context.symbol_table.is_constant(var_name):
-                return res.failure(RTError(
-                    node.pos_start, node.pos_end,
-                    f"Cannot change value of constant '{var_name}'",
-                    context
-                ))
-            context.symbol_table.set(var_name, value, node.var_type)
-        return res.success(value)
-
-    def visit_BinOpNode(self, node, context):
-        res = RTResult()
-        left = res.register(self.visit(node.left_node, context))
-        if res.error: return res
-        right = res.register(self.visit(node.right_node, context))
-        if res.error: return res
-
-        if node.op_tok.type == TT_PLUS:
-            result, error = left.added_to(right)
-        elif node.op_tok.type == TT_MINUS:
-            result, error = left.subbed_by(right)
-        elif node.op_tok.type == TT_MUL:
-            result, error = left.multed_by(right)
-        elif node.op_tok.type == TT_DIV:
-            result, error = left.dived_by(right)
-        elif node.op_tok.type == TT_POW:
-            result, error = left.powed_by(right)
-        elif node.op_tok.type == TT_EE:
-            result, error = left.get_comparison_eq(right)
-        elif node.op_tok.type == TT_NE:
-            result, error = left.get_comparison_ne(right)
-        elif node.op_tok.type == TT_LT:
-            result, error = left.get_comparison_lt(right)
-        elif node.op_tok.type == TT_GT:
-            result, error = left.get_comparison_gt(right)
-        elif node.op_tok.type == TT_LTE:
-            result, error = left.get_comparison_lte(right)
-        elif node.op_tok.type == TT_GTE:
-            result, error = left.get_comparison_gte(right)
-        elif node.op_tok.matches(TT_KEYWORD, 'and'):
-            result, error = left.anded_by(right)
-        elif node.op_tok.matches(TT_KEYWORD, 'or'):
-            result, error = left.ored_by(right)
-
-        if error:
-            return res.failure(error)
-        else:
-            return res.success(result.set_pos(node.pos_start, node.pos_end))
-
-    def visit_UnaryOpNode(self, node, context):
-        res = RTResult()
-        number = res.register(self.visit(node.node, context))
-        if res.error: return res
-
-        error = None
-
-        if node.op_tok.type == TT_MINUS:
-            number, error = number.multed_by(Number(-1))
-        if node.op_tok.matches(TT_KEYWORD, 'not'):
-            number, error = number.notted()
-
-        if error:
-            return res.failure(error)
-        else:
-            return res.success(number.set_pos(node.pos_start, node.pos_end))
-        
-
-    def visit_ifNode(self, node, context):
-        res = RTResult()
-        
-        for condition, expr, is_block in node.cases:
-            condition_value = res.register(self.visit(condition, context))
-            if res.error: 
-                return res
-            if condition_value.is_true():
-                expr_value = res.register(self.visit(expr, context))
-                if res.error: 
-                    return res
-                return res.success(expr_value)
-        
-        if node.else_case:
-            else_expr, is_block = node.else_case
-            else_value = res.register(self.visit(else_expr, context))
-            if res.error: 
-                return res
-            return res.success(else_value)
-        
-        return res.success(Number(0))
-    
-    def visit_forNode(self, node, context):
-        res = RTResult()
-        elements = []
-
-        start_value = res.register(self.visit(node.start_value_node, context))
-        if res.error: return res
-
-        end_value = res.register(self.visit(node.end_value_node, context))
-        if res.error: return res
-
-        if node.step_value_node:
-            step_value = res.register(self.visit(node.step_value_node, context))
-            if res.error: return res
-        else:
-            step_value = Number(1)
-
-        i = start_value.value
-
-        if step_value.value >= 0:
-            condition = lambda: i <= end_value.value
-        else:
-            condition = lambda: i >= end_value.value
-        
-        while condition():
-            context.symbol_table.set(node.var_name_tok.value, Number(i))
-            body_result = res.register(self.visit(node.body_node, context))
-            if res.error: return res
-            
-
-            if isinstance(body_result, List) and isinstance(node.body_node, ListNode):
-                for item in body_result.elements:
-                    elements.append(item) 
-            else:
-                elements.append(body_result)
-
-            i += step_value.value
-
-
-        return res.success(
-            Number.null if node.should_return_null else
-            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
-
-    def visit_FuncDefNode(self, node, context):
-        res = RTResult()
-
-        func_name = node.var_name_tok.value if node.var_name_tok else '<lambda>'
-        body_node = node.body_node
-        arg_names = [arg_name.value for arg_name in node.arg_names_toks]
-        func_value = Function(func_name, body_node, arg_names).set_context(context).set_pos(node.pos_start, node.pos_end)
-
-        if node.var_name_tok:
-            context.symbol_table.set(func_name, func_value)
-
-        return res.success(func_value)
-
-    def visit_CallNode(self, node, context):
-        res = RTResult()
-        args = []
-
-        value_to_call = res.register(self.visit(node.node_to_call, context))
-        if res.error: return res
-        value_to_call = value_to_call.copy().set_pos(node.pos_start, node.pos_end)
-
-        for arg_node in node.arg_nodes:
-            args.append(res.register(self.visit(arg_node, context)))
-            if res.error: return res
-
-        if isinstance(value_to_call, List):
-            method_name = node.node_to_call.var_name_tok.value
-            if method_name == "add" and len(args) == 1:
-                result, error = value_to_call.added_to(args[0])
-            elif method_name == "remove" and len(args) == 1:
-                result, error = value_to_call.remove(args[0])
-            elif method_name == "with" and len(args) == 1:
-                result, error = value_to_call.with_(args[0])
-            elif method_name == "get" and len(args) == 1:
-                result, error = value_to_call.get(args[0])
-            else:
-                return res.failure(RTError(
-                    node.pos_start, node.pos_end,
-                    f"Invalid method call or arguments for list: {method_name}",
-                    context
-                ))
-
-            if error: return res.failure(error)
-            return res.success(result)
-
-        return_value = res.register(value_to_call.execute(args))
-        if res.error: return res
-        if return_value is None:
-            return_value =Number.null
-        return_value = return_value.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
-        return res.success(return_value)
-    
-    def visit_whileNode(self, node, context):
-        res = RTResult()
-        elements = []
-
-        while True:
-            condition = res.register(self.visit(node.condition_node, context))
-            if res.should_return(): return res
-            
-            if not condition.is_true():
-                break
-            
-            value = res.register(self.visit(node.body_node, context))
-            if res.should_return():
-                if res.func_return_value is None:
-                    return res
-                return res
-            
-            if res.loop_should_continue:
-                continue
-            
-            if res.loop_should_break:
-                break
-
-            elements.append(value)
-        
-        return res.success(
-            Number.null if node.should_return_null else 
-            List(elements)
-        )
-
-    def visit_BreakNode(self, node, context):
-        return RTResult().success_break()
-
-    def visit_ContinueNode(self, node, context):
-        return RTResult().success_continue()
-    
-    def visit_ImportNode(self, node, context):
-        def visit_ImportNode(self, node, context):
-            module_name = node.module_name_tok.value
-            result = global_import_system.import_module(module_name)
-            if result.error: return result
-
-            module = result.value
-            for name, value in module.symbol_table.symbols.items():
-                if isinstance(value, BuiltInFunction):
-                    value.name = f"{module_name}.{name}"
-                context.symbol_table.set(name, value)
-            return RTResult().success(Number.null)
-
-#######################################
-# RUN
-#######################################
-
-global_symbol_table = SymbolTable()
-global_symbol_table.set("null", Number(0))
-global_symbol_table.set("true", Boolean.true)
-global_symbol_table.set("false", Boolean.false)
-global_symbol_table.set("pi", Number.PI)
-global_symbol_table.set("e", Number.E)
-global_symbol_table.set("write", BuiltInFunction.write)
-global_symbol_table.set("return", BuiltInFunction.return_)
-global_symbol_table.set("tostr", BuiltInFunction.tostr)
-global_symbol_table.set("input", BuiltInFunction.input)
-global_symbol_table.set("inputn", BuiltInFunction.inputn)
-global_symbol_table.set("isnum", BuiltInFunction.is_num)
-global_symbol_table.set("isstr", BuiltInFunction.is_str)
-global_symbol_table.set("isarray", BuiltInFunction.is_array)
-global_symbol_table.set("append", BuiltInFunction.append)
-global_symbol_table.set("pop", BuiltInFunction.pop)
-global_symbol_table.set("collect", BuiltInFunction.collect)
-global_symbol_table.set("unite", BuiltInFunction.unite)
-global_symbol_table.set("exit", BuiltInFunction.exit)
-global_symbol_table.set("len", BuiltInFunction.len)
-global_symbol_table.set("sqrt", BuiltInFunction.sqrt)
-global_symbol_table.set("reverse", BuiltInFunction.reverse)
-global_symbol_table.set("root", BuiltInFunction.root)
-global_symbol_table.set("abs", BuiltInFunction.abs)
-global_symbol_table.set("round", BuiltInFunction.round)
-global_symbol_table.set("sum", BuiltInFunction.sum)
-global_symbol_table.set("type", BuiltInFunction.type)
-global_symbol_table.set("sort", BuiltInFunction.sort)
-global_symbol_table.set("random", BuiltInFunction.random)
-global_symbol_table.set("random.num", BuiltInFunction.random_num)
-global_symbol_table.set("sleep", BuiltInFunction.sleep)
-global_symbol_table.set("now", BuiltInFunction.now)
-global_symbol_table.set("id", BuiltInFunction.id)
-global_symbol_table.set("split", BuiltInFunction.split)
-global_symbol_table.set("swap", BuiltInFunction.swap)
-global_symbol_table.set("comp", BuiltInFunction.comp)
-global_symbol_table.set("gc.clean", BuiltInFunction.gc_clean)
-global_symbol_table.set("gc.count", BuiltInFunction.gc_count)
-global_symbol_table.set("del", BuiltInFunction.del_)
-global_symbol_table.set("os.name", BuiltInFunction.os_name)
-global_symbol_table.set("memory", BuiltInFunction.memory)
-
-def run(fn, text, context=None):
-    if context is None:
-        context = Context('<code>')
-        context.symbol_table = global_symbol_table
-    lexer = Lexer(fn, text)
-    tokens, error = lexer.make_tokens()
-    if error: return None, error
-    
-
-    parser = Parser(tokens)
-    ast = parser.parse()
-    if ast.error: return None, ast.error
-
-
-    interpreter = Interpreter()
-    context = Context('<code>')
-    context.symbol_table = global_symbol_table
-    result = interpreter.visit(ast.node, context)
-    gc.enable()
-    gc.collect()
-
+#######################################
+# IMPORTS
+#######################################
+
+from strings_with_arrows import *
+
+import string
+
+import math
+
+import sys
+
+import random
+
+import time
+
+import gc
+
+import os
+
+import importlib.util
+
+import itertools
+
+import array
+
+import operator
+
+import collections
+
+import heapq
+
+import bisect
+
+import pickle
+
+import hashlib
+
+import re
+
+import io
+
+try:
+    import numpy
+    numpy_array = numpy.ndarray
+except ImportError:
+    numpy = None
+    numpy_array = ()
+
+#######################################
+# CONSTANTS
+#######################################
+
+DIGITS = '0123456789'
+LETTERS = string.ascii_letters
+LETTERS_DIGITS = LETTERS + DIGITS
+
+#######################################
+# ERRORS
+#######################################
+
+class Error:
+    def __init__(self, pos_start, pos_end, error_name, details):
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+        self.error_name = error_name
+        self.details = details
+
+    def set_pos(self, pos_start, pos_end):
+        # Values do not carry positions, so errors they return are located by the caller
+        if self.pos_start is None:
+            self.pos_start = pos_start
+            self.pos_end = pos_end
+        return self
+    
+    def as_string(self):
+        result  = f'{self.error_name}: {self.details}\n'
+        result += f'File {self.pos_start.fn}, line {self.pos_start.ln + 1}'
+        result += '\n\n' + string_with_arrows(self.pos_start.ftxt, self.pos_start, self.pos_end)
+        return result
+
+class IllegalCharError(Error):
+    def __init__(self, pos_start, pos_end, details):
+        super().__init__(pos_start, pos_end, 'Illegal Character', details)
+
+class ExpectedCharError(Error):
+    def __init__(self, pos_start, pos_end, details):
+        super().__init__(pos_start, pos_end, 'Expected character' , details)
+
+class InvalidSyntaxError(Error):
+    def __init__(self, pos_start, pos_end, details=''):
+        super().__init__(pos_start, pos_end, 'Invalid Syntax', details)
+
+class RTError(Error):
+    def __init__(self, pos_start, pos_end, details, context):
+        super().__init__(pos_start, pos_end, 'Runtime Error', details)
+        self.context = context
+
+    def set_context(self, context):
+        if self.context is None:
+            self.context = context
+        return self
+
+    def as_string(self):
+        result  = self.generate_traceback()
+        result += f'{self.error_name}: {self.details}'
+        result += '\n\n' + string_with_arrows(self.pos_start.ftxt, self.pos_start, self.pos_end)
+        return result
+
+    def generate_traceback(self):
+        result = ''
+        pos = self.pos_start
+        ctx = self.context
+
+        while ctx:
+            result = f'  File {pos.fn}, line {str(pos.ln + 1)}, in {ctx.display_name}\n' + result
+            pos = ctx.parent_entry_pos
+            ctx = ctx.parent
+
+        return 'Traceback (most recent call last):\n' + result
+
+#######################################
+# POSITION
+#######################################
+
+class Position:
+    def __init__(self, idx, ln, col, fn, ftxt):
+        self.idx = idx
+        self.ln = ln
+        self.col = col
+        self.fn = fn
+        self.ftxt = ftxt
+
+    def advance(self, current_char=None):
+        self.idx += 1
+        self.col += 1
+
+        if (current_char == '\n'):
+            self.ln += 1
+            self.col = 0
+
+        return self
+
+    def copy(self):
+        return Position(self.idx, self.ln, self.col, self.fn, self.ftxt)
+
+#######################################
+# TOKENS
+#######################################
+
+TT_INT                = 'INT'
+TT_FLOAT        = 'FLOAT'
+TT_STRING			= 'STRING'
+TT_IDENTIFIER    = 'IDENTIFIER'
+TT_KEYWORD        = 'KEYWORD'
+TT_PLUS        = 'PLUS'
+TT_MINUS        = 'MINUS'
+TT_MUL        = 'MUL'
+TT_DIV        = 'DIV'
+TT_POW            = 'POW'
+TT_EQ            = 'EQ'
+TT_LPAREN        = 'LPAREN'
+TT_RPAREN        = 'RPAREN'
+TT_LBRACET       = 'LBRACET'
+TT_RBRACET       = 'RBRACET'
+TT_LSQUARE       = 'LSQUARE'
+TT_RSQUARE       = 'RSQUARE'
+TT_EE            = 'EE'
+TT_NE            = 'NE'
+TT_LT            = 'LT'
+TT_GT            = 'GT'
+TT_LTE        = 'LTE'
+TT_GTE        = 'GTE'
+TT_COMMA          = 'COMMMA'
+TT_NEWLINE          = 'NEWLINE'
+TT_ARROW          ='ARROW'
+TT_TWODOT           = 'TWODOT'
+TT_EOF            = 'EOF'
+
+KEYWORDS = [
+    'let',
+    'and',
+    'or',
+    'not',
+    'if',
+    'elif',
+    'else',
+    'for',
+    'to',
+    'step',
+    'while',
+    'func',
+    'add',
+    'remove',
+    'with',
+    'endf',
+    'const',
+    'int',
+    'str',
+    'bool',
+    'arr',
+    'float',
+    'intarr',
+    'floatarr',
+    'continue',
+    'break',
+    'use',
+    'in',
+    'yield',
+    'struct'
+]
+
+
+class Token:
+    def __init__(self, type_, value=None, pos_start=None, pos_end=None):
+        self.type = type_
+        self.value = value
+
+        if pos_start:
+            self.pos_start = pos_start.copy()
+            self.pos_end = pos_start.copy()
+            self.pos_end.advance()
+
+        if pos_end:
+            self.pos_end = pos_end.copy()
+
+    def matches(self, type_, value):
+        return self.type == type_ and self.value == value
+    
+    def __repr__(self):
+        if self.value: return f'{self.type}:{self.value}'
+        return f'{self.type}'
+
+#######################################
+# LEXER
+#######################################
+
+class Lexer:
+    def __init__(self, fn, text):
+        self.fn = fn
+        self.text = text
+        self.pos = Position(-1, 0, -1, fn, text)
+        self.current_char = None
+        self.advance()
+    
+    def advance(self):
+        self.pos.advance(self.current_char)
+        self.current_char = self.text[self.pos.idx] if self.pos.idx < len(self.text) else None
+
+    def make_tokens(self):
+        tokens = []
+
+        while self.current_char != None:
+            if self.current_char in ' \t':
+                self.advance()
+            elif self.current_char in ';\n':
+                tokens.append(Token(TT_NEWLINE, pos_start=self.pos))
+                self.advance()
+            elif self.current_char in DIGITS:
+                tokens.append(self.make_number())
+            elif self.current_char in LETTERS:
+                tokens.append(self.make_identifier())
+            elif self.current_char == '"':
+                tokens.append(self.make_string())
+            elif self.current_char == '+':
+                tokens.append(Token(TT_PLUS, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == '-':
+                tokens.append(Token(TT_MINUS, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == '*':
+                tokens.append(Token(TT_MUL, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == '/':
+                tokens.append(Token(TT_DIV, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == '^':
+                tokens.append(Token(TT_POW, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == '(':
+                tokens.append(Token(TT_LPAREN, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == ')':
+                tokens.append(Token(TT_RPAREN, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == '[':
+                tokens.append(Token(TT_LSQUARE, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == ']':
+                tokens.append(Token(TT_RSQUARE, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == ',':
+                tokens.append(Token(TT_COMMA, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == '{':
+                tokens.append(Token(TT_LBRACET, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == '}':
+                tokens.append(Token(TT_RBRACET, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == ':':
+                tokens.append(Token(TT_TWODOT, pos_start=self.pos))
+                self.advance()
+            elif self.current_char == '!':
+                token, error = self.make_not_equals()
+                if error: 
+                    return [], error
+                tokens.append(token)
+            elif self.current_char == '=':
+                tokens.append(self.make_equals_or_arrow())
+            elif self.current_char == '<':
+                tokens.append(self.make_less_than())
+                self.advance()
+            elif self.current_char == '>':
+                tokens.append(self.make_greater_than())
+                self.advance()
+            else:
+                pos_start = self.pos.copy()
+                char = self.current_char
+                self.advance()
+                return [], IllegalCharError(pos_start, self.pos, "'" + char + "'")
+
+        tokens.append(Token(TT_EOF, pos_start=self.pos))
+        return tokens, None
+
+    def make_number(self):
+        num_str = ''
+        dot_count = 0
+        pos_start = self.pos.copy()
+
+        while self.current_char != None and self.current_char in DIGITS + '.':
+            if self.current_char == '.':
+                if dot_count == 1: break
+                dot_count += 1
+            num_str += self.current_char
+            self.advance()
+
+        if dot_count == 0:
+            return Token(TT_INT, int(num_str), pos_start, self.pos)
+        else:
+            return Token(TT_FLOAT, float(num_str), pos_start, self.pos)
+
+    def make_string(self):
+        string = ''
+        pos_start = self.pos.copy()
+        escape_character = False
+        self.advance()
+
+        escape_characters = {
+            'n': '\n',
+            't': '\t'
+        }
+
+        while self.current_char != None and (self.current_char != '"' or escape_character):
+            if escape_character:
+                string += escape_characters.get(self.current_char, self.current_char)
+                escape_character = False
+            else:
+                if self.current_char == '\\':
+                    escape_character = True
+                else:
+                    string += self.current_char
+            self.advance()
+
+            escape_character = False
+		
+        self.advance()
+        return Token(TT_STRING, string, pos_start, self.pos)
+
+    def make_identifier(self):
+        id_str = ''
+        pos_start = self.pos.copy()
+
+        while self.current_char != None and self.current_char in LETTERS_DIGITS + '_' + '.':
+            id_str += self.current_char
+            self.advance()
+
+        tok_type = TT_KEYWORD if id_str.lower() in [k.lower() for k in KEYWORDS] else TT_IDENTIFIER
+        return Token(tok_type, id_str.lower(), pos_start, self.pos)
+    
+    def make_equals_or_arrow(self):
+        pos_start = self.pos.copy()
+        self.advance()
+        if self.current_char == '=':
+            self.advance()
+            return Token(TT_EE, pos_start=pos_start, pos_end=self.pos)
+        elif self.current_char == '>':
+            self.advance()
+            return Token(TT_ARROW, pos_start=pos_start, pos_end=self.pos)
+        return Token(TT_EQ, pos_start=pos_start, pos_end=self.pos)
+
+    def make_not_equals(self):
+        pos_start = self.pos.copy()
+        self.advance()
+
+        if self.current_char == '=':
+            self.advance()
+            return Token(TT_NE, pos_start=pos_start, pos_end=self.pos), None
+
+        self.advance()
+        return None, ExpectedCharError(pos_start, self.pos, "'=' (after '!')")
+
+    def make_equals(self):
+        tok_type = TT_EQ
+        pos_start = self.pos.copy()
+        self.advance()
+
+        if self.current_char == '=':
+            self.advance()
+            tok_type = TT_EE
+
+        return Token(tok_type, pos_start=pos_start, pos_end=self.pos)
+
+    def make_less_than(self):
+        tok_type = TT_LT
+        pos_start = self.pos.copy()
+        self.advance()
+
+        if self.current_char == '=':
+            self.advance()
+            tok_type = TT_LTE
+
+        return Token(tok_type, pos_start=pos_start, pos_end=self.pos)
+
+    def make_greater_than(self):
+        tok_type = TT_GT
+        pos_start = self.pos.copy()
+        self.advance()
+
+        if self.current_char == '=':
+            self.advance()
+            tok_type = TT_GTE
+
+        return Token(tok_type, pos_start=pos_start, pos_end=self.pos)
+
+#######################################
+# NODES
+#######################################
+
+class StringNode:
+    def __init__(self, tok):
+        self.tok = tok
+
+        self.pos_start = self.tok.pos_start
+        self.pos_end = self.tok.pos_end
+
+    def __repr__(self):
+        return f'{self.tok}'
+
+class NumberNode:
+    def __init__(self, tok):
+        self.tok = tok
+
+        self.pos_start = self.tok.pos_start
+        self.pos_end = self.tok.pos_end
+
+    def __repr__(self):
+        return f'{self.tok}'
+    
+class ListNode:
+    def __init__(self, elementNodes, pos_start, pos_end):
+        self.elementNodes = elementNodes
+        
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+class MapNode:
+    def __init__(self, pair_nodes, pos_start, pos_end):
+        self.pair_nodes = pair_nodes
+
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+class VarAccessNode:
+    def __init__(self, var_name_tok):
+        self.var_name_tok = var_name_tok
+        self.cache = None
+
+        self.pos_start = self.var_name_tok.pos_start
+        self.pos_end = self.var_name_tok.pos_end
+
+    def __getstate__(self):
+        # The lookup cache holds live symbol tables and a shape version
+        # that means nothing in another process
+        state = self.__dict__.copy()
+        state['cache'] = None
+        return state
+
+class FieldAccessNode(VarAccessNode):
+    # Any dotted name 'a.b.c'. When 'a' holds a Record at run time, b and c
+    # are read as fields; otherwise the whole name is looked up as a variable.
+    # offsets caches, for each field, its slot offset in every record class
+    # seen there.
+    def __init__(self, var_name_tok, record_name, fields):
+        super().__init__(var_name_tok)
+        self.record_name = record_name
+        self.fields = fields
+        self.offsets = [{} for _ in fields]
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['offsets'] = [{} for _ in self.fields]
+        return state
+
+class VarRefNode(VarAccessNode):
+    # Plain variable passed to a builtin in REFERENCE_BUILTINS; evaluates to
+    # a Reference to the variable instead of its value
+    pass
+
+class VarAssignNode:
+    def __init__(self, var_name_tok, value_node, is_const=False, var_type=None):
+        self.var_name_tok = var_name_tok
+        self.value_node = value_node
+        self.is_const = is_const
+        self.var_type = var_type
+
+        self.pos_start = self.var_name_tok.pos_start
+        self.pos_end = self.value_node.pos_end
+
+class BinOpNode:
+    def __init__(self, left_node, op_tok, right_node):
+        self.left_node = left_node
+        self.op_tok = op_tok
+        self.right_node = right_node
+
+        self.pos_start = self.left_node.pos_start
+        self.pos_end = self.right_node.pos_end
+
+    def __repr__(self):
+        return f'({self.left_node}, {self.op_tok}, {self.right_node})'
+
+class UnaryOpNode:
+    def __init__(self, op_tok, node):
+        self.op_tok = op_tok
+        self.node = node
+
+        self.pos_start = self.op_tok.pos_start
+        self.pos_end = node.pos_end
+
+    def __repr__(self):
+        return f'({self.op_tok}, {self.node})'
+    
+class ifNode:
+    def __init__(self, cases, else_case):
+        self.cases = cases
+        self.else_case = else_case
+
+        self.pos_start = cases[0][0].pos_start
+        if self.else_case:
+            node = self.else_case[0] if isinstance(self.else_case, tuple) else self.else_case
+            self.pos_end = node.pos_end
+        else:
+            self.pos_end = self.cases[-1][1].pos_end
+
+    def __repr__(self):
+        return f'if: ({self.cases}, else: {self.else_case})'
+
+    
+class forNode:
+    def __init__(self, var_name_tok, start_value_node, end_value_node, step_value_node, body_node, should_return_null=False):
+        self.var_name_tok = var_name_tok
+        self.start_value_node = start_value_node
+        self.end_value_node = end_value_node 
+        self.step_value_node = step_value_node
+        self.body_node = body_node
+        self.should_return_null = should_return_null
+
+        self.pos_start = self.var_name_tok.pos_start
+        self.pos_end = self.body_node.pos_end
+
+class forInNode:
+    def __init__(self, var_name_tok, iterable_node, body_node, should_return_null=False):
+        self.var_name_tok = var_name_tok
+        self.iterable_node = iterable_node
+        self.body_node = body_node
+        self.should_return_null = should_return_null
+
+        self.pos_start = self.var_name_tok.pos_start
+        self.pos_end = self.body_node.pos_end
+
+class whileNode:
+    def __init__(self, condition_node, body_node, should_return_null=False):
+        self.condition_node = condition_node
+        self.body_node = body_node
+        self.should_return_null = should_return_null
+
+        self.pos_start = self.condition_node.pos_start
+        self.pos_end = self.body_node.pos_end
+
+class FuncDefNode:
+    def __init__(self, var_name_tok, arg_names_toks, body_node, is_block=False):
+        self.var_name_tok = var_name_tok
+        self.arg_names_toks = arg_names_toks
+        self.body_node = body_node
+        self.is_block = is_block
+        self.is_generator = False
+
+        if self.var_name_tok:
+            self.pos_start = self.var_name_tok.pos_start
+        elif len(self.arg_names_toks) > 0:
+            self.pos_start = self.arg_names_toks[0].pos_start
+        else:
+            self.pos_start = self.body_node.pos_start
+
+        self.pos_end = self.body_node.pos_end
+        
+class StructDefNode:
+    def __init__(self, name_tok, field_toks, pos_start, pos_end):
+        self.name_tok = name_tok
+        self.field_toks = field_toks
+
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+class FieldAssignNode:
+    # 'let a.b = value'; assign_node sets the dotted name as a plain variable
+    # when 'a' is not a Record at run time
+    def __init__(self, access_node, assign_node):
+        self.access_node = access_node
+        self.assign_node = assign_node
+        self.value_node = assign_node.value_node
+
+        self.pos_start = self.access_node.pos_start
+        self.pos_end = self.value_node.pos_end
+
+class YieldNode:
+    def __init__(self, value_node, pos_start):
+        self.value_node = value_node
+
+        self.pos_start = pos_start
+        self.pos_end = self.value_node.pos_end
+
+class BreakNode:
+    def __init__(self, tok):
+        self.tok = tok
+        self.pos_start = self.tok.pos_start
+        self.pos_end = self.tok.pos_end
+
+class ContinueNode:
+    def __init__(self, tok):
+        self.tok = tok
+        self.pos_start = self.tok.pos_start
+        self.pos_end = self.tok.pos_end
+        
+class ImportNode:
+    def __init__(self, module_name_tok):
+        self.module_name_tok = module_name_tok
+        self.pos_start = self.module_name_tok.pos_start
+        self.pos_end = self.module_name_tok.pos_end
+
+class CallNode:
+    def __init__(self, node_to_call, arg_nodes):
+        self.node_to_call = node_to_call
+        self.arg_nodes = arg_nodes
+        self.takes_refs = any(isinstance(arg_node, VarRefNode) for arg_node in arg_nodes)
+
+        self.pos_start = self.node_to_call.pos_start
+        if len(self.arg_nodes) > 0:
+            self.pos_end = self.arg_nodes[len(self.arg_nodes)-1].pos_end
+        else:
+            self.pos_end = self.node_to_call.pos_end
+
+
+###################################
+# PARSE RESULT
+#######################################
+
+class ParseResult:
+    def __init__(self):
+        self.error = None
+        self.node = None
+        self.advance_count = 0
+        self.to_reverse_count = 0
+
+    def register_advancement(self):
+        self.advance_count += 1
+
+    def register(self, res):
+        self.advance_count += res.advance_count
+        if res.error: self.error = res.error
+        return res.node
+    
+    def try_register(self, res):
+        if res.error:
+            self.to_reverse_count = res.advance_count
+            return None
+        return self.register(res)
+
+    def success(self, node):
+        self.node = node
+        return self
+
+    def failure(self, error):
+        if not self.error or self.advance_count == 0:
+            self.error = error
+        return self
+
+#######################################
+# PARSER
+#######################################
+
+class Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.tok_idx = -1
+        self.advance()
+
+    def advance(self, ):
+        self.tok_idx += 1
+        self.update_current_tok()
+        return self.current_tok
+    
+    def reverse(self, amount=1):
+        self.tok_idx -= amount
+        self.update_current_tok()
+        return self.current_tok
+    
+    def update_current_tok(self):
+        if self.tok_idx >= 0 and self.tok_idx < len(self.tokens):
+            self.current_tok = self.tokens[self.tok_idx]
+
+    def parse(self):
+        res = self.statements()
+        if not res.error and self.current_tok.type != TT_EOF:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected '+', '-', '*', '/' or '^'"
+            ))
+        if not res.error:
+            Analyzer().visit(res.node, False)
+        return res
+
+    ###################################
+    
+    def statements(self):
+        res = ParseResult()
+        statements = []
+        pos_start = self.current_tok.pos_start.copy()
+        
+        while self.current_tok.type == TT_NEWLINE:
+            res.register_advancement()
+            self.advance()
+
+        statement = res.register(self.statement())
+        if res.error: return res
+        statements.append(statement)
+
+        more_statements = True
+
+        while more_statements:
+            newline_count = 0
+            while self.current_tok.type == TT_NEWLINE:
+                res.register_advancement()
+                self.advance()
+                newline_count += 1
+            
+            if newline_count == 0:
+                more_statements = False
+                continue
+
+            statement = res.try_register(self.statement())
+            if not statement:
+                self.reverse(res.to_reverse_count)
+                more_statements = False
+                continue
+            statements.append(statement)
+
+        return res.success(ListNode(
+            statements,
+            pos_start,
+            self.current_tok.pos_end.copy()
+        ))
+        
+    def statement(self):
+        res = ParseResult()
+        pos_start = self.current_tok.pos_start.copy()
+
+        if self.current_tok.matches(TT_KEYWORD, 'continue'):
+            res.register_advancement()
+            self.advance()
+            return res.success(ContinueNode(self.current_tok))
+            
+        if self.current_tok.matches(TT_KEYWORD, 'break'):
+            res.register_advancement()
+            self.advance()
+            return res.success(BreakNode(self.current_tok))
+        
+        if self.current_tok.matches(TT_KEYWORD, 'yield'):
+            res.register_advancement()
+            self.advance()
+            expr = res.register(self.expr())
+            if res.error: return res
+            return res.success(YieldNode(expr, pos_start))
+
+        if self.current_tok.matches(TT_KEYWORD, 'use'):
+            self.advance()
+            if self.current_tok.type != TT_IDENTIFIER:
+                return ParseResult().failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected identifier"
+                ))
+            module_name = self.current_tok
+            self.advance()
+            return ParseResult().success(ImportNode(module_name))
+        
+
+        if self.current_tok.matches(TT_KEYWORD, 'while'):
+            while_expr = res.register(self.while_expr())
+            if res.error: return res
+            return res.success(while_expr)
+        
+        if self.current_tok.matches(TT_KEYWORD, 'while'):
+            while_expr = res.register(self.while_expr())
+            if res.error: return res
+            return res.success(while_expr)
+
+        expr = res.register(self.expr())
+        if res.error:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected 'continue', 'break', 'let', 'const', 'if', 'for', 'while', 'func', int, float, identifier, '+', '-', '(', '[' or 'not'"
+            ))
+        return res.success(expr)
+    
+    def comp_expr(self):
+        res = ParseResult()
+
+        if self.current_tok.matches(TT_KEYWORD, 'not'):
+            op_tok = self.current_tok
+            res.register_advancement()
+            self.advance()
+
+            node = res.register(self.comp_expr())
+            if res.error:
+                return res
+            return res.success(UnaryOpNode(op_tok, node))
+        
+        node = res.register(self.bin_op(self.arith_expr, (TT_EE, TT_NE, TT_LT, TT_GT, TT_LTE, TT_GTE)))
+
+        if res.error:
+            return res.failure(InvalidSyntaxError(self.current_tok.pos_start, self.current_tok.pos_end, "Expected int, float, identifier, '+', '-', '(' or 'not' "))
+
+        return res.success(node)
+    
+    def expr(self):
+        res = ParseResult()
+
+        if self.current_tok.matches(TT_KEYWORD, 'if'):
+                if_expr = res.register(self.if_expr())
+                if res.error: return res
+                return res.success(if_expr)
+        
+        if self.current_tok.matches(TT_KEYWORD, 'while'):
+            expr = res.register(self.while_expr())
+            if res.error: return res
+            return res.success(expr)
+
+        if self.current_tok.matches(TT_KEYWORD, 'let') or self.current_tok.matches(TT_KEYWORD, 'const'):
+            is_const = self.current_tok.matches(TT_KEYWORD, 'const')
+            res.register_advancement()
+            self.advance()
+            
+            var_type = None
+            if self.current_tok.type == TT_KEYWORD and self.current_tok.value in ('int', 'str', 'bool', 'arr', 'float', 'intarr', 'floatarr'):
+                var_type = self.current_tok.value
+                res.register_advancement()
+                self.advance()
+
+            if self.current_tok.type != TT_IDENTIFIER:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected identifier"
+                ))
+
+            var_name = self.current_tok
+            res.register_advancement()
+            self.advance()
+
+
+            if self.current_tok.type != TT_EQ:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected '='"
+                ))
+
+            res.register_advancement()
+            self.advance()
+            expr = res.register(self.expr())
+            if res.error: return res
+
+            assign_node = VarAssignNode(var_name, expr, is_const, var_type)
+            access_node = self.field_access(var_name)
+            if access_node and not is_const and not var_type:
+                return res.success(FieldAssignNode(access_node, assign_node))
+            return res.success(assign_node)
+
+        node = res.register(self.bin_op(self.comp_expr, ((TT_KEYWORD, 'and'), (TT_KEYWORD, 'or'))))
+
+        if res.error:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected 'let', 'const','if', int, float, identifier, '+', '-', '(' or 'not'"
+            ))
+
+        return res.success(node)
+
+
+    def power(self):
+        return self.bin_op(self.call, (TT_POW, ), self.factor)
+
+    def call(self):
+        res = ParseResult()
+        atom = res.register(self.atom())
+        if res.error: return res
+
+        if self.current_tok.type == TT_LPAREN:
+            res.register_advancement()
+            self.advance()
+            arg_nodes = []
+
+            if self.current_tok.type == TT_RPAREN:
+                res.register_advancement()
+                self.advance()
+            else:
+                arg_nodes.append(res.register(self.expr()))
+                if res.error:
+                    return res.failure(InvalidSyntaxError(
+                        self.current_tok.pos_start, self.current_tok.pos_end,
+                        "Expected ')', 'let', 'if', 'for', 'while', 'func', int, float, identifier, '+', '-', '(', '[' or 'not'"
+                    ))
+
+                while self.current_tok.type == TT_COMMA:
+                    res.register_advancement()
+                    self.advance()
+
+                    arg_nodes.append(res.register(self.expr()))
+                    if res.error: return res
+
+                if self.current_tok.type != TT_RPAREN:
+                    return res.failure(InvalidSyntaxError(
+                        self.current_tok.pos_start, self.current_tok.pos_end,
+                        f"Expected ',' or ')'"
+                    ))
+
+                res.register_advancement()
+                self.advance()
+
+            # swap(a, b) and del(a) name variables, bound here rather than
+            # guessed back from the values at runtime
+            if type(atom) is VarAccessNode and atom.var_name_tok.value in REFERENCE_BUILTINS:
+                arg_nodes = [
+                    VarRefNode(arg_node.var_name_tok) if type(arg_node) is VarAccessNode else arg_node
+                    for arg_node in arg_nodes
+                ]
+            return res.success(CallNode(atom, arg_nodes))
+        return res.success(atom)
+
+    def factor(self):
+        res = ParseResult()
+        tok = self.current_tok
+
+        if tok.type in (TT_PLUS, TT_MINUS):
+            res.register_advancement()
+            self.advance()
+            factor = res.register(self.factor())
+            if res.error: return res
+            return res.success(UnaryOpNode(tok, factor))
+
+        return self.power()
+
+    def term(self):
+        return self.bin_op(self.factor, (TT_MUL, TT_DIV))
+
+    def arith_expr(self):
+        return self.bin_op(self.term, (TT_PLUS, TT_MINUS))
+
+    
+    def atom(self):
+        res = ParseResult()
+        tok = self.current_tok
+
+        if tok.type in (TT_INT, TT_FLOAT):
+            res.register_advancement()
+            self.advance()
+            return res.success(NumberNode(tok))
+
+        elif tok.type == TT_STRING:
+            res.register_advancement()
+            self.advance()
+            return res.success(StringNode(tok))
+
+        elif tok.type == TT_IDENTIFIER:
+            res.register_advancement()
+            self.advance()
+            return res.success(self.field_access(tok) or VarAccessNode(tok))
+        
+        elif tok.matches(TT_KEYWORD, 'break'):
+            res.register_advancement()
+            self.advance()
+            return res.success(BreakNode(tok))
+
+        elif tok.matches(TT_KEYWORD, 'continue'):
+            res.register_advancement()
+            self.advance()
+            return res.success(ContinueNode(tok))
+
+        elif tok.type == TT_LPAREN:
+            res.register_advancement()
+            self.advance()
+            expr = res.register(self.expr())
+            if res.error: return res
+            if self.current_tok.type == TT_RPAREN:
+                res.register_advancement()
+                self.advance()
+                return res.success(expr)
+            else:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected ')'"
+                ))
+
+        elif tok.type == TT_LSQUARE:
+            list_expr = res.register(self.list_expr())
+            if res.error: return res
+            return res.success(list_expr)
+
+        elif tok.type == TT_LBRACET:
+            map_expr = res.register(self.map_expr())
+            if res.error: return res
+            return res.success(map_expr)
+
+        elif tok.matches(TT_KEYWORD, 'if'):
+            if_expr = res.register(self.if_expr())
+            if res.error: return res
+            return res.success(if_expr)
+
+        elif tok.matches(TT_KEYWORD, 'for'):
+            for_expr = res.register(self.for_expr())
+            if res.error: return res
+            return res.success(for_expr)
+
+        elif tok.matches(TT_KEYWORD, 'while'):
+            while_expr = res.register(self.while_expr())
+            if res.error: return res
+            return res.success(while_expr)
+
+        elif tok.matches(TT_KEYWORD, 'func'):
+            func_def = res.register(self.func_def())
+            if res.error: return res
+            return res.success(func_def)
+
+        elif tok.matches(TT_KEYWORD, 'struct'):
+            struct_def = res.register(self.struct_def())
+            if res.error: return res
+            return res.success(struct_def)
+
+        return res.failure(InvalidSyntaxError(
+            tok.pos_start, tok.pos_end,
+            "Expected int, float, identifier, string, 'let', 'while', 'for', 'if', '+', '-', '{', '[' or '('"
+        ))
+
+        
+        
+
+    ################################### 
+    
+    def list_expr(self):
+        res = ParseResult()
+        element_nodes = []
+        pos_start = self.current_tok.pos_start.copy()
+
+        if self.current_tok.type != TT_LSQUARE:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end, "Expected '['"
+            ))
+
+        res.register_advancement()
+        self.advance()
+
+        if self.current_tok.type == TT_RSQUARE:
+            res.register_advancement()
+            self.advance()
+            return res.success(ListNode(element_nodes, pos_start, self.current_tok.pos_end.copy()))
+
+        element_nodes.append(res.register(self.expr()))
+        if res.error: return res
+
+        while self.current_tok.type == TT_COMMA:
+            res.register_advancement()
+            self.advance()
+
+            element_nodes.append(res.register(self.expr()))
+            if res.error: return res
+
+        if self.current_tok.type != TT_RSQUARE:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected ',' or ']'"
+            ))
+
+        res.register_advancement()
+        self.advance()
+        return res.success(ListNode(element_nodes, pos_start, self.current_tok.pos_end.copy()))
+
+    def map_expr(self):
+        res = ParseResult()
+        pair_nodes = []
+        pos_start = self.current_tok.pos_start.copy()
+
+        res.register_advancement()
+        self.advance()
+
+        if self.current_tok.type == TT_RBRACET:
+            res.register_advancement()
+            self.advance()
+            return res.success(MapNode(pair_nodes, pos_start, self.current_tok.pos_end.copy()))
+
+        while True:
+            key_node = res.register(self.expr())
+            if res.error: return res
+
+            if self.current_tok.type != TT_TWODOT:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected ':'"
+                ))
+
+            res.register_advancement()
+            self.advance()
+
+            value_node = res.register(self.expr())
+            if res.error: return res
+            pair_nodes.append((key_node, value_node))
+
+            if self.current_tok.type != TT_COMMA:
+                break
+            res.register_advancement()
+            self.advance()
+
+        if self.current_tok.type != TT_RBRACET:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected ',' or '}'"
+            ))
+
+        res.register_advancement()
+        self.advance()
+        return res.success(MapNode(pair_nodes, pos_start, self.current_tok.pos_end.copy()))
+
+    def if_expr(self):
+        res = ParseResult()
+        all_cases = res.register(self.if_expr_cases("if"))
+        if res.error:
+            return res
+        cases, else_case = all_cases
+        return res.success(ifNode(cases, else_case))
+
+    def if_expr_b(self):
+        return self.if_expr_cases("elif")
+
+    def if_expr_c(self):
+        res = ParseResult()
+        else_case = None
+
+        if self.current_tok.matches(TT_KEYWORD, "else"):
+            res.register_advancement()
+            self.advance()
+
+            if self.current_tok.type == TT_LBRACET or self.current_tok.type == TT_NEWLINE:
+                if self.current_tok.type == TT_LBRACET:
+                    res.register_advancement()
+                    self.advance()
+                else:  # NEWLINE branch
+                    res.register_advancement()
+                    self.advance()
+                statements = res.register(self.statements())
+                if res.error: 
+                    return res
+                else_case = (statements, True)  
+                if self.current_tok.type != TT_RBRACET:
+                    return res.failure(InvalidSyntaxError(
+                        self.current_tok.pos_start, self.current_tok.pos_end, "Expected '}'"
+                    ))
+                res.register_advancement()
+                self.advance()
+            else:
+                # Otherwise, a single expression branch
+                expr = res.register(self.expr())
+                if res.error:
+                    return res
+                else_case = (expr, False)
+        else:
+            # If no "else" keyword, parse a single expression (or raise error)
+            expr = res.register(self.expr())
+            if res.error:
+                return res
+            else_case = (expr, False)
+        return res.success(else_case)
+    def if_expr_b_or_c(self):
+        res = ParseResult()
+        cases, else_case = [], None
+
+        if self.current_tok.matches(TT_KEYWORD, "elif"):
+            all_cases = res.register(self.if_expr_b())
+            if res.error:
+                return res
+            cases, else_case = all_cases
+        else:
+            else_case = res.register(self.if_expr_c())
+            if res.error:
+                return res
+            
+        # Wrap the two values in a tuple (a single argument to success)
+        return res.success((cases, else_case))
+
+    def if_expr_cases(self, case_keyword):
+        res = ParseResult()
+        cases = []
+        else_case = None
+
+        if not self.current_tok.matches(TT_KEYWORD, case_keyword):
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end, f"Expected '{case_keyword}'"
+            ))
+
+        res.register_advancement()
+        self.advance()
+
+        condition = res.register(self.expr())
+        if res.error: return res
+
+        if self.current_tok.type != TT_LBRACET:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end, "Expected '{'"
+            ))
+
+        res.register_advancement()
+        self.advance()
+
+        if self.current_tok.type == TT_NEWLINE:
+            res.register_advancement()
+            self.advance()
+
+            statements = res.register(self.statements())
+            if res.error: return res
+            cases.append((condition, statements, True))  # true indicates the branch is a block
+
+            if self.current_tok.type == TT_RBRACET:
+                res.register_advancement()
+                self.advance()
+                if self.current_tok.matches(TT_KEYWORD, 'elif') or self.current_tok.matches(TT_KEYWORD, 'else'):
+                    all_cases = res.register(self.if_expr_b_or_c())
+                    if res.error: return res
+                    new_cases, else_case = all_cases
+                    cases.extend(new_cases)
+            else:
+                all_cases = res.register(self.if_expr_b_or_c())
+                if res.error: return res
+                new_cases, else_case = all_cases
+                cases.extend(new_cases)
+        else:
+            expr = res.register(self.expr())
+            if res.error: return res
+            cases.append((condition, expr, False))  # false indicates a single-expression branch
+                
+            if self.current_tok.type != TT_RBRACET:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end, "Expected '}'"
+                ))
+            res.register_advancement()
+            self.advance()
+
+            all_cases = res.register(self.if_expr_b_or_c())
+            if res.error: return res
+            new_cases, else_case = all_cases
+            cases.extend(new_cases)
+
+        return res.success((cases, else_case))
+        
+    def for_expr(self):
+        res = ParseResult()
+
+        if not self.current_tok.matches(TT_KEYWORD, 'for'):
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected 'for'"
+            ))
+
+        res.register_advancement()
+        self.advance()
+
+        if self.current_tok.type != TT_IDENTIFIER:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected identifier"
+            ))
+
+        var_name = self.current_tok
+        res.register_advancement()
+        self.advance()
+
+        if self.current_tok.matches(TT_KEYWORD, 'in'):
+            res.register_advancement()
+            self.advance()
+
+            iterable = res.register(self.expr())
+            if res.error: return res
+
+            loop_body = res.register(self.loop_body())
+            if res.error: return res
+            body, is_block = loop_body
+
+            return res.success(forInNode(var_name, iterable, body, is_block))
+
+        # Check for equals sign
+        if self.current_tok.type != TT_EQ:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected '='"
+            ))
+
+        res.register_advancement()
+        self.advance()
+        
+        # Parse start value
+        start_value = res.register(self.expr())
+        if res.error: return res
+
+        # Check for 'to' keyword
+        if not self.current_tok.matches(TT_KEYWORD, 'to'):
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected 'to'"
+            ))
+
+        res.register_advancement()
+        self.advance()
+        
+        # Parse end value
+        end_value = res.register(self.expr())
+        if res.error: return res
+
+        # Check for optional 'step' keyword
+        if self.current_tok.matches(TT_KEYWORD, 'step'):
+            res.register_advancement()
+            self.advance()
+
+            step_value = res.register(self.expr())
+            if res.error: return res
+        else:
+            step_value = None
+
+        loop_body = res.register(self.loop_body())
+        if res.error: return res
+        body, is_block = loop_body
+
+        return res.success(forNode(var_name, start_value, end_value, step_value, body, is_block))
+
+    def loop_body(self):
+        res = ParseResult()
+
+        # Look for opening curly brace (your syntax uses { } instead of THEN/END)
+        if self.current_tok.type != TT_LBRACET:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected '{'"
+            ))
+
+        res.register_advancement()
+        self.advance()
+
+        # Check if it's a block of statements or a single expression
+        if self.current_tok.type == TT_NEWLINE:
+            res.register_advancement()
+            self.advance()
+
+            body = res.register(self.statements())
+            if res.error: return res
+
+            if self.current_tok.type != TT_RBRACET:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected '}'"
+                ))
+
+            res.register_advancement()
+            self.advance()
+
+            return res.success((body, True))
+        else:
+            # Single expression body
+            body = res.register(self.expr())
+            if res.error: return res
+
+            if self.current_tok.type != TT_RBRACET:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected '}'"
+                ))
+
+            res.register_advancement()
+            self.advance()
+
+            return res.success((body, False))
+
+    
+    def field_access(self, tok):
+        names = tok.value.split('.')
+        if len(names) < 2 or not all(names):
+            return None
+        return FieldAccessNode(tok, names[0], names[1:])
+
+    def struct_def(self):
+        res = ParseResult()
+        pos_start = self.current_tok.pos_start.copy()
+
+        res.register_advancement()
+        self.advance()
+
+        if self.current_tok.type != TT_IDENTIFIER or '.' in self.current_tok.value:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected struct name"
+            ))
+
+        name_tok = self.current_tok
+        res.register_advancement()
+        self.advance()
+
+        if self.current_tok.type != TT_LBRACET:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected '{'"
+            ))
+
+        res.register_advancement()
+        self.advance()
+
+        field_toks = []
+        while True:
+            while self.current_tok.type == TT_NEWLINE:
+                res.register_advancement()
+                self.advance()
+
+            if self.current_tok.type == TT_RBRACET:
+                break
+
+            if self.current_tok.type != TT_IDENTIFIER or '.' in self.current_tok.value:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected field name"
+                ))
+            if any(field_tok.value == self.current_tok.value for field_tok in field_toks):
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    f"Duplicate field '{self.current_tok.value}'"
+                ))
+
+            field_toks.append(self.current_tok)
+            res.register_advancement()
+            self.advance()
+
+            while self.current_tok.type == TT_NEWLINE:
+                res.register_advancement()
+                self.advance()
+
+            if self.current_tok.type == TT_COMMA:
+                res.register_advancement()
+                self.advance()
+            elif self.current_tok.type != TT_RBRACET:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected ',' or '}'"
+                ))
+
+        res.register_advancement()
+        self.advance()
+        return res.success(StructDefNode(name_tok, field_toks, pos_start, self.current_tok.pos_end.copy()))
+
+    def func_def(self):
+        res = ParseResult()
+
+        if not self.current_tok.matches(TT_KEYWORD, 'func'):
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end, f"Expected 'func'"
+            ))
+
+        res.register_advancement()
+        self.advance()
+
+        if self.current_tok.type == TT_IDENTIFIER:
+            var_name_tok = self.current_tok
+            res.register_advancement()
+            self.advance()
+            if self.current_tok.type != TT_LPAREN:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end, f"Expected '('"
+                ))
+            
+        else:
+            var_name_tok = None
+            if self.current_tok.type != TT_LPAREN:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end, f"Expected identifier or '('"
+                ))
+            
+        res.register_advancement()
+        self.advance()
+        arg_name_toks = []
+
+        if self.current_tok.type == TT_IDENTIFIER:
+            arg_name_toks.append(self.current_tok)
+            res.register_advancement()
+            self.advance()
+
+            while self.current_tok.type == TT_COMMA:
+                res.register_advancement()
+                self.advance()
+
+                if self.current_tok.type != TT_IDENTIFIER:
+                    return res.failure(InvalidSyntaxError(
+                        self.current_tok.pos_start, self.current_tok.pos_end,
+                        "Expected identifier"
+                    ))
+
+                arg_name_toks.append(self.current_tok)
+                res.register_advancement()
+                self.advance()
+
+            if self.current_tok.type != TT_RPAREN:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end, f"Expected ',' or ')'"
+                ))
+            
+        else:
+            if self.current_tok.type != TT_RPAREN:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end, f"Expected identifier or ')'"
+                ))
+            
+        res.register_advancement()
+        self.advance()
+
+        if self.current_tok.type == TT_ARROW:
+            res.register_advancement()
+            self.advance()
+            node_to_return = res.register(self.expr())
+            if res.error: return res
+
+            return res.success(FuncDefNode(
+                var_name_tok,
+                arg_name_toks,
+                node_to_return
+            ))
+            
+        if self.current_tok.type != TT_TWODOT:
+            return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end, f"Expected ':'"
+                ))
+        
+        res.register_advancement()
+        self.advance()
+        
+        # Передача на багаторядковий варіант
+        if self.current_tok.type == TT_NEWLINE:
+            res.register_advancement()
+            self.advance()
+            
+            # Парсимо тіло функції як блок операторів
+            body = res.register(self.statements())
+            if res.error: return res
+            
+            # Перевіряємо наявність закриваючої дужки
+            if self.current_tok.type != TT_RBRACET:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected '}'"
+                ))
+            
+            res.register_advancement()
+            self.advance()
+            
+            # Повертаємо вузол функції
+            return res.success(FuncDefNode(
+                var_name_tok,
+                arg_name_toks,
+                body,
+                True
+            ))
+        else:
+            # Однорядковий варіант
+            body = res.register(self.expr())
+            if res.error: return res
+            
+            if self.current_tok.type != TT_RBRACET:
+                return res.failure(InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected '}'"
+                ))
+            
+            res.register_advancement()
+            self.advance()
+            
+            return res.success(FuncDefNode(
+                var_name_tok,
+                arg_name_toks,
+                body
+            ))
+            
+        
+
+    def bin_op(self, func_a, ops, func_b=None):
+        if func_b == None:
+            func_b = func_a
+        
+        res = ParseResult()
+        left = res.register(func_a())
+        if res.error: return res
+
+        while self.current_tok.type in ops or (self.current_tok.type, self.current_tok.value) in ops:
+            op_tok = self.current_tok
+            res.register_advancement()
+            self.advance()
+            right = res.register(func_b())
+            if res.error: return res
+            left = BinOpNode(left, op_tok, right)
+
+        return res.success(left)
+
+    def while_expr(self):
+        res = ParseResult()
+
+        if not self.current_tok.matches(TT_KEYWORD, 'while'):
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                f"Expected 'while'"
+            ))
+
+        res.register_advancement()
+        self.advance()
+
+        condition = res.register(self.expr())
+        if res.error: return res
+
+        if not self.current_tok.type == TT_LBRACET:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                f"Expected '{{'"
+            ))
+
+        res.register_advancement()
+        self.advance()
+
+        body = res.register(self.statements())
+        if res.error: return res
+
+        if not self.current_tok.type == TT_RBRACET:
+            return res.failure(InvalidSyntaxError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                f"Expected '}}'"
+            ))
+
+        res.register_advancement()
+        self.advance()  
+        return res.success(whileNode(condition, body))
+    
+    
+
+#######################################
+# ANALYSIS
+#######################################
+
+class Analyzer:
+    # value_used is False when the parent discards the node's value
+    # (top-level statements, block bodies of loops used as statements, all
+    # but the last statement of a block function body).
+    # Loops in such positions are marked so they do not build a result List.
+    # Functions containing a yield statement are marked as generators.
+
+    def __init__(self):
+        self.func_nodes = []
+
+    def visit(self, node, value_used):
+        method_name = f'visit_{type(node).__name__}'
+        method = getattr(self, method_name, self.no_visit_method)
+        method(node, value_used)
+
+    def no_visit_method(self, node, value_used):
+        pass
+
+    ###################################
+
+    def visit_ListNode(self, node, value_used):
+        for element_node in node.elementNodes:
+            self.visit(element_node, value_used)
+
+    def visit_MapNode(self, node, value_used):
+        for key_node, value_node in node.pair_nodes:
+            self.visit(key_node, True)
+            self.visit(value_node, True)
+
+    def visit_VarAssignNode(self, node, value_used):
+        self.visit(node.value_node, True)
+
+    def visit_FieldAssignNode(self, node, value_used):
+        self.visit(node.value_node, True)
+
+    def visit_BinOpNode(self, node, value_used):
+        self.visit(node.left_node, True)
+        self.visit(node.right_node, True)
+
+    def visit_UnaryOpNode(self, node, value_used):
+        self.visit(node.node, True)
+
+    def visit_ifNode(self, node, value_used):
+        for condition, expr, is_block in node.cases:
+            self.visit(condition, True)
+            self.visit(expr, value_used)
+
+        if node.else_case:
+            else_expr, is_block = node.else_case
+            self.visit(else_expr, value_used)
+
+    def visit_forNode(self, node, value_used):
+        self.visit(node.start_value_node, True)
+        self.visit(node.end_value_node, True)
+        if node.step_value_node:
+            self.visit(node.step_value_node, True)
+
+        if node.should_return_null:
+            self.visit(node.body_node, False)
+        else:
+            self.visit(node.body_node, value_used)
+            node.should_return_null = not value_used
+
+    def visit_forInNode(self, node, value_used):
+        self.visit(node.iterable_node, True)
+
+        if node.should_return_null:
+            self.visit(node.body_node, False)
+        else:
+            self.visit(node.body_node, value_used)
+            node.should_return_null = not value_used
+
+    def visit_whileNode(self, node, value_used):
+        self.visit(node.condition_node, True)
+        self.visit(node.body_node, value_used)
+        node.should_return_null = not value_used
+
+    def visit_FuncDefNode(self, node, value_used):
+        self.func_nodes.append(node)
+        if node.is_block:
+            # Only the last statement of a block body is the function's result
+            statement_nodes = node.body_node.elementNodes
+            for statement_node in statement_nodes[:-1]:
+                self.visit(statement_node, False)
+            if statement_nodes:
+                self.visit(statement_nodes[-1], True)
+        else:
+            self.visit(node.body_node, True)
+
+        # A generator body is never returned, so it is analysed as statements
+        if node.is_generator:
+            self.visit(node.body_node, False)
+        self.func_nodes.pop()
+
+    def visit_YieldNode(self, node, value_used):
+        self.visit(node.value_node, True)
+        if self.func_nodes:
+            self.func_nodes[-1].is_generator = True
+
+    def visit_CallNode(self, node, value_used):
+        self.visit(node.node_to_call, True)
+        for arg_node in node.arg_nodes:
+            self.visit(arg_node, True)
+
+#######################################
+# RUNTIME RESULT
+#######################################
+
+class RTResult:
+    def __init__(self):
+        self.reset()
+        
+    def reset(self):
+        self.value = None
+        self.error = None
+        self.func_return_value = None
+        self.loop_should_continue = False
+        self.loop_should_break = False
+
+    def register(self, res):
+        if res is None:
+            return None
+        if isinstance(res, RTResult):
+            if res.error: 
+                self.error = res.error
+            self.func_return_value = res.func_return_value
+            self.loop_should_continue = res.loop_should_continue
+            self.loop_should_break = res.loop_should_break
+            return res.value
+        return res
+
+
+    def success(self, value):
+        self.reset()
+        self.value = value
+        return self
+    
+    def success_continue(self):
+        self.reset()
+        self.loop_should_continue = True
+        return self
+
+    def success_break(self):
+        self.reset()
+        self.loop_should_break = True
+        return self
+
+    def failure(self, error):
+        self.reset()
+        self.error = error
+        return self
+    
+    def should_return(self):
+        return (
+            self.error or
+            self.func_return_value or
+            self.loop_should_continue or
+            self.loop_should_break
+        )
+
+#######################################
+# VALUES
+#######################################
+
+class Value:
+    # Values are slotted and do not store positions or a context; the
+    # interpreter locates errors from the node being evaluated. set_pos and
+    # set_context are kept so call sites can chain them on any value.
+    __slots__ = ()
+
+    def set_pos(self, pos_start=None, pos_end=None):
+        return self
+
+    def set_context(self, context=None):
+        return self
+
+    def added_to(self, other):
+        return None, self.illegal_operation(other)
+
+    def subbed_by(self, other):
+        return None, self.illegal_operation(other)
+
+    def multed_by(self, other):
+        return None, self.illegal_operation(other)
+
+    def dived_by(self, other):
+        return None, self.illegal_operation(other)
+
+    def powed_by(self, other):
+        return None, self.illegal_operation(other)
+
+    def get_comparison_eq(self, other):
+        return None, self.illegal_operation(other)
+
+    def get_comparison_ne(self, other):
+        return None, self.illegal_operation(other)
+
+    def get_comparison_lt(self, other):
+        return None, self.illegal_operation(other)
+
+    def get_comparison_gt(self, other):
+        return None, self.illegal_operation(other)
+
+    def get_comparison_lte(self, other):
+        return None, self.illegal_operation(other)
+
+    def get_comparison_gte(self, other):
+        return None, self.illegal_operation(other)
+
+    def anded_by(self, other):
+        return None, self.illegal_operation(other)
+
+    def ored_by(self, other):
+        return None, self.illegal_operation(other)
+
+    def notted(self):
+        return None, self.illegal_operation()
+
+    def execute(self, args):
+        return RTResult().failure(self.illegal_operation())
+
+    def iterate(self):
+        return None, RTError(None, None, 'Value is not iterable', None)
+
+    def copy(self):
+        raise Exception('No copy method defined')
+
+    def is_true(self):
+        return False
+
+    def illegal_operation(self, other=None):
+        return RTError(None, None, 'Illegal operation', None)
+
+class Number(Value):
+    __slots__ = ('value',)
+    small_ints = {}
+
+    def __new__(cls, value):
+        number = Number.small_ints.get(value) if type(value) is int else None
+        if number is None:
+            number = object.__new__(cls)
+            number.value = value
+        return number
+
+    def __reduce__(self):
+        # Rebuilt through __new__ so small ints stay shared
+        return Number, (self.value,)
+
+    def added_to(self, other):
+        if isinstance(other, Number):
+            return Number(self.value + other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def subbed_by(self, other):
+        if isinstance(other, Number):
+            return Number(self.value - other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def multed_by(self, other):
+        if isinstance(other, Number):
+            return Number(self.value * other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def dived_by(self, other):
+        if isinstance(other, Number):
+            if other.value == 0:
+                return None, RTError(None, None, 'Division by zero', None)
+
+            return Number(self.value / other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def powed_by(self, other):
+        if isinstance(other, Number):
+            return Number(self.value ** other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def get_comparison_eq(self, other):
+        if isinstance(other, Number):
+            return Boolean(self.value == other.value), None
+        elif isinstance(other, Boolean):
+            return Boolean((1 if self.value else 0) == other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def get_comparison_ne(self, other):
+        if isinstance(other, Number):
+            return Boolean(self.value != other.value), None
+        elif isinstance(other, Boolean):
+            return Boolean((1 if self.value else 0) != other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def get_comparison_lt(self, other):
+        if isinstance(other, Number):
+            return Boolean(self.value < other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def get_comparison_gt(self, other):
+        if isinstance(other, Number):
+            return Boolean(self.value > other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def get_comparison_lte(self, other):
+        if isinstance(other, Number):
+            return Boolean(self.value <= other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def get_comparison_gte(self, other):
+        if isinstance(other, Number):
+            return Boolean(self.value >= other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def anded_by(self, other):
+        if isinstance(other, Number):
+            return Boolean(self.value != 0 and other.value != 0), None
+        elif isinstance(other, Boolean):
+            return Boolean(self.value != 0 and other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def ored_by(self, other):
+        if isinstance(other, Number):
+            return Boolean(self.value != 0 or other.value != 0), None
+        elif isinstance(other, Boolean):
+            return Boolean(self.value != 0 or other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def notted(self):
+        return Boolean(self.value == 0), None
+
+    
+    def __lt__(self, other):
+        if isinstance(other, Number):
+            return self.value < other.value
+        return NotImplemented
+    
+    def __eq__(self, other):
+        if isinstance(other, Number):
+            return self.value == other.value
+        return False
+
+    def __hash__(self):
+        return hash(self.value)
+
+
+    def copy(self):
+        return self
+
+    def is_true(self):
+        return self.value != 0
+    
+    def is_float(self):
+        return isinstance(self.value, float)
+    
+    def __repr__(self):
+        return str(self.value)
+
+for i in range(-5, 257):
+    Number.small_ints[i] = Number(i)
+
+Number.null = Number(0)
+Number.true = Number(1)
+Number.false = Number(0)
+Number.PI = Number(math.pi)
+Number.E = Number(math.e)
+     
+class StringBuffer:
+    # Append-only chunk list shared by the strings built on top of it
+    __slots__ = ('chunks', 'length')
+
+    def __init__(self, chunks, length):
+        self.chunks = chunks
+        self.length = length
+
+    def append(self, text):
+        self.chunks.append(text)
+        self.length += len(text)
+
+    def join(self):
+        if len(self.chunks) > 1:
+            self.chunks[:] = [''.join(self.chunks)]
+        return self.chunks[0]
+
+
+class StringSlice:
+    # Stands in for a StringBuffer under a sliced String: the text is cut
+    # out of source only when the slice is first read
+    __slots__ = ('source', 'indices')
+
+    def __init__(self, source, indices):
+        self.source = source
+        self.indices = indices
+
+    def join(self):
+        indices = self.indices
+        stop = indices.stop if indices.stop >= 0 else None
+        return self.source[indices.start:stop:indices.step]
+
+
+class String(Value):
+    __slots__ = ('flat', 'buffer', 'length')
+
+    # Below this size plain concatenation is cheaper than a buffer
+    BUFFER_THRESHOLD = 256
+
+    def __init__(self, value, buffer=None, length=None):
+        self.flat = value
+        self.buffer = buffer
+        self.length = len(value) if length is None else length
+
+    @property
+    def value(self):
+        if self.flat is None:
+            text = self.buffer.join()
+            self.flat = text if len(text) == self.length else text[:self.length]
+        return self.flat
+
+    def __len__(self):
+        return self.length
+
+    def slice(self, key):
+        buffer = self.buffer
+        if self.flat is None and isinstance(buffer, StringSlice):
+            indices = buffer.indices[key]
+            source = buffer.source
+        else:
+            indices = range(self.length)[key]
+            source = self.value
+        return String(None, StringSlice(source, indices), len(indices))
+
+    def added_to(self, other):
+        if isinstance(other, String):
+            buffer = self.buffer
+            if not isinstance(buffer, StringBuffer) or buffer.length != self.length:
+                if self.length + other.length < String.BUFFER_THRESHOLD:
+                    return String(self.value + other.value), None
+                buffer = StringBuffer([self.value], self.length)
+                self.buffer = buffer
+            buffer.append(other.value)
+            return String(None, buffer, buffer.length), None
+        else:
+            return None, Value.illegal_operation(self, other)
+        
+    def multed_by(self, other):
+        if isinstance(other, Number):
+            return String(self.value * other.value), None
+        else:
+            return None, Value.illegal_operation(self, other)
+        
+    def get_comparison_eq(self, other):
+        if isinstance(other, String):
+            return Boolean(self == other), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def get_comparison_ne(self, other):
+        if isinstance(other, String):
+            return Boolean(not self == other), None
+        else:
+            return None, Value.illegal_operation(self, other)
+        
+    def is_true(self):
+        return self.length > 0
+
+    def iterate(self):
+        return (String(char) for char in self.value), None
+    
+    def __eq__(self, other):
+        if isinstance(other, String):
+            return self.length == other.length and self.value == other.value
+        return False
+
+    def __hash__(self):
+        return hash(self.value)
+    
+    def copy(self):
+        return self
+    
+    def __str__(self):
+        return self.value
+
+    def __repr__(self):
+        return f'"{self.value}"'
+    
+    
+class Boolean(Value):
+    __slots__ = ('value',)
+
+    def __new__(cls, value):
+        return Boolean.true if value else Boolean.false
+
+    def __reduce__(self):
+        return Boolean, (self.value,)
+        
+    def added_to(self, other):
+        return None, Value.illegal_operation(self, other)
+
+    def subbed_by(self, other):
+        return None, Value.illegal_operation(self, other)
+
+    def multed_by(self, other):
+        return None, Value.illegal_operation(self, other)
+
+    def dived_by(self, other):
+        return None, Value.illegal_operation(self, other)
+    
+    def powed_by(self, other):
+        return None, Value.illegal_operation(self, other)
+
+    def get_comparison_eq(self, other):
+        if isinstance(other, Boolean):
+            return Boolean(self.value == other.value), None
+        elif isinstance(other, Number):
+            return Boolean(self.value == (1 if other.value else 0)), None
+        return None, Value.illegal_operation(self, other)
+    
+    def get_comparison_ne(self, other):
+        if isinstance(other, Boolean):
+            return Boolean(self.value != other.value), None
+        elif isinstance(other, Number):
+            return Boolean(self.value != (1 if other.value else 0)), None
+        return None, Value.illegal_operation(self, other)
+
+    def anded_by(self, other):
+        if isinstance(other, Boolean):
+            return Boolean(self.value and other.value), None
+        elif isinstance(other, Number):
+            return Boolean(self.value and other.value != 0), None
+        return None, Value.illegal_operation(self, other)
+
+    def ored_by(self, other):
+        if isinstance(other, Boolean):
+            return Boolean(self.value or other.value), None
+        elif isinstance(other, Number):
+            return Boolean(self.value or other.value != 0), None
+        return None, Value.illegal_operation(self, other)
+
+    def notted(self):
+        return Boolean(not self.value), None
+
+    def copy(self):
+        return self
+
+    def is_true(self):
+        return self.value == 1
+
+    def __repr__(self):
+        return "true" if self.value else "false"
+    
+Boolean.true = object.__new__(Boolean)
+Boolean.true.value = 1
+Boolean.false = object.__new__(Boolean)
+Boolean.false.value = 0
+    
+class BaseFunction(Value):
+    # Functions keep the context they run in and the position of the call,
+    # both are needed to build the new frame and its traceback.
+    __slots__ = ('name', 'pos_start', 'pos_end', 'context')
+    
+    def __init__(self, name):
+        self.name = name or "<lambda>"
+        self.pos_start = None
+        self.pos_end = None
+        self.context = None
+
+    def set_pos(self, pos_start=None, pos_end=None):
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+        return self
+
+    def set_context(self, context=None):
+        self.context = context
+        return self
+        
+    def generate_new_context(self):
+        new_context = Context(self.name, self.context, self.pos_start)
+        new_context.symbol_table = SymbolTable(new_context.parent.symbol_table)
+        return new_context
+
+    def bind(self):
+        # Python callable taking a list of args, used by builtins that call
+        # the function once per element (map, filter, ...)
+        return self.execute
+    
+    def check_args(self, arg_names, args, optional_arg_names=[]):
+        res = RTResult()
+        if len(args) > len(arg_names) + len(optional_arg_names):
+            return res.failure(RTError(
+                self.pos_start, self.pos_end,
+                f"{len(args) - len(arg_names) - len(optional_arg_names)} too many args passed into '{self.name}'",
+                self.context
+            ))
+
+        if len(args) < len(arg_names):
+            return res.failure(RTError(
+                self.pos_start, self.pos_end,
+                f"{len(arg_names) - len(args)} too few args passed into '{self.name}'",
+                self.context
+            ))
+        return res.success(None)
+    
+    def populate_args(self, arg_names, args, exec_ctx, optional_arg_names=[]):
+        all_arg_names = arg_names + optional_arg_names
+        for i in range(len(args)):
+            arg_name = all_arg_names[i]
+            arg_value = args[i]
+            arg_value.set_context(exec_ctx)
+            exec_ctx.symbol_table.set(arg_name, arg_value)
+
+        # Missing optional args are bound to None so they do not resolve to a parent scope
+        for arg_name in all_arg_names[len(args):]:
+            exec_ctx.symbol_table.set(arg_name, None)
+            
+    def check_and_populate_args(self, arg_names, args, exec_ctx, optional_arg_names=[]):
+        res = RTResult()
+        res.register(self.check_args(arg_names, args, optional_arg_names))
+        if res.error: return res
+        self.populate_args(arg_names, args, exec_ctx, optional_arg_names)
+        return res.success(None)
+
+class Function(BaseFunction):
+    __slots__ = ('body_node', 'arg_names', 'is_generator')
+
+    def __init__(self, name, body_node, arg_names, is_generator=False):
+        super().__init__(name)
+        self.body_node = body_node
+        self.arg_names = arg_names
+        self.is_generator = is_generator
+
+    def execute(self, args):
+        res = RTResult()
+        interpreter = Interpreter()
+        exec_ctx = self.generate_new_context()
+
+        res.register(self.check_and_populate_args(self.arg_names, args, exec_ctx))
+        if res.error: return res
+
+        if self.is_generator:
+            return res.success(Generator(self.name, GeneratorFrame(self.body_node, exec_ctx)))
+
+        value = res.register(interpreter.visit(self.body_node, exec_ctx))
+        if res.error: return res
+        return res.success(value)
+
+    def bind(self):
+        # One frame is built and reused for every call; the locals of the
+        # previous call are dropped before the arguments are bound
+        if self.is_generator:
+            return self.execute
+
+        interpreter = Interpreter()
+        exec_ctx = self.generate_new_context()
+        symbol_table = exec_ctx.symbol_table
+        body_node = self.body_node
+        arg_names = self.arg_names
+
+        def call(args):
+            if len(args) != len(arg_names):
+                return self.execute(args)
+            symbol_table.reshape(None)
+            symbol_table.symbols.clear()
+            symbol_table.constants.clear()
+            symbol_table.var_types.clear()
+            symbol_table.imports = None
+            symbol_table.symbols.update(zip(arg_names, args))
+            return interpreter.visit(body_node, exec_ctx)
+        return call
+
+    def copy(self):
+        copy = Function(self.name, self.body_node, self.arg_names, self.is_generator)
+        copy.set_context(self.context)
+        copy.set_pos(self.pos_start, self.pos_end)
+        return copy
+
+    def __repr__(self):
+        return f"<function {self.name}>"
+    
+class Reference(Value):
+    # A variable, as the scope holding it and its name
+    __slots__ = ('symbol_table', 'name')
+
+    def __init__(self, symbol_table, name):
+        self.symbol_table = symbol_table
+        self.name = name
+
+    def get(self):
+        return self.symbol_table.symbols[self.name]
+
+    def copy(self):
+        return self
+
+    def __repr__(self):
+        return f"<reference {self.name}>"
+
+class Struct(BaseFunction):
+    # A declared struct. Calling it builds a record of its record_class, a
+    # Record subclass made per struct whose __slots__ are the fields, so a
+    # record holds only its field values.
+    __slots__ = ('record_class',)
+
+    def __init__(self, name, fields, record_class=None):
+        super().__init__(name)
+        if record_class is None:
+            slot_names = tuple(f'f{i}' for i in range(len(fields)))
+            record_class = type(name, (Record,), {'__slots__': slot_names})
+            record_class.fields = fields
+            record_class.offsets = {field: i for i, field in enumerate(fields)}
+            record_class.slots = [record_class.__dict__[slot_name] for slot_name in slot_names]
+        self.record_class = record_class
+
+    def execute(self, args):
+        res = RTResult()
+        fields = self.record_class.fields
+        res.register(self.check_args(fields, args))
+        if res.error: return res
+
+        record = self.record_class()
+        for slot, arg in zip(self.record_class.slots, args):
+            slot.__set__(record, arg)
+        return res.success(record)
+
+    def copy(self):
+        copy = Struct(self.name, self.record_class.fields, self.record_class)
+        copy.set_context(self.context)
+        copy.set_pos(self.pos_start, self.pos_end)
+        return copy
+
+    def __repr__(self):
+        return f"<struct {self.name}>"
+
+class Record(Value):
+    # Fields are read by offset through the slot descriptors of the struct's
+    # record_class; access nodes cache the offset for each record class.
+    __slots__ = ()
+
+    def field_offset(self, name):
+        offset = self.offsets.get(name)
+        if offset is None:
+            return None, RTError(None, None, f"'{type(self).__name__}' has no field '{name}'", None)
+        return offset, None
+
+    def is_true(self):
+        return True
+
+    def copy(self):
+        return self
+
+    def __str__(self):
+        values = ', '.join(f'{name}={slot.__get__(self)}' for name, slot in zip(self.fields, self.slots))
+        return f'{type(self).__name__}({values})'
+
+    def __repr__(self):
+        return self.__str__()
+
+class List(Value):
+    # Copy-on-write list. Versions made by '+', '-' and '*' share one buffer:
+    # a shared list is pinned to its own length and only reads buffer[:length],
+    # so a new version can append past it in place. The elements property
+    # hands out a plain Python list that is safe to mutate, copying the buffer
+    # only when it is pinned and something else still holds a reference to it.
+    __slots__ = ('buffer', 'length')
+
+    def __init__(self, elements, length=None):
+        self.buffer = elements
+        self.length = length
+
+    @property
+    def elements(self):
+        if self.length is not None:
+            if self.length != len(self.buffer) or sys.getrefcount(self.buffer) > 2:
+                self.buffer = self.buffer[:self.length]
+            self.length = None
+        return self.buffer
+
+    @elements.setter
+    def elements(self, elements):
+        self.buffer = elements
+        self.length = None
+
+    def items(self):
+        # Read-only view of the elements, may be shared with other lists
+        if self.length is None or self.length == len(self.buffer):
+            return self.buffer
+        return self.buffer[:self.length]
+
+    def pin(self):
+        if self.length is None:
+            self.length = len(self.buffer)
+        return self.buffer
+
+    def share(self):
+        # Pins this list and returns a buffer that may be extended past it
+        self.pin()
+        if self.length != len(self.buffer):
+            if sys.getrefcount(self.buffer) > 2:
+                self.buffer = self.buffer[:self.length]
+            else:
+                del self.buffer[self.length:]
+        return self.buffer
+        
+    def __len__(self):
+        return len(self.buffer) if self.length is None else self.length
+
+    def slice(self, key):
+        # Pinning makes the next mutation of this list copy its buffer
+        # while the view still holds it
+        return ListView(self.pin(), range(len(self))[key])
+    
+    def __sum__(self):
+        return sum(self.items())
+    
+    def __reversed__(self):
+        return reversed(self.items())
+        
+    def added_to(self, other):
+        buffer = self.share()
+        buffer.append(other)
+        return List(buffer, self.length + 1), None
+    
+    def __sort__(self):
+        return sorted(self.items())
+    
+    def subbed_by(self, other):
+        if isinstance(other, Number):
+            index = other.value
+            length = len(self)
+            if type(index) is not int or not -length <= index < length:
+                return None, RTError(
+                    None, None,
+                    'Element in this index cannot be removed from list because index is out of range',
+                    None
+                )
+
+            index %= length
+            if index == length - 1:
+                return List(self.pin(), length - 1), None
+            return List(self.buffer[:index] + self.buffer[index + 1:length]), None
+        else:
+            return None, Value.illegal_operation(self, other)
+    
+    def multed_by(self, other):
+        if isinstance(other, List):
+            other_elements = other.items()
+            buffer = self.share()
+            buffer.extend(other_elements)
+            return List(buffer, self.length + len(other_elements)), None
+        else:
+            return None, Value.illegal_operation(self, other)
+        
+    def dived_by(self, other):
+        if isinstance(other, Number):
+            index = other.value
+            length = len(self)
+            if type(index) is not int or not -length <= index < length:
+                return None, RTError(
+                    None, None,
+                    'Element in this index cannot be got from list because index is out of range',
+                    None
+                )
+            return self.buffer[index % length], None
+        else:
+            return None, Value.illegal_operation(self, other)
+        
+    def iterate(self):
+        if self.length is None:
+            return iter(self.buffer), None
+        return itertools.islice(self.buffer, self.length), None
+
+    def __str__(self):
+        return f'[{", ".join([str(x) for x in self.items()])}]'
+    
+    def __repr__(self):
+        return f'{", ".join([str(x) for x in self.items()])}'
+
+    def copy(self):
+        return List(self.pin(), self.length)
+
+class ListView(List):
+    # Slice of another list's buffer. Until something needs a buffer of its
+    # own, source and indices (a range over source) stand in for buffer and
+    # length; reading buffer or length copies the selected elements once.
+    __slots__ = ('source', 'indices')
+
+    def __init__(self, source, indices):
+        self.source = source
+        self.indices = indices
+
+    def __getattr__(self, name):
+        if name in ('buffer', 'length') and self.source is not None:
+            indices = self.indices
+            stop = indices.stop if indices.stop >= 0 else None
+            self.buffer = self.source[indices.start:stop:indices.step]
+            self.length = None
+            self.source = None
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    def __len__(self):
+        if self.source is None: return List.__len__(self)
+        return len(self.indices)
+
+    def slice(self, key):
+        if self.source is None: return List.slice(self, key)
+        return ListView(self.source, self.indices[key])
+
+    def dived_by(self, other):
+        if self.source is not None and isinstance(other, Number) and type(other.value) is int:
+            indices = self.indices
+            if -len(indices) <= other.value < len(indices):
+                return self.source[indices[other.value]], None
+        return List.dived_by(self, other)
+
+    def iterate(self):
+        if self.source is None: return List.iterate(self)
+        source = self.source
+        return (source[i] for i in self.indices), None
+
+    def copy(self):
+        if self.source is None: return List.copy(self)
+        return ListView(self.source, self.indices)
+
+class Map(Value):
+    # Keys are Number, String or Boolean values; they hash structurally
+    # (Number and String by value, Boolean by singleton identity), so the
+    # entries dict gives O(1) average lookups.
+    __slots__ = ('entries',)
+
+    def __init__(self, entries):
+        self.entries = entries
+
+    @staticmethod
+    def check_key(key):
+        if isinstance(key, (Number, String, Boolean)):
+            return None
+        return RTError(None, None, 'Map keys must be numbers, strings or booleans', None)
+
+    def get(self, key):
+        error = Map.check_key(key)
+        if error: return None, error
+        value = self.entries.get(key)
+        if value is None:
+            return None, RTError(None, None, f'Key {key!r} is not in map', None)
+        return value, None
+
+    def set(self, key, value):
+        error = Map.check_key(key)
+        if error: return error
+        self.entries[key] = value
+        return None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def iterate(self):
+        return iter(list(self.entries)), None
+
+    def is_true(self):
+        return len(self.entries) > 0
+
+    def copy(self):
+        return self
+
+    @staticmethod
+    def format(value):
+        return repr(value) if isinstance(value, String) else str(value)
+
+    def __str__(self):
+        return '{' + ', '.join(f'{Map.format(k)}: {Map.format(v)}' for k, v in self.entries.items()) + '}'
+
+    def __repr__(self):
+        return self.__str__()
+
+class Deque(Value):
+    # collections.deque: O(1) push and pop at both ends
+    __slots__ = ('items',)
+
+    def __init__(self, items):
+        self.items = items
+
+    def __len__(self):
+        return len(self.items)
+
+    def iterate(self):
+        return iter(list(self.items)), None
+
+    def is_true(self):
+        return len(self.items) > 0
+
+    def copy(self):
+        return self
+
+    def __str__(self):
+        return f'deque([{", ".join([str(x) for x in self.items])}])'
+
+    def __repr__(self):
+        return self.__str__()
+
+def order_key(value):
+    # Python value used to order F++ values, or None if they are unordered
+    if isinstance(value, (Number, Boolean)):
+        return value.value
+    if isinstance(value, String):
+        return value.value
+    return None
+
+def mixed_sort_key(value):
+    # Order of values of different types: booleans, numbers, strings, then
+    # any other value by type name and text
+    if isinstance(value, Boolean):
+        return (0, value.value)
+    if isinstance(value, Number):
+        return (1, value.value)
+    if isinstance(value, String):
+        return (2, value.value)
+    return (3, type(value).__name__, str(value))
+
+def sort_values(items, key_call=None, reverse=False):
+    # Sorts a Python list of values, returns (sorted list, error). Keys of
+    # one primitive type are unboxed once and sorted as raw values;
+    # mixed keys use mixed_sort_key.
+    keys = items
+    if key_call is not None:
+        keys = []
+        for item in items:
+            res = key_call([item])
+            if res.error: return None, res.error
+            keys.append(res.value)
+
+    kind = type(keys[0]) if keys else None
+    if kind in (Number, String, Boolean) and all(type(key) is kind for key in keys):
+        raw_keys = [key.value for key in keys]
+        if key_call is None:
+            return [kind(raw) for raw in sorted(raw_keys, reverse=reverse)], None
+    else:
+        raw_keys = [mixed_sort_key(key) for key in keys]
+
+    order = sorted(range(len(items)), key=raw_keys.__getitem__, reverse=reverse)
+    return [items[i] for i in order], None
+
+def bisect_values(items, value, right=False):
+    # Insertion point of value in items, a list sorted in sort() order
+    key = mixed_sort_key(value)
+    lo, hi = 0, len(items)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        mid_key = mixed_sort_key(items[mid])
+        if mid_key < key or (right and mid_key == key):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+class SortedSet(Value):
+    # Sorted list of distinct values with a parallel list of their
+    # mixed_sort_key keys, so lookups are a bisect over plain tuples
+    __slots__ = ('keys', 'items')
+
+    def __init__(self, values=()):
+        unique = {}
+        for value in values:
+            unique.setdefault(mixed_sort_key(value), value)
+        self.keys = sorted(unique)
+        self.items = [unique[key] for key in self.keys]
+
+    def index(self, value):
+        key = mixed_sort_key(value)
+        i = bisect.bisect_left(self.keys, key)
+        return i, i < len(self.keys) and self.keys[i] == key
+
+    def add(self, value):
+        i, found = self.index(value)
+        if found: return False
+        self.keys.insert(i, mixed_sort_key(value))
+        self.items.insert(i, value)
+        return True
+
+    def remove(self, value):
+        i, found = self.index(value)
+        if not found: return False
+        del self.keys[i]
+        del self.items[i]
+        return True
+
+    def has(self, value):
+        return self.index(value)[1]
+
+    def range(self, low, high):
+        # Values v with low <= v < high
+        start = bisect.bisect_left(self.keys, mixed_sort_key(low))
+        end = bisect.bisect_left(self.keys, mixed_sort_key(high))
+        return self.items[start:end]
+
+    def __len__(self):
+        return len(self.items)
+
+    def iterate(self):
+        return iter(list(self.items)), None
+
+    def is_true(self):
+        return len(self.items) > 0
+
+    def copy(self):
+        return self
+
+    def __str__(self):
+        return f'sortedset([{", ".join([str(x) for x in self.items])}])'
+
+    def __repr__(self):
+        return self.__str__()
+
+class Heap(Value):
+    # Min-heap of (key, seq, value) entries kept with heapq. seq keeps equal
+    # keys in insertion order and stops heapq from comparing the values.
+    __slots__ = ('entries', 'key_func', 'counter')
+
+    def __init__(self, key_func=None):
+        self.entries = []
+        self.key_func = key_func
+        self.counter = itertools.count()
+
+    def push(self, value):
+        key = value
+        if self.key_func is not None:
+            res = self.key_func.execute([value])
+            if res.error: return res.error
+            key = res.value
+
+        raw = order_key(key)
+        if raw is None:
+            return RTError(None, None, 'Heap keys must be numbers or strings', None)
+        if self.entries and isinstance(raw, str) != isinstance(self.entries[0][0], str):
+            return RTError(None, None, 'Heap keys must be all numbers or all strings', None)
+
+        heapq.heappush(self.entries, (raw, next(self.counter), value))
+        return None
+
+    def pop(self):
+        if not self.entries:
+            return None, RTError(None, None, 'Heap is empty', None)
+        return heapq.heappop(self.entries)[2], None
+
+    def peek(self):
+        if not self.entries:
+            return None, RTError(None, None, 'Heap is empty', None)
+        return self.entries[0][2], None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def iterate(self):
+        return (entry[2] for entry in sorted(self.entries)), None
+
+    def is_true(self):
+        return len(self.entries) > 0
+
+    def copy(self):
+        return self
+
+    def __str__(self):
+        return f'heap([{", ".join([str(entry[2]) for entry in sorted(self.entries)])}])'
+
+    def __repr__(self):
+        return self.__str__()
+    
+class TypedArray(Value):
+    # Numeric array in a contiguous array.array buffer: typecode 'q' for
+    # intarr and 'd' for floatarr. Elements are boxed only when read.
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __len__(self):
+        return len(self.data)
+
+    def type_name(self):
+        return 'intarr' if self.data.typecode == 'q' else 'floatarr'
+
+    def slice(self, key):
+        return TypedArray(self.data[key])
+
+    def raw(self, value):
+        # Unboxed form of value for this buffer, or None if it does not fit
+        if not isinstance(value, Number):
+            return None
+        if self.data.typecode == 'd':
+            return float(value.value)
+        if isinstance(value.value, int) and -2 ** 63 <= value.value < 2 ** 63:
+            return value.value
+        return None
+
+    def added_to(self, other):
+        raw = self.raw(other)
+        if raw is None:
+            return None, Value.illegal_operation(self, other)
+        data = array.array(self.data.typecode, self.data)
+        data.append(raw)
+        return TypedArray(data), None
+
+    def subbed_by(self, other):
+        if isinstance(other, Number):
+            index = other.value
+            length = len(self.data)
+            if type(index) is not int or not -length <= index < length:
+                return None, RTError(
+                    None, None,
+                    'Element in this index cannot be removed from list because index is out of range',
+                    None
+                )
+            index %= length
+            return TypedArray(self.data[:index] + self.data[index + 1:]), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def multed_by(self, other):
+        if isinstance(other, (TypedArray, List)):
+            other_array, error = make_typed_array(self.data.typecode, other)
+            if error: return None, error
+            return TypedArray(self.data + other_array.data), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def dived_by(self, other):
+        if isinstance(other, Number):
+            index = other.value
+            length = len(self.data)
+            if type(index) is not int or not -length <= index < length:
+                return None, RTError(
+                    None, None,
+                    'Element in this index cannot be got from list because index is out of range',
+                    None
+                )
+            return Number(self.data[index]), None
+        else:
+            return None, Value.illegal_operation(self, other)
+
+    def iterate(self):
+        return map(Number, self.data), None
+
+    def is_true(self):
+        return len(self.data) > 0
+
+    def copy(self):
+        return self
+
+    def __str__(self):
+        return f'[{", ".join([str(x) for x in self.data])}]'
+
+    def __repr__(self):
+        return f'{", ".join([str(x) for x in self.data])}'
+
+def make_typed_array(typecode, value):
+    if isinstance(value, TypedArray):
+        if value.data.typecode == typecode:
+            return value, None
+        if typecode == 'd':
+            return TypedArray(array.array('d', value.data)), None
+
+    if isinstance(value, Range) and typecode == 'q' and all(isinstance(x, int) for x in (value.start, value.end, value.step)):
+        return TypedArray(array.array('q', range(value.start, value.end, value.step))), None
+
+    typed_array = TypedArray(array.array(typecode))
+    iterator, error = value.iterate()
+    if error:
+        return None, RTError(None, None, f"Expected a list of numbers for {typed_array.type_name()}", None)
+
+    for element in iterator:
+        raw = typed_array.raw(element)
+        if raw is None:
+            expected = 'integers' if typecode == 'q' else 'numbers'
+            return None, RTError(None, None, f"Expected {expected} for {typed_array.type_name()}", None)
+        typed_array.data.append(raw)
+    if getattr(iterator, 'error', None): return None, iterator.error
+
+    return typed_array, None
+
+class Range(Value):
+    __slots__ = ('start', 'end', 'step')
+
+    def __init__(self, start, end, step=1):
+        self.start = start
+        self.end = end
+        self.step = step
+
+    def __len__(self):
+        return max(0, math.ceil((self.end - self.start) / self.step))
+
+    def slice(self, key):
+        indices = range(len(self))[key]
+        step = self.step
+        return Range(self.start + indices.start * step, self.start + indices.stop * step, step * indices.step)
+
+    def iterate(self):
+        if all(isinstance(x, int) for x in (self.start, self.end, self.step)):
+            return (Number(i) for i in range(self.start, self.end, self.step)), None
+        return self.generate(), None
+
+    def generate(self):
+        i = self.start
+        while (i < self.end) if self.step > 0 else (i > self.end):
+            yield Number(i)
+            i += self.step
+
+    def is_true(self):
+        return len(self) > 0
+
+    def copy(self):
+        return self
+
+    def __repr__(self):
+        return f'range({self.start}, {self.end}, {self.step})'
+
+class GeneratorFrame:
+    def __init__(self, body_node, context):
+        self.steps = GeneratorInterpreter().step(body_node, context)
+        self.error = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.steps is None:
+            raise StopIteration
+
+        try:
+            return next(self.steps)
+        except StopIteration as stop:
+            self.steps = None
+            if stop.value and stop.value.error:
+                self.error = stop.value.error
+            raise
+
+class Generator(Value):
+    __slots__ = ('name', 'frame')
+
+    def __init__(self, name, frame):
+        self.name = name
+        self.frame = frame
+
+    def iterate(self):
+        return self.frame, None
+
+    def is_true(self):
+        return True
+
+    def copy(self):
+        return self
+
+    def __repr__(self):
+        return f'<generator {self.name}>'
+
+class BuiltInFunction(BaseFunction):
+    __slots__ = ()
+
+    def __init__(self, name):
+        super().__init__(name)
+        
+    def execute(self, args):
+        res = RTResult()
+        exec_ctx = self.generate_new_context()
+        
+        method_name = f'execute_{self.name}'
+        method = getattr(self, method_name, self.no_visit_method)
+        
+        optional_arg_names = getattr(method, 'optional_arg_names', [])
+        res.register(self.check_and_populate_args(method.arg_names, args, exec_ctx, optional_arg_names))
+        if res.error: return res
+        
+        return_value = res.register(method(exec_ctx))
+        if res.error: return res
+        return res.success(return_value)
+    
+    def no_visit_method(self, node, context):
+        raise Exception(f'No execute_{self.name} method defined')
+
+    def bind(self):
+        # Builtins in NATIVE_BUILTINS run without a frame; the others get
+        # one frame that is reused for every call
+        native = NATIVE_BUILTINS.get(self.name)
+        method = getattr(self, f'execute_{self.name}', self.no_visit_method)
+        optional_arg_names = getattr(method, 'optional_arg_names', [])
+        exec_ctx = self.generate_new_context()
+
+        def call(args):
+            if native is not None and len(args) == 1:
+                value = native(args[0])
+                if value is not None: return RTResult().success(value)
+
+            res = RTResult()
+            res.register(self.check_and_populate_args(method.arg_names, args, exec_ctx, optional_arg_names))
+            if res.error: return res
+            return method(exec_ctx)
+        return call
+    
+    def copy(self):
+        copy = BuiltInFunction(self.name)
+        copy.set_context(self.context)
+        copy.set_pos(self.pos_start,self.pos_end)
+        return copy
+    
+    def __repr__(self):
+        return f'<built-in function {self.name}>'
+    
+    ##############################################################
+    
+    def execute_write(self, exec_ctx):
+        print(str(exec_ctx.symbol_table.get('value')))
+        return RTResult().success(Number.null)
+    execute_write.arg_names = ['value']  
+    
+    def execute_return_(self, exec_ctx):
+        return RTResult().success(exec_ctx.symbol_table.get('value'))
+    execute_return_.arg_names = ['value'] 
+    
+    def execute_tostr(self, exec_ctx):
+        value = exec_ctx.symbol_table.get('value')
+        if isinstance(value, String):
+            return RTResult().success(value)
+        return RTResult().success(String(str(value)))
+    execute_tostr.arg_names = ['value']  
+    
+    def execute_input(self, exec_ctx):
+        text = input()
+        return RTResult().success(String(text))
+    execute_input.arg_names = []  
+    
+    def execute_inputn(self, exec_ctx):
+        while True:
+            text = input()
+            try:
+                number = int(text)
+                break
+            except ValueError:
+                print(f"'{text}' must be integer. Try again!")
+        return RTResult().success(Number(number))
+    execute_inputn.arg_names = [] 
+    
+    def execute_is_num(self, exec_ctx):
+        is_num = isinstance(exec_ctx.symbol_table.get("value"), Number)
+        return RTResult().success(Boolean(is_num))
+    execute_is_num.arg_names = ['value']
+
+    def execute_is_str(self, exec_ctx):
+        is_str = isinstance(exec_ctx.symbol_table.get("value"), String)
+        return RTResult().success(Boolean(is_str))
+    execute_is_str.arg_names = ['value']
+
+    def execute_is_array(self, exec_ctx):
+        is_array = isinstance(exec_ctx.symbol_table.get("value"), (List, TypedArray))
+        return RTResult().success(Boolean(is_array))
+    execute_is_array.arg_names = ['value']
+    
+    def execute_append(self, exec_ctx):
+        list_ = exec_ctx.symbol_table.get("list")
+        value = exec_ctx.symbol_table.get("value")
+
+        if isinstance(list_, TypedArray):
+            raw = list_.raw(value)
+            if raw is None:
+                return RTResult().failure(RTError(
+                    self.pos_start, self.pos_end,
+                    f"Value does not fit in {list_.type_name()}",
+                    exec_ctx
+                ))
+            list_.data.append(raw)
+            return RTResult().success(Number.null)
+
+        if isinstance(list_, Deque):
+            list_.items.append(value)
+            return RTResult().success(Number.null)
+        
+        if not isinstance(list_ , List):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Firts argument must be a list",
+                exec_ctx
+            ))
+            
+        list_.elements.append(value)
+        return RTResult().success(Number.null)
+    execute_append.arg_names = ['list', 'value']
+    
+    def execute_pop(self, exec_ctx):
+        list_ = exec_ctx.symbol_table.get("list")
+        index = exec_ctx.symbol_table.get("index")
+        
+        if not isinstance(list_ , (List, TypedArray, Deque)):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Firts argument must be a list",
+                exec_ctx
+            ))
+            
+        if not isinstance(index , Number):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Second argument must be a number",
+                exec_ctx
+            ))    
+            
+        try:
+            if isinstance(list_, TypedArray):
+                element = Number(list_.data.pop(index.value))
+            elif isinstance(list_, Deque):
+                if index.value == 0:
+                    element = list_.items.popleft()
+                elif index.value == -1:
+                    element = list_.items.pop()
+                else:
+                    element = list_.items[index.value]
+                    del list_.items[index.value]
+            else:
+                element = list_.elements.pop(index.value)
+        except:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Element with this index could not be removed because index out of range!",
+                exec_ctx
+            ))
+        return RTResult().success(element)
+    execute_pop.arg_names = ['list', 'index']
+    
+    def execute_collect(self, exec_ctx):
+        listA = exec_ctx.symbol_table.get("listA")
+        listB = exec_ctx.symbol_table.get("listB")
+        
+        if not isinstance(listA , List):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Firts argument must be a list",
+                exec_ctx
+            ))
+            
+        if not isinstance(listB , List):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Second argument must be a list",
+                exec_ctx
+            ))
+            
+        listA.elements.extend(listB.elements)
+        return RTResult().success(Number.null)    
+    execute_collect.arg_names = ["listA", "listB"]    
+    
+    def execute_unite(self, exec_ctx):
+        listA = exec_ctx.symbol_table.get("listA")
+        listB = exec_ctx.symbol_table.get("listB")
+        
+        if not isinstance(listA , List):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Firts argument must be a list",
+                exec_ctx
+            ))
+            
+        if not isinstance(listB , List):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Second argument must be a list",
+                exec_ctx
+            ))
+            
+        listC = List(listA.items() + listB.items())
+        return RTResult().success(listC)    
+    execute_unite.arg_names = ["listA", "listB"] 
+    
+    def execute_exit(self, exec_ctx):
+        index = exec_ctx.symbol_table.get('index')
+        if isinstance(index, Number):
+            if index.value == 1:
+                sys.exit(1)
+            if index.value == 0:
+                pass
+            else:
+                return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "This function accepts only 1 or 0!",
+                exec_ctx
+            ))
+        else:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Index is not number",
+                exec_ctx
+            ))
+        return RTResult().success(None)    
+    execute_exit.arg_names = ['index']
+    
+    def execute_len(self, exec_ctx):
+        list_ = exec_ctx.symbol_table.get("list_")
+
+        if isinstance(list_, Generator):
+            count = 0
+            for _ in list_.frame:
+                count += 1
+            if list_.frame.error: return RTResult().failure(list_.frame.error)
+            return RTResult().success(Number(count))
+        
+        if not isinstance(list_ , (List, Range, TypedArray, String, Map, Deque, Heap, SortedSet)):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a list or string",
+                exec_ctx
+            ))
+            
+        return RTResult().success(Number(len(list_)))
+            
+    execute_len.arg_names = ['list_']
+    
+    def execute_sqrt(self, exec_ctx):
+        num = exec_ctx.symbol_table.get("num")
+        
+        if not isinstance(num , Number):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a num",
+                exec_ctx
+            ))
+            
+        return RTResult().success(Number(math.sqrt(num.value)))
+            
+    execute_sqrt.arg_names = ['num']
+    
+    def execute_abs(self, exec_ctx):
+        num = exec_ctx.symbol_table.get("num")
+        
+        if not isinstance(num , Number):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a num",
+                exec_ctx
+            ))
+            
+        return RTResult().success(Number(abs(num.value)))
+            
+    execute_abs.arg_names = ['num']
+    
+    def execute_round(self, exec_ctx):
+        num = exec_ctx.symbol_table.get("num")
+        
+        if not isinstance(num , Number):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a num",
+                exec_ctx
+            ))
+            
+        return RTResult().success(Number(round(num.value)))
+            
+    execute_round.arg_names = ['num']
+    
+
+    
+    def execute_root(self, exec_ctx):
+        num1 = exec_ctx.symbol_table.get("num1")
+        num2 = exec_ctx.symbol_table.get("num2")
+        
+        if not isinstance(num1 , Number):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a num",
+                exec_ctx
+            ))
+            
+        if not isinstance(num2 , Number):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Second argument must be a num",
+                exec_ctx
+            ))
+            
+        return RTResult().success(Number(math.pow(num1.value, 1 / num2.value)))
+            
+    execute_root.arg_names = ['num1', 'num2']
+    
+    def execute_reverse(self, exec_ctx):
+        list_ = exec_ctx.symbol_table.get("list_")
+
+        if isinstance(list_, TypedArray):
+            return RTResult().success(TypedArray(list_.data[::-1]))
+        
+        if not isinstance(list_ , List):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a list",
+                exec_ctx
+            ))
+        rev_el = list(reversed(list_.items()))
+        return RTResult().success(List(rev_el).set_context(exec_ctx).set_pos(self.pos_start, self.pos_end))
+            
+    execute_reverse.arg_names = ['list_']
+    
+    def execute_sum(self, exec_ctx):
+        list_ = exec_ctx.symbol_table.get("list_")
+
+        if isinstance(list_, TypedArray):
+            return RTResult().success(Number(sum(list_.data)))
+        
+        if not isinstance(list_ , (List, Range, Generator)):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a list",
+                exec_ctx
+            ))
+        
+        iterator, _ = list_.iterate()
+        total = Number(0)
+        for element in iterator:
+            if not isinstance(element, Number):
+                return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "All elements must be numbers",
+                exec_ctx
+            ))
+            total, _ = total.added_to(element)
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+    
+        return RTResult().success(total)
+            
+    execute_sum.arg_names = ['list_']
+    
+    def execute_type(self, exec_ctx):
+        value = exec_ctx.symbol_table.get("value")
+        value_ = "undefined"
+        if isinstance(value, Number):
+            if value.is_float():
+                value_ = "float"
+            else:
+                value_ = "int"
+        elif isinstance(value, String):
+            value_ = "string"
+        elif isinstance(value, Boolean):
+            value_ = "bool"
+        elif isinstance(value, List):
+            value_ = "array"
+        elif isinstance(value, TypedArray):
+            value_ = value.type_name()
+        elif isinstance(value, Range):
+            value_ = "range"
+        elif isinstance(value, Generator):
+            value_ = "generator"
+        elif isinstance(value, Map):
+            value_ = "map"
+        elif isinstance(value, Deque):
+            value_ = "deque"
+        elif isinstance(value, Heap):
+            value_ = "heap"
+        elif isinstance(value, SortedSet):
+            value_ = "sortedset"
+        elif isinstance(value, Record):
+            value_ = type(value).__name__
+        elif isinstance(value, Struct):
+            value_ = "struct"
+        elif isinstance(value, Function):
+            value_ = "function"
+        else:
+            value_ = "undefined"
+        
+        return RTResult().success(String(value_).set_context(exec_ctx).set_pos(self.pos_start, self.pos_end))
+    execute_type.arg_names = ['value']
+    
+    def sort_args(self, exec_ctx):
+        key = exec_ctx.symbol_table.get("key")
+        reverse = exec_ctx.symbol_table.get("reverse")
+
+        if isinstance(key, Number) and key.value == 0:
+            key = None
+        if key is not None and not isinstance(key, BaseFunction):
+            return None, False, RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Key must be a function or null",
+                exec_ctx
+            ))
+        return (key.bind() if key else None), (reverse is not None and reverse.is_true()), None
+
+    def execute_sort(self, exec_ctx):
+        list_ = exec_ctx.symbol_table.get("list_")
+        key_call, reverse, failure = self.sort_args(exec_ctx)
+        if failure: return failure
+
+        if isinstance(list_, TypedArray) and key_call is None:
+            return RTResult().success(TypedArray(array.array(list_.data.typecode, sorted(list_.data, reverse=reverse))))
+        
+        if not isinstance(list_ , (List, Range, Generator, TypedArray)):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a list",
+                exec_ctx
+            ))
+        iterator, _ = list_.iterate()
+        items = list(iterator)
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+
+        sort_el, error = sort_values(items, key_call, reverse)
+        if error: return RTResult().failure(error)
+        if isinstance(list_, TypedArray):
+            return RTResult().success(TypedArray(array.array(list_.data.typecode, [x.value for x in sort_el])))
+        return RTResult().success(List(sort_el).set_context(exec_ctx).set_pos(self.pos_start, self.pos_end))
+            
+    execute_sort.arg_names = ['list_']
+    execute_sort.optional_arg_names = ['key', 'reverse']
+
+    def execute_sort_inplace(self, exec_ctx):
+        list_ = exec_ctx.symbol_table.get("list_")
+        key_call, reverse, failure = self.sort_args(exec_ctx)
+        if failure: return failure
+
+        if isinstance(list_, TypedArray) and key_call is None:
+            list_.data[:] = array.array(list_.data.typecode, sorted(list_.data, reverse=reverse))
+            return RTResult().success(Number.null)
+
+        if not isinstance(list_ , (List, TypedArray)):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a list",
+                exec_ctx
+            ))
+
+        iterator, _ = list_.iterate()
+        sort_el, error = sort_values(list(iterator), key_call, reverse)
+        if error: return RTResult().failure(error)
+        if isinstance(list_, TypedArray):
+            list_.data[:] = array.array(list_.data.typecode, [x.value for x in sort_el])
+        else:
+            list_.elements[:] = sort_el
+        return RTResult().success(Number.null)
+    execute_sort_inplace.arg_names = ['list_']
+    execute_sort_inplace.optional_arg_names = ['key', 'reverse']
+    
+    def execute_sleep(self, exec_ctx):
+        sec = exec_ctx.symbol_table.get("sec")
+        
+        if not isinstance(sec , Number):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be number (sleep works with seconds)",
+                exec_ctx
+            ))
+        try:
+            if not sec.value >= 0: raise ValueError
+            time.sleep(sec.value)
+        except (ValueError, OverflowError):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a non-negative number of seconds",
+                exec_ctx
+            ))
+        return RTResult().success(Number.null)
+    execute_sleep.arg_names = ['sec']
+    
+    def execute_random(self, exec_ctx):
+        return RTResult().success(Number(random.random()))
+    execute_random.arg_names = []
+    
+    def execute_now(self, exec_ctx):
+        current_time = time.localtime()
+        formatted_time = time.strftime("%Y-%m-%d %H:%M:%S", current_time)
+        return RTResult().success(String(formatted_time))
+    execute_now.arg_names = []
+    
+    def execute_id(self, exec_ctx):
+        value = exec_ctx.symbol_table.get("value")
+        
+        if value is None:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument 'value' is missing",
+                exec_ctx
+            ))
+        
+        if isinstance(value, (Number, String, List, TypedArray, Boolean, Range, Generator, Function, BaseFunction)):
+            return RTResult().success(String(str(id(value))))
+        else:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                f"Cannot get id of type {type(value).__name__}",
+                exec_ctx
+            ))
+            
+        return RTResult().success(String(str(id(value))))
+    execute_id.arg_names = ['value']
+    
+    def execute_random_num(self, exec_ctx):
+        a = exec_ctx.symbol_table.get("a")
+        b = exec_ctx.symbol_table.get("b")
+        
+        if not isinstance(a , Number):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a num",
+                exec_ctx
+            ))
+            
+        if not isinstance(b , Number):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Second argument must be a num",
+                exec_ctx
+            ))
+        try:
+            return RTResult().success(Number(random.randint(int(a.value), int(b.value))))
+        except (ValueError, OverflowError):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Arguments must be finite and the first must not be greater than the second",
+                exec_ctx
+            ))
+    execute_random_num.arg_names = ['a', 'b']
+    
+    def execute_split(self, exec_ctx):
+        string = exec_ctx.symbol_table.get("string")
+        sep = exec_ctx.symbol_table.get("sep")
+        
+        if not isinstance(string, String):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a string",
+                exec_ctx
+            ))
+            
+        if not isinstance(sep, String):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Second argument must be a string",
+                exec_ctx
+            ))
+            
+        return RTResult().success(List([String(x) for x in string.value.split(sep.value)]))
+    execute_split.arg_names = ['string', 'sep']
+    
+    def execute_swap(self, exec_ctx):
+        ref1 = exec_ctx.symbol_table.get("value1")
+        ref2 = exec_ctx.symbol_table.get("value2")
+        
+        if not isinstance(ref1, Reference) or not isinstance(ref2, Reference):
+                return RTResult().failure(RTError(
+                    self.pos_start, self.pos_end,
+                    "Arguments must be variables",
+                    exec_ctx
+                ))
+
+        if ref1.symbol_table.is_constant(ref1.name) or ref2.symbol_table.is_constant(ref2.name):
+                return RTResult().failure(RTError(
+                    self.pos_start, self.pos_end,
+                    "Cannot swap a constant",
+                    exec_ctx
+                ))
+            
+        value1, value2 = ref1.get(), ref2.get()
+        ref1.symbol_table.set(ref1.name, value2)
+        ref2.symbol_table.set(ref2.name, value1)
+
+        return RTResult().success(Number.null)
+
+    execute_swap.arg_names = ['value1', 'value2']
+    
+    
+    def execute_comp(self, exec_ctx):
+        value1 = exec_ctx.symbol_table.get("value1")
+        value2 = exec_ctx.symbol_table.get("value2")
+        
+        if value1 is None:
+                return RTResult().failure(RTError(
+                    self.pos_start, self.pos_end,
+                    "Argument 'value' is missing",
+                    exec_ctx
+                ))
+                
+        if value2 is None:
+                return RTResult().failure(RTError(
+                    self.pos_start, self.pos_end,
+                    "Argument 'value' is missing",
+                    exec_ctx
+                ))
+        
+        if value1 == value2:
+            return RTResult().success(Boolean(True))
+        else:
+            return RTResult().success(Boolean(False))
+        
+    execute_comp.arg_names = ['value1', 'value2']
+    
+    def execute_gc_clean(self, exec_ctx):
+        gc.collect()
+        return RTResult().success(Number.null)
+    execute_gc_clean.arg_names = []
+    
+    def execute_gc_count(self, exec_ctx):
+        return RTResult().success(Number(gc.collect()))
+    execute_gc_count.arg_names = []
+    
+    def execute_del_(self, exec_ctx):
+        ref = exec_ctx.symbol_table.get('value')
+    
+        if not isinstance(ref, Reference):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a variable",
+                exec_ctx
+            ))
+        
+        var_name = ref.name
+        if ref.symbol_table.remove(var_name):
+            return RTResult().success(String(f"deleted {var_name}"))
+        else:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                f"Variable '{var_name}' not found",
+                exec_ctx
+            ))
+
+    execute_del_.arg_names = ['value']
+    
+    def execute_os_name(self, exec_ctx):
+        return RTResult().success(String(os.name))
+    execute_os_name.arg_names = []
+    
+    def execute_range(self, exec_ctx):
+        start = exec_ctx.symbol_table.get("start")
+        end = exec_ctx.symbol_table.get("end")
+        step = exec_ctx.symbol_table.get("step")
+
+        if not isinstance(start, Number) or not isinstance(end, Number):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Start and end must be numbers",
+                exec_ctx
+            ))
+
+        if step is None:
+            step = Number(1)
+        elif not isinstance(step, Number) or step.value == 0:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Step must be a non-zero number",
+                exec_ctx
+            ))
+
+        return RTResult().success(Range(start.value, end.value, step.value))
+    execute_range.arg_names = ['start', 'end']
+    execute_range.optional_arg_names = ['step']
+
+    def bind_and_iterate(self, exec_ctx):
+        # Shared argument handling of map, filter, reduce, any, all and count
+        func = exec_ctx.symbol_table.get("func")
+        list_ = exec_ctx.symbol_table.get("list_")
+
+        if not isinstance(func, BaseFunction):
+            return None, None, RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a function",
+                exec_ctx
+            ))
+
+        iterator, error = list_.iterate()
+        if error: return None, None, RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        return func.bind(), iterator, None
+
+    def execute_map(self, exec_ctx):
+        call, iterator, failure = self.bind_and_iterate(exec_ctx)
+        if failure: return failure
+
+        elements = []
+        for element in iterator:
+            res = call([element])
+            if res.error: return res
+            elements.append(res.value)
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+        return RTResult().success(List(elements))
+    execute_map.arg_names = ['func', 'list_']
+
+    def execute_filter(self, exec_ctx):
+        call, iterator, failure = self.bind_and_iterate(exec_ctx)
+        if failure: return failure
+
+        elements = []
+        for element in iterator:
+            res = call([element])
+            if res.error: return res
+            if res.value.is_true():
+                elements.append(element)
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+        return RTResult().success(List(elements))
+    execute_filter.arg_names = ['func', 'list_']
+
+    def execute_reduce(self, exec_ctx):
+        call, iterator, failure = self.bind_and_iterate(exec_ctx)
+        if failure: return failure
+
+        result = exec_ctx.symbol_table.get("initial")
+        if result is None:
+            result = next(iterator, None)
+            if result is None:
+                if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+                return RTResult().failure(RTError(
+                    self.pos_start, self.pos_end,
+                    "Cannot reduce an empty list without an initial value",
+                    exec_ctx
+                ))
+
+        for element in iterator:
+            res = call([result, element])
+            if res.error: return res
+            result = res.value
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+        return RTResult().success(result)
+    execute_reduce.arg_names = ['func', 'list_']
+    execute_reduce.optional_arg_names = ['initial']
+
+    def execute_any(self, exec_ctx):
+        call, iterator, failure = self.bind_and_iterate(exec_ctx)
+        if failure: return failure
+
+        for element in iterator:
+            res = call([element])
+            if res.error: return res
+            if res.value.is_true():
+                return RTResult().success(Boolean.true)
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+        return RTResult().success(Boolean.false)
+    execute_any.arg_names = ['func', 'list_']
+
+    def execute_all(self, exec_ctx):
+        call, iterator, failure = self.bind_and_iterate(exec_ctx)
+        if failure: return failure
+
+        for element in iterator:
+            res = call([element])
+            if res.error: return res
+            if not res.value.is_true():
+                return RTResult().success(Boolean.false)
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+        return RTResult().success(Boolean.true)
+    execute_all.arg_names = ['func', 'list_']
+
+    def execute_count(self, exec_ctx):
+        call, iterator, failure = self.bind_and_iterate(exec_ctx)
+        if failure: return failure
+
+        count = 0
+        for element in iterator:
+            res = call([element])
+            if res.error: return res
+            if res.value.is_true():
+                count += 1
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+        return RTResult().success(Number(count))
+    execute_count.arg_names = ['func', 'list_']
+
+    def execute_bisect(self, exec_ctx, right):
+        list_ = exec_ctx.symbol_table.get("list_")
+        value = exec_ctx.symbol_table.get("value")
+
+        if isinstance(list_, TypedArray):
+            raw = list_.raw(value)
+            if raw is None:
+                return RTResult().failure(RTError(
+                    self.pos_start, self.pos_end,
+                    f"Value does not fit in {list_.type_name()}",
+                    exec_ctx
+                ))
+            search = bisect.bisect_right if right else bisect.bisect_left
+            return RTResult().success(Number(search(list_.data, raw)))
+
+        if not isinstance(list_, List):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a sorted list",
+                exec_ctx
+            ))
+        return RTResult().success(Number(bisect_values(list_.items(), value, right)))
+
+    def execute_bisect_left(self, exec_ctx):
+        return self.execute_bisect(exec_ctx, False)
+    execute_bisect_left.arg_names = ['list_', 'value']
+
+    def execute_bisect_right(self, exec_ctx):
+        return self.execute_bisect(exec_ctx, True)
+    execute_bisect_right.arg_names = ['list_', 'value']
+
+    def execute_insort(self, exec_ctx):
+        res = RTResult()
+        index = res.register(self.execute_bisect(exec_ctx, True))
+        if res.error: return res
+
+        list_ = exec_ctx.symbol_table.get("list_")
+        value = exec_ctx.symbol_table.get("value")
+        if isinstance(list_, TypedArray):
+            list_.data.insert(index.value, list_.raw(value))
+        else:
+            list_.elements.insert(index.value, value)
+        return res.success(Number.null)
+    execute_insort.arg_names = ['list_', 'value']
+
+    def execute_sortedset(self, exec_ctx):
+        items = exec_ctx.symbol_table.get("items")
+        if items is None:
+            return RTResult().success(SortedSet())
+
+        iterator, error = items.iterate()
+        if error: return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        sorted_set = SortedSet(iterator)
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+        return RTResult().success(sorted_set)
+    execute_sortedset.arg_names = []
+    execute_sortedset.optional_arg_names = ['items']
+
+    def sortedset_arg(self, exec_ctx):
+        sorted_set = exec_ctx.symbol_table.get("set")
+        if not isinstance(sorted_set, SortedSet):
+            return None, RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a sortedset",
+                exec_ctx
+            ))
+        return sorted_set, None
+
+    def execute_sortedset_add(self, exec_ctx):
+        sorted_set, failure = self.sortedset_arg(exec_ctx)
+        if failure: return failure
+        return RTResult().success(Boolean(sorted_set.add(exec_ctx.symbol_table.get("value"))))
+    execute_sortedset_add.arg_names = ['set', 'value']
+
+    def execute_sortedset_remove(self, exec_ctx):
+        sorted_set, failure = self.sortedset_arg(exec_ctx)
+        if failure: return failure
+        return RTResult().success(Boolean(sorted_set.remove(exec_ctx.symbol_table.get("value"))))
+    execute_sortedset_remove.arg_names = ['set', 'value']
+
+    def execute_sortedset_has(self, exec_ctx):
+        sorted_set, failure = self.sortedset_arg(exec_ctx)
+        if failure: return failure
+        return RTResult().success(Boolean(sorted_set.has(exec_ctx.symbol_table.get("value"))))
+    execute_sortedset_has.arg_names = ['set', 'value']
+
+    def execute_sortedset_range(self, exec_ctx):
+        sorted_set, failure = self.sortedset_arg(exec_ctx)
+        if failure: return failure
+        return RTResult().success(List(sorted_set.range(exec_ctx.symbol_table.get("low"), exec_ctx.symbol_table.get("high"))))
+    execute_sortedset_range.arg_names = ['set', 'low', 'high']
+
+    def execute_slice(self, exec_ctx):
+        value = exec_ctx.symbol_table.get("value")
+        bounds = [exec_ctx.symbol_table.get(name) for name in ("start", "end", "step")]
+
+        if not isinstance(value, (List, String, TypedArray, Range)):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a list, string, array or range",
+                exec_ctx
+            ))
+
+        if not all(bound is None or (isinstance(bound, Number) and type(bound.value) is int) for bound in bounds):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Start, end and step must be integers",
+                exec_ctx
+            ))
+
+        start, end, step = [None if bound is None else bound.value for bound in bounds]
+        if step == 0:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Step must not be zero",
+                exec_ctx
+            ))
+
+        return RTResult().success(value.slice(slice(start, end, step)))
+    execute_slice.arg_names = ['value', 'start']
+    execute_slice.optional_arg_names = ['end', 'step']
+
+    def execute_deque(self, exec_ctx):
+        items = exec_ctx.symbol_table.get("items")
+        if items is None:
+            return RTResult().success(Deque(collections.deque()))
+
+        iterator, error = items.iterate()
+        if error: return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        deque = Deque(collections.deque(iterator))
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+        return RTResult().success(deque)
+    execute_deque.arg_names = []
+    execute_deque.optional_arg_names = ['items']
+
+    def deque_arg(self, exec_ctx):
+        deque = exec_ctx.symbol_table.get("deque")
+        if not isinstance(deque, Deque):
+            return None, RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a deque",
+                exec_ctx
+            ))
+        return deque, None
+
+    def execute_deque_push(self, exec_ctx):
+        deque, failure = self.deque_arg(exec_ctx)
+        if failure: return failure
+        deque.items.append(exec_ctx.symbol_table.get("value"))
+        return RTResult().success(Number.null)
+    execute_deque_push.arg_names = ['deque', 'value']
+
+    def execute_deque_pushleft(self, exec_ctx):
+        deque, failure = self.deque_arg(exec_ctx)
+        if failure: return failure
+        deque.items.appendleft(exec_ctx.symbol_table.get("value"))
+        return RTResult().success(Number.null)
+    execute_deque_pushleft.arg_names = ['deque', 'value']
+
+    def execute_deque_pop(self, exec_ctx):
+        deque, failure = self.deque_arg(exec_ctx)
+        if failure: return failure
+        if not deque.items:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Deque is empty",
+                exec_ctx
+            ))
+        return RTResult().success(deque.items.pop())
+    execute_deque_pop.arg_names = ['deque']
+
+    def execute_deque_popleft(self, exec_ctx):
+        deque, failure = self.deque_arg(exec_ctx)
+        if failure: return failure
+        if not deque.items:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Deque is empty",
+                exec_ctx
+            ))
+        return RTResult().success(deque.items.popleft())
+    execute_deque_popleft.arg_names = ['deque']
+
+    def execute_heap(self, exec_ctx):
+        key = exec_ctx.symbol_table.get("key")
+        if key is not None and not isinstance(key, BaseFunction):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Key must be a function",
+                exec_ctx
+            ))
+        return RTResult().success(Heap(key))
+    execute_heap.arg_names = []
+    execute_heap.optional_arg_names = ['key']
+
+    def heap_arg(self, exec_ctx):
+        heap = exec_ctx.symbol_table.get("heap")
+        if not isinstance(heap, Heap):
+            return None, RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a heap",
+                exec_ctx
+            ))
+        return heap, None
+
+    def execute_heap_push(self, exec_ctx):
+        heap, failure = self.heap_arg(exec_ctx)
+        if failure: return failure
+        error = heap.push(exec_ctx.symbol_table.get("value"))
+        if error: return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        return RTResult().success(Number.null)
+    execute_heap_push.arg_names = ['heap', 'value']
+
+    def execute_heap_pop(self, exec_ctx):
+        heap, failure = self.heap_arg(exec_ctx)
+        if failure: return failure
+        value, error = heap.pop()
+        if error: return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        return RTResult().success(value)
+    execute_heap_pop.arg_names = ['heap']
+
+    def execute_heap_peek(self, exec_ctx):
+        heap, failure = self.heap_arg(exec_ctx)
+        if failure: return failure
+        value, error = heap.peek()
+        if error: return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        return RTResult().success(value)
+    execute_heap_peek.arg_names = ['heap']
+
+    def execute_vector_op(self, exec_ctx, op_type):
+        result, error = vector_binop(op_type, exec_ctx.symbol_table.get("a"), exec_ctx.symbol_table.get("b"))
+        if error:
+            return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        return RTResult().success(result)
+
+    def execute_vadd(self, exec_ctx):
+        return self.execute_vector_op(exec_ctx, TT_PLUS)
+    execute_vadd.arg_names = ['a', 'b']
+
+    def execute_vsub(self, exec_ctx):
+        return self.execute_vector_op(exec_ctx, TT_MINUS)
+    execute_vsub.arg_names = ['a', 'b']
+
+    def execute_vmul(self, exec_ctx):
+        return self.execute_vector_op(exec_ctx, TT_MUL)
+    execute_vmul.arg_names = ['a', 'b']
+
+    def execute_vdiv(self, exec_ctx):
+        return self.execute_vector_op(exec_ctx, TT_DIV)
+    execute_vdiv.arg_names = ['a', 'b']
+
+    def execute_vdot(self, exec_ctx):
+        result, error = vector_dot(exec_ctx.symbol_table.get("a"), exec_ctx.symbol_table.get("b"))
+        if error:
+            return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        return RTResult().success(result)
+    execute_vdot.arg_names = ['a', 'b']
+
+    def execute_vmap(self, exec_ctx):
+        func = exec_ctx.symbol_table.get("func")
+
+        if not isinstance(func, BaseFunction):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a function",
+                exec_ctx
+            ))
+
+        result, error = vector_map(func, exec_ctx.symbol_table.get("list_"))
+        if error:
+            return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        return RTResult().success(result)
+    execute_vmap.arg_names = ['func', 'list_']
+
+    def execute_map_get(self, exec_ctx):
+        map_ = exec_ctx.symbol_table.get("map")
+        if not isinstance(map_, Map):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a map",
+                exec_ctx
+            ))
+
+        value, error = map_.get(exec_ctx.symbol_table.get("key"))
+        if error: return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        return RTResult().success(value)
+    execute_map_get.arg_names = ['map', 'key']
+
+    def execute_map_set(self, exec_ctx):
+        map_ = exec_ctx.symbol_table.get("map")
+        if not isinstance(map_, Map):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a map",
+                exec_ctx
+            ))
+
+        error = map_.set(exec_ctx.symbol_table.get("key"), exec_ctx.symbol_table.get("value"))
+        if error: return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        return RTResult().success(Number.null)
+    execute_map_set.arg_names = ['map', 'key', 'value']
+
+    def execute_map_has(self, exec_ctx):
+        map_ = exec_ctx.symbol_table.get("map")
+        if not isinstance(map_, Map):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a map",
+                exec_ctx
+            ))
+
+        key = exec_ctx.symbol_table.get("key")
+        return RTResult().success(Boolean(Map.check_key(key) is None and key in map_.entries))
+    execute_map_has.arg_names = ['map', 'key']
+
+    def execute_map_delete(self, exec_ctx):
+        map_ = exec_ctx.symbol_table.get("map")
+        if not isinstance(map_, Map):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "First argument must be a map",
+                exec_ctx
+            ))
+
+        key = exec_ctx.symbol_table.get("key")
+        value, error = map_.get(key)
+        if error: return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        del map_.entries[key]
+        return RTResult().success(value)
+    execute_map_delete.arg_names = ['map', 'key']
+
+    def execute_map_keys(self, exec_ctx):
+        map_ = exec_ctx.symbol_table.get("map")
+        if not isinstance(map_, Map):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a map",
+                exec_ctx
+            ))
+        return RTResult().success(List(list(map_.entries)))
+    execute_map_keys.arg_names = ['map']
+
+    def execute_map_values(self, exec_ctx):
+        map_ = exec_ctx.symbol_table.get("map")
+        if not isinstance(map_, Map):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a map",
+                exec_ctx
+            ))
+        return RTResult().success(List(list(map_.entries.values())))
+    execute_map_values.arg_names = ['map']
+
+    def execute_memory(self, exec_ctx):
+        memory_state = exec_ctx.symbol_table.get_memory_state()
+        result = "Current memory state:\n"
+        for var_name, value in memory_state.items():
+            result += f"{var_name}: {value}\n"
+        return RTResult().success(String(result))
+
+    execute_memory.arg_names = []
+
+    ##############################################################
+    # Native library modules (see NATIVE_MODULES)
+
+    def typed_arg(self, exec_ctx, name, type_, message):
+        value = exec_ctx.symbol_table.get(name)
+        if not isinstance(value, type_):
+            return None, RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                message,
+                exec_ctx
+            ))
+        return value, None
+
+    def math_result(self, exec_ctx, func, *args):
+        try:
+            return RTResult().success(Number(func(*args)))
+        except (ValueError, TypeError, OverflowError, ZeroDivisionError) as e:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                f"Math error: {e}",
+                exec_ctx
+            ))
+
+    def execute_math_unary(self, exec_ctx):
+        num, failure = self.typed_arg(exec_ctx, "num", Number, "Argument must be a num")
+        if failure: return failure
+        return self.math_result(exec_ctx, MATH_FUNCTIONS[self.name[5:]], num.value)
+    execute_math_unary.arg_names = ['num']
+
+    def math_pair(self, exec_ctx):
+        a, failure = self.typed_arg(exec_ctx, "a", Number, "First argument must be a num")
+        if failure: return None, None, failure
+        b, failure = self.typed_arg(exec_ctx, "b", Number, "Second argument must be a num")
+        if failure: return None, None, failure
+        return a.value, b.value, None
+
+    def execute_math_atan2(self, exec_ctx):
+        a, b, failure = self.math_pair(exec_ctx)
+        if failure: return failure
+        return self.math_result(exec_ctx, math.atan2, a, b)
+    execute_math_atan2.arg_names = ['a', 'b']
+
+    def execute_math_hypot(self, exec_ctx):
+        a, b, failure = self.math_pair(exec_ctx)
+        if failure: return failure
+        return self.math_result(exec_ctx, math.hypot, a, b)
+    execute_math_hypot.arg_names = ['a', 'b']
+
+    def execute_math_pow(self, exec_ctx):
+        a, b, failure = self.math_pair(exec_ctx)
+        if failure: return failure
+        return self.math_result(exec_ctx, math.pow, a, b)
+    execute_math_pow.arg_names = ['a', 'b']
+
+    def execute_math_gcd(self, exec_ctx):
+        a, b, failure = self.math_pair(exec_ctx)
+        if failure: return failure
+        return self.math_result(exec_ctx, math.gcd, a, b)
+    execute_math_gcd.arg_names = ['a', 'b']
+
+    def execute_math_log(self, exec_ctx):
+        num, failure = self.typed_arg(exec_ctx, "num", Number, "First argument must be a num")
+        if failure: return failure
+        base = exec_ctx.symbol_table.get("base")
+        if base is None:
+            return self.math_result(exec_ctx, math.log, num.value)
+        if not isinstance(base, Number):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Base must be a num",
+                exec_ctx
+            ))
+        return self.math_result(exec_ctx, math.log, num.value, base.value)
+    execute_math_log.arg_names = ['num']
+    execute_math_log.optional_arg_names = ['base']
+
+    def string_pair(self, exec_ctx, second):
+        string, failure = self.typed_arg(exec_ctx, "string", String, "First argument must be a string")
+        if failure: return None, None, failure
+        other, failure = self.typed_arg(exec_ctx, second, String, "Second argument must be a string")
+        if failure: return None, None, failure
+        return string.value, other.value, None
+
+    def execute_strings_find(self, exec_ctx):
+        string, sub, failure = self.string_pair(exec_ctx, "sub")
+        if failure: return failure
+        return RTResult().success(Number(string.find(sub)))
+    execute_strings_find.arg_names = ['string', 'sub']
+
+    def execute_strings_rfind(self, exec_ctx):
+        string, sub, failure = self.string_pair(exec_ctx, "sub")
+        if failure: return failure
+        return RTResult().success(Number(string.rfind(sub)))
+    execute_strings_rfind.arg_names = ['string', 'sub']
+
+    def execute_strings_contains(self, exec_ctx):
+        string, sub, failure = self.string_pair(exec_ctx, "sub")
+        if failure: return failure
+        return RTResult().success(Boolean(sub in string))
+    execute_strings_contains.arg_names = ['string', 'sub']
+
+    def execute_strings_count(self, exec_ctx):
+        string, sub, failure = self.string_pair(exec_ctx, "sub")
+        if failure: return failure
+        return RTResult().success(Number(string.count(sub)))
+    execute_strings_count.arg_names = ['string', 'sub']
+
+    def execute_strings_startswith(self, exec_ctx):
+        string, prefix, failure = self.string_pair(exec_ctx, "prefix")
+        if failure: return failure
+        return RTResult().success(Boolean(string.startswith(prefix)))
+    execute_strings_startswith.arg_names = ['string', 'prefix']
+
+    def execute_strings_endswith(self, exec_ctx):
+        string, suffix, failure = self.string_pair(exec_ctx, "suffix")
+        if failure: return failure
+        return RTResult().success(Boolean(string.endswith(suffix)))
+    execute_strings_endswith.arg_names = ['string', 'suffix']
+
+    def execute_strings_replace(self, exec_ctx):
+        string, old, failure = self.string_pair(exec_ctx, "old")
+        if failure: return failure
+        new, failure = self.typed_arg(exec_ctx, "new", String, "Third argument must be a string")
+        if failure: return failure
+        return RTResult().success(String(string.replace(old, new.value)))
+    execute_strings_replace.arg_names = ['string', 'old', 'new']
+
+    def execute_strings_unary(self, exec_ctx):
+        string, failure = self.typed_arg(exec_ctx, "string", String, "Argument must be a string")
+        if failure: return failure
+        return RTResult().success(String(STRING_FUNCTIONS[self.name[8:]](string.value)))
+    execute_strings_unary.arg_names = ['string']
+
+    def execute_strings_chars(self, exec_ctx):
+        string, failure = self.typed_arg(exec_ctx, "string", String, "Argument must be a string")
+        if failure: return failure
+        return RTResult().success(List([String(char) for char in string.value]))
+    execute_strings_chars.arg_names = ['string']
+
+    def execute_strings_join(self, exec_ctx):
+        list_, failure = self.typed_arg(exec_ctx, "list_", List, "First argument must be a list")
+        if failure: return failure
+        sep, failure = self.typed_arg(exec_ctx, "sep", String, "Second argument must be a string")
+        if failure: return failure
+        return RTResult().success(String(sep.value.join(
+            element.value if isinstance(element, String) else str(element) for element in list_.items()
+        )))
+    execute_strings_join.arg_names = ['list_', 'sep']
+
+    def execute_strings_ord(self, exec_ctx):
+        char, failure = self.typed_arg(exec_ctx, "char", String, "Argument must be a string")
+        if failure: return failure
+        if len(char) != 1:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Argument must be a single character",
+                exec_ctx
+            ))
+        return RTResult().success(Number(ord(char.value)))
+    execute_strings_ord.arg_names = ['char']
+
+    def execute_strings_chr(self, exec_ctx):
+        code, failure = self.typed_arg(exec_ctx, "code", Number, "Argument must be a num")
+        if failure: return failure
+        try:
+            return RTResult().success(String(chr(int(code.value))))
+        except (ValueError, OverflowError):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Character code out of range",
+                exec_ctx
+            ))
+    execute_strings_chr.arg_names = ['code']
+
+    def execute_collections_counter(self, exec_ctx):
+        iterator, error = exec_ctx.symbol_table.get("list_").iterate()
+        if error: return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        counts = collections.Counter()
+        for element in iterator:
+            error = Map.check_key(element)
+            if error: return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+            counts[element] += 1
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+        return RTResult().success(Map({key: Number(count) for key, count in counts.items()}))
+    execute_collections_counter.arg_names = ['list_']
+
+    def execute_collections_unique(self, exec_ctx):
+        # Keeps the first occurrence of each element. Unhashable elements
+        # (lists, maps) are compared by identity.
+        iterator, error = exec_ctx.symbol_table.get("list_").iterate()
+        if error: return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+        seen = {}
+        for element in iterator:
+            key = element if Map.check_key(element) is None else id(element)
+            seen.setdefault(key, element)
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+        return RTResult().success(List(list(seen.values())))
+    execute_collections_unique.arg_names = ['list_']
+
+    def execute_collections_group(self, exec_ctx):
+        call, iterator, failure = self.bind_and_iterate(exec_ctx)
+        if failure: return failure
+
+        groups = {}
+        for element in iterator:
+            res = call([element])
+            if res.error: return res
+            error = Map.check_key(res.value)
+            if error: return RTResult().failure(error.set_pos(self.pos_start, self.pos_end).set_context(exec_ctx))
+            groups.setdefault(res.value, []).append(element)
+        if getattr(iterator, 'error', None): return RTResult().failure(iterator.error)
+        return RTResult().success(Map({key: List(elements) for key, elements in groups.items()}))
+    execute_collections_group.arg_names = ['func', 'list_']
+
+    def execute_collections_zip(self, exec_ctx):
+        a, failure = self.typed_arg(exec_ctx, "a", List, "First argument must be a list")
+        if failure: return failure
+        b, failure = self.typed_arg(exec_ctx, "b", List, "Second argument must be a list")
+        if failure: return failure
+        return RTResult().success(List([List([x, y]) for x, y in zip(a.items(), b.items())]))
+    execute_collections_zip.arg_names = ['a', 'b']
+
+    def execute_collections_enumerate(self, exec_ctx):
+        list_, failure = self.typed_arg(exec_ctx, "list_", List, "Argument must be a list")
+        if failure: return failure
+        return RTResult().success(List([List([Number(i), x]) for i, x in enumerate(list_.items())]))
+    execute_collections_enumerate.arg_names = ['list_']
+
+    def execute_collections_chunk(self, exec_ctx):
+        list_, failure = self.typed_arg(exec_ctx, "list_", List, "First argument must be a list")
+        if failure: return failure
+        size, failure = self.typed_arg(exec_ctx, "size", Number, "Second argument must be a num")
+        if failure: return failure
+        size = int(size.value)
+        if size < 1:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Chunk size must be at least 1",
+                exec_ctx
+            ))
+        items = list_.items()
+        return RTResult().success(List([List(items[i:i + size]) for i in range(0, len(items), size)]))
+    execute_collections_chunk.arg_names = ['list_', 'size']
+
+    def execute_collections_flatten(self, exec_ctx):
+        list_, failure = self.typed_arg(exec_ctx, "list_", List, "Argument must be a list")
+        if failure: return failure
+        elements = []
+        for element in list_.items():
+            if isinstance(element, List):
+                elements.extend(element.items())
+            else:
+                elements.append(element)
+        return RTResult().success(List(elements))
+    execute_collections_flatten.arg_names = ['list_']
+
+    def execute_time_time(self, exec_ctx):
+        return RTResult().success(Number(time.time()))
+    execute_time_time.arg_names = []
+
+    def execute_time_monotonic(self, exec_ctx):
+        return RTResult().success(Number(time.monotonic()))
+    execute_time_monotonic.arg_names = []
+
+    def execute_time_perf(self, exec_ctx):
+        return RTResult().success(Number(time.perf_counter()))
+    execute_time_perf.arg_names = []
+
+    def execute_time_format(self, exec_ctx):
+        fmt, failure = self.typed_arg(exec_ctx, "fmt", String, "First argument must be a string")
+        if failure: return failure
+        seconds = exec_ctx.symbol_table.get("seconds")
+        if seconds is not None and not isinstance(seconds, Number):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Second argument must be a num",
+                exec_ctx
+            ))
+        struct_time = time.localtime(seconds.value if seconds is not None else None)
+        return RTResult().success(String(time.strftime(fmt.value, struct_time)))
+    execute_time_format.arg_names = ['fmt']
+    execute_time_format.optional_arg_names = ['seconds']
+
+    def execute_random_uniform(self, exec_ctx):
+        a, b, failure = self.math_pair(exec_ctx)
+        if failure: return failure
+        return RTResult().success(Number(random.uniform(a, b)))
+    execute_random_uniform.arg_names = ['a', 'b']
+
+    def execute_random_gauss(self, exec_ctx):
+        a, b, failure = self.math_pair(exec_ctx)
+        if failure: return failure
+        return RTResult().success(Number(random.gauss(a, b)))
+    execute_random_gauss.arg_names = ['a', 'b']
+
+    def execute_random_choice(self, exec_ctx):
+        list_, failure = self.typed_arg(exec_ctx, "list_", List, "Argument must be a list")
+        if failure: return failure
+        items = list_.items()
+        if not items:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Cannot choose from an empty list",
+                exec_ctx
+            ))
+        return RTResult().success(random.choice(items))
+    execute_random_choice.arg_names = ['list_']
+
+    def execute_random_sample(self, exec_ctx):
+        list_, failure = self.typed_arg(exec_ctx, "list_", List, "First argument must be a list")
+        if failure: return failure
+        k, failure = self.typed_arg(exec_ctx, "k", Number, "Second argument must be a num")
+        if failure: return failure
+        items = list_.items()
+        if not 0 <= int(k.value) <= len(items):
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Sample size must be between 0 and the list length",
+                exec_ctx
+            ))
+        return RTResult().success(List(random.sample(items, int(k.value))))
+    execute_random_sample.arg_names = ['list_', 'k']
+
+    def execute_random_shuffle(self, exec_ctx):
+        list_, failure = self.typed_arg(exec_ctx, "list_", List, "Argument must be a list")
+        if failure: return failure
+        items = list(list_.items())
+        random.shuffle(items)
+        return RTResult().success(List(items))
+    execute_random_shuffle.arg_names = ['list_']
+
+    def execute_random_seed(self, exec_ctx):
+        seed, failure = self.typed_arg(exec_ctx, "seed", (Number, String), "Argument must be a num or a string")
+        if failure: return failure
+        random.seed(seed.value)
+        return RTResult().success(Number.null)
+    execute_random_seed.arg_names = ['seed']
+            
+    
+# Frame-free versions of one-argument builtins for map, filter and the
+# like. They return None to fall back to the builtin, which reports errors.
+NATIVE_BUILTINS = {
+    'sqrt': lambda x: Number(math.sqrt(x.value)) if isinstance(x, Number) and x.value >= 0 else None,
+    'abs': lambda x: Number(abs(x.value)) if isinstance(x, Number) else None,
+    'round': lambda x: Number(round(x.value)) if isinstance(x, Number) else None,
+    'tostr': lambda x: x if isinstance(x, String) else String(str(x)),
+    'is_num': lambda x: Boolean(isinstance(x, Number)),
+    'is_str': lambda x: Boolean(isinstance(x, String)),
+    'return_': lambda x: x,
+}
+
+# Builtins whose plain variable arguments are passed as References
+REFERENCE_BUILTINS = ('swap', 'del')
+
+BuiltInFunction.write       = BuiltInFunction("write")
+BuiltInFunction.return_     = BuiltInFunction("return_")
+BuiltInFunction.tostr       = BuiltInFunction("tostr")
+BuiltInFunction.input       = BuiltInFunction("input")
+BuiltInFunction.inputn      = BuiltInFunction("inputn")
+BuiltInFunction.is_num      = BuiltInFunction("is_num")
+BuiltInFunction.is_str      = BuiltInFunction("is_str")
+BuiltInFunction.is_array    = BuiltInFunction("is_array")
+BuiltInFunction.append      = BuiltInFunction("append")
+BuiltInFunction.pop         = BuiltInFunction("pop")
+BuiltInFunction.collect     = BuiltInFunction("collect")
+BuiltInFunction.unite       = BuiltInFunction("unite")
+BuiltInFunction.exit        = BuiltInFunction("exit")
+BuiltInFunction.len         = BuiltInFunction("len")
+BuiltInFunction.sqrt        = BuiltInFunction("sqrt")
+BuiltInFunction.reverse     = BuiltInFunction("reverse")
+BuiltInFunction.root        = BuiltInFunction("root")
+BuiltInFunction.abs         = BuiltInFunction("abs")
+BuiltInFunction.round       = BuiltInFunction("round")
+BuiltInFunction.sum         = BuiltInFunction("sum")
+BuiltInFunction.type        = BuiltInFunction("type")
+BuiltInFunction.sort        = BuiltInFunction("sort")
+BuiltInFunction.sort_inplace = BuiltInFunction("sort_inplace")
+BuiltInFunction.random      = BuiltInFunction("random")
+BuiltInFunction.sleep       = BuiltInFunction("sleep")
+BuiltInFunction.random_num  = BuiltInFunction("random_num")
+BuiltInFunction.now         = BuiltInFunction("now")
+BuiltInFunction.id          = BuiltInFunction("id")
+BuiltInFunction.split       = BuiltInFunction("split")
+BuiltInFunction.swap        = BuiltInFunction("swap")
+BuiltInFunction.comp        = BuiltInFunction("comp")
+BuiltInFunction.gc_clean    = BuiltInFunction("gc_clean")
+BuiltInFunction.gc_count    = BuiltInFunction("gc_count")
+BuiltInFunction.del_        = BuiltInFunction("del_")
+BuiltInFunction.os_name     = BuiltInFunction("os_name")
+BuiltInFunction.memory      = BuiltInFunction("memory")
+BuiltInFunction.range       = BuiltInFunction("range")
+BuiltInFunction.map_get     = BuiltInFunction("map_get")
+BuiltInFunction.map_set     = BuiltInFunction("map_set")
+BuiltInFunction.map_has     = BuiltInFunction("map_has")
+BuiltInFunction.map_delete  = BuiltInFunction("map_delete")
+BuiltInFunction.map_keys    = BuiltInFunction("map_keys")
+BuiltInFunction.map_values  = BuiltInFunction("map_values")
+BuiltInFunction.map         = BuiltInFunction("map")
+BuiltInFunction.filter      = BuiltInFunction("filter")
+BuiltInFunction.reduce      = BuiltInFunction("reduce")
+BuiltInFunction.any         = BuiltInFunction("any")
+BuiltInFunction.all         = BuiltInFunction("all")
+BuiltInFunction.count       = BuiltInFunction("count")
+BuiltInFunction.bisect_left = BuiltInFunction("bisect_left")
+BuiltInFunction.bisect_right = BuiltInFunction("bisect_right")
+BuiltInFunction.insort      = BuiltInFunction("insort")
+BuiltInFunction.sortedset   = BuiltInFunction("sortedset")
+BuiltInFunction.sortedset_add = BuiltInFunction("sortedset_add")
+BuiltInFunction.sortedset_remove = BuiltInFunction("sortedset_remove")
+BuiltInFunction.sortedset_has = BuiltInFunction("sortedset_has")
+BuiltInFunction.sortedset_range = BuiltInFunction("sortedset_range")
+BuiltInFunction.slice       = BuiltInFunction("slice")
+BuiltInFunction.deque       = BuiltInFunction("deque")
+BuiltInFunction.deque_push  = BuiltInFunction("deque_push")
+BuiltInFunction.deque_pushleft = BuiltInFunction("deque_pushleft")
+BuiltInFunction.deque_pop   = BuiltInFunction("deque_pop")
+BuiltInFunction.deque_popleft = BuiltInFunction("deque_popleft")
+BuiltInFunction.heap        = BuiltInFunction("heap")
+BuiltInFunction.heap_push   = BuiltInFunction("heap_push")
+BuiltInFunction.heap_pop    = BuiltInFunction("heap_pop")
+BuiltInFunction.heap_peek   = BuiltInFunction("heap_peek")
+BuiltInFunction.vadd        = BuiltInFunction("vadd")
+BuiltInFunction.vsub        = BuiltInFunction("vsub")
+BuiltInFunction.vmul        = BuiltInFunction("vmul")
+BuiltInFunction.vdiv        = BuiltInFunction("vdiv")
+BuiltInFunction.vdot        = BuiltInFunction("vdot")
+BuiltInFunction.vmap        = BuiltInFunction("vmap")
+
+#######################################
+# NATIVE MODULES
+#######################################
+
+# Library modules implemented in Python on the builtin protocol. 'use math'
+# binds these globals like those of an .fpp module, so both 'math.sin' and
+# a plain 'sin' work, and the work itself runs in C.
+
+MATH_FUNCTIONS = {
+    'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
+    'asin': math.asin, 'acos': math.acos, 'atan': math.atan,
+    'sinh': math.sinh, 'cosh': math.cosh, 'tanh': math.tanh,
+    'exp': math.exp, 'log2': math.log2, 'log10': math.log10, 'sqrt': math.sqrt,
+    'floor': math.floor, 'ceil': math.ceil, 'trunc': math.trunc,
+    'degrees': math.degrees, 'radians': math.radians, 'factorial': math.factorial,
+}
+
+STRING_FUNCTIONS = {
+    'upper': str.upper, 'lower': str.lower, 'strip': str.strip,
+    'lstrip': str.lstrip, 'rstrip': str.rstrip, 'reverse': lambda s: s[::-1],
+}
+
+for name in MATH_FUNCTIONS:
+    setattr(BuiltInFunction, f'execute_math_{name}', BuiltInFunction.execute_math_unary)
+for name in STRING_FUNCTIONS:
+    setattr(BuiltInFunction, f'execute_strings_{name}', BuiltInFunction.execute_strings_unary)
+BuiltInFunction.execute_random_random = BuiltInFunction.execute_random
+BuiltInFunction.execute_random_int = BuiltInFunction.execute_random_num
+BuiltInFunction.execute_time_sleep = BuiltInFunction.execute_sleep
+BuiltInFunction.execute_time_now = BuiltInFunction.execute_now
+
+def native_math(func):
+    def call(x):
+        if not isinstance(x, Number): return None
+        try:
+            return Number(func(x.value))
+        except (ValueError, TypeError, OverflowError):
+            return None
+    return call
+
+for name, func in MATH_FUNCTIONS.items():
+    NATIVE_BUILTINS[f'math_{name}'] = native_math(func)
+
+def native_functions(module_name, names):
+    return {name: BuiltInFunction(f'{module_name}_{name}') for name in names}
+
+NATIVE_MODULES = {
+    'math': {
+        'pi': Number.PI, 'e': Number.E, 'tau': Number(math.tau), 'inf': Number(math.inf),
+        **native_functions('math', list(MATH_FUNCTIONS) + ['atan2', 'hypot', 'pow', 'gcd', 'log']),
+    },
+    'strings': native_functions('strings', list(STRING_FUNCTIONS) + [
+        'find', 'rfind', 'contains', 'count', 'startswith', 'endswith',
+        'replace', 'chars', 'join', 'ord', 'chr',
+    ]),
+    'collections': native_functions('collections', [
+        'counter', 'unique', 'group', 'zip', 'enumerate', 'chunk', 'flatten',
+    ]),
+    'time': native_functions('time', ['time', 'monotonic', 'perf', 'sleep', 'now', 'format']),
+    'random': native_functions('random', [
+        'random', 'int', 'uniform', 'gauss', 'choice', 'sample', 'shuffle', 'seed',
+    ]),
+}
+
+#######################################
+# VECTOR OPERATIONS
+#######################################
+
+# Element-wise arithmetic on numeric arrays. Work is done on whole buffers:
+# with NumPy when it is installed, otherwise with map() over array.array.
+# Both give the same results and errors: when NumPy's answer could differ
+# from Python arithmetic the buffers are processed again without it.
+
+VECTOR_OPS = {
+    TT_PLUS: operator.add,
+    TT_MINUS: operator.sub,
+    TT_MUL: operator.mul,
+    TT_DIV: operator.truediv,
+    TT_POW: operator.pow,
+    TT_EE: operator.eq,
+    TT_NE: operator.ne,
+    TT_LT: operator.lt,
+    TT_GT: operator.gt,
+    TT_LTE: operator.le,
+    TT_GTE: operator.ge,
+}
+
+VECTOR_FUNCS = {
+    'sqrt': (math.sqrt, 'sqrt'),
+    'abs': (abs, 'abs'),
+}
+
+def vector_typecode(op_type, left_typecode, right_typecode):
+    if op_type in (TT_EE, TT_NE, TT_LT, TT_GT, TT_LTE, TT_GTE):
+        return 'q'
+    if op_type in (TT_DIV, TT_POW):
+        return 'd'
+    return 'q' if left_typecode == right_typecode == 'q' else 'd'
+
+def to_vector(value):
+    # Returns (raw operand, typecode, error): a Python number or an array.array
+    if isinstance(value, Number):
+        return value.value, 'q' if isinstance(value.value, int) else 'd', None
+    if isinstance(value, List):
+        all_ints = all(isinstance(x, Number) and isinstance(x.value, int) for x in value.items())
+        value, error = make_typed_array('q' if all_ints else 'd', value)
+        if error: return None, None, error
+    if isinstance(value, TypedArray):
+        return value.data, value.data.typecode, None
+    return None, None, RTError(None, None, 'Expected a number, list or numeric array', None)
+
+def to_numpy(operand):
+    if isinstance(operand, array.array):
+        return numpy.frombuffer(operand, dtype=numpy.int64 if operand.typecode == 'q' else numpy.float64)
+    return operand
+
+def from_numpy(result, typecode):
+    return array.array(typecode, numpy.asarray(result).astype(numpy.int64 if typecode == 'q' else numpy.float64).tobytes())
+
+def numpy_vector(compute, typecode, length):
+    # compute(as_float) does the operation on NumPy buffers, converted to
+    # float64 first if as_float is set. Returns an array.array, or None if
+    # NumPy raised, produced inf or nan (Python raises on division by zero,
+    # float overflow and 0 to a negative power) or an integer wrapped around
+    try:
+        with numpy.errstate(all='ignore'):
+            exact = numpy.broadcast_to(numpy.asarray(compute(True), dtype=numpy.float64), (length,))
+            if not numpy.isfinite(exact).all(): return None
+            if typecode == 'd':
+                return from_numpy(exact, 'd')
+            result = numpy.broadcast_to(compute(False), (length,))
+            if not (numpy.abs(exact - result) < 2.0 ** 62).all(): return None
+            return from_numpy(result, 'q')
+    except (ArithmeticError, ValueError, TypeError):
+        return None
+
+def vector_error(error, typecode):
+    if isinstance(error, OverflowError) and typecode == 'q':
+        return RTError(None, None, 'Result does not fit in intarr', None)
+    return RTError(None, None, f'Vector operation failed: {error}', None)
+
+def vector_binop(op_type, left_value, right_value):
+    left, left_typecode, error = to_vector(left_value)
+    if error: return None, error
+    right, right_typecode, error = to_vector(right_value)
+    if error: return None, error
+
+    left_is_array = isinstance(left, array.array)
+    right_is_array = isinstance(right, array.array)
+    if left_is_array and right_is_array and len(left) != len(right):
+        return None, RTError(None, None, 'Arrays must have the same length', None)
+    if not left_is_array and not right_is_array:
+        return None, RTError(None, None, 'At least one argument must be a list or numeric array', None)
+    if op_type == TT_DIV and (0 in right if right_is_array else right == 0):
+        return None, RTError(None, None, 'Division by zero', None)
+
+    op = VECTOR_OPS[op_type]
+    typecode = vector_typecode(op_type, left_typecode, right_typecode)
+    length = len(left) if left_is_array else len(right)
+
+    if numpy is not None:
+        def compute(as_float):
+            if as_float:
+                return op(numpy.asarray(to_numpy(left), dtype=numpy.float64), numpy.asarray(to_numpy(right), dtype=numpy.float64))
+            return op(to_numpy(left), to_numpy(right))
+        result = numpy_vector(compute, typecode, length)
+        if result is not None:
+            return TypedArray(result), None
+
+    if not left_is_array: left = itertools.repeat(left, length)
+    if not right_is_array: right = itertools.repeat(right, length)
+    try:
+        return TypedArray(array.array(typecode, map(op, left, right))), None
+    except (ArithmeticError, ValueError, TypeError) as e:
+        return None, vector_error(e, typecode)
+
+def vector_dot(left_value, right_value):
+    left, _, error = to_vector(left_value)
+    if error: return None, error
+    right, _, error = to_vector(right_value)
+    if error: return None, error
+
+    if not isinstance(left, array.array) or not isinstance(right, array.array) or len(left) != len(right):
+        return None, RTError(None, None, 'Arguments must be arrays of the same length', None)
+
+    if numpy is not None:
+        # An int64 dot product wraps around where Python ints do not
+        with numpy.errstate(all='ignore'):
+            result = numpy.dot(to_numpy(left), to_numpy(right))
+            exact = numpy.dot(numpy.asarray(to_numpy(left), dtype=numpy.float64), numpy.asarray(to_numpy(right), dtype=numpy.float64))
+        if isinstance(result.item(), float) or abs(exact - result) < 2.0 ** 62:
+            return Number(result.item()), None
+    return Number(sum(map(operator.mul, left, right))), None
+
+def compile_vector_expr(node, arg_name, arg_typecode, context):
+    # Turns a pure arithmetic function body into a Python callable that is
+    # applied to a whole buffer. Returns (callable, typecode) or None.
+    if isinstance(node, NumberNode):
+        value = node.tok.value
+        return (lambda x: value), 'q' if isinstance(value, int) else 'd'
+
+    if isinstance(node, VarAccessNode):
+        name = node.var_name_tok.value
+        if name == arg_name:
+            return (lambda x: x), arg_typecode
+        value = context.symbol_table.get(name)
+        if not isinstance(value, Number): return None
+        value = value.value
+        return (lambda x: value), 'q' if isinstance(value, int) else 'd'
+
+    if isinstance(node, UnaryOpNode) and node.op_tok.type == TT_MINUS:
+        compiled = compile_vector_expr(node.node, arg_name, arg_typecode, context)
+        if compiled is None: return None
+        inner, typecode = compiled
+        return (lambda x: -inner(x)), typecode
+
+    if isinstance(node, BinOpNode) and node.op_tok.type in VECTOR_OPS:
+        left = compile_vector_expr(node.left_node, arg_name, arg_typecode, context)
+        right = compile_vector_expr(node.right_node, arg_name, arg_typecode, context)
+        if left is None or right is None: return None
+        left, left_typecode = left
+        right, right_typecode = right
+        op = VECTOR_OPS[node.op_tok.type]
+        return (lambda x: op(left(x), right(x))), vector_typecode(node.op_tok.type, left_typecode, right_typecode)
+
+    if isinstance(node, CallNode) and isinstance(node.node_to_call, VarAccessNode) and len(node.arg_nodes) == 1:
+        func = context.symbol_table.get(node.node_to_call.var_name_tok.value)
+        if not isinstance(func, BuiltInFunction) or func.name not in VECTOR_FUNCS: return None
+        compiled = compile_vector_expr(node.arg_nodes[0], arg_name, arg_typecode, context)
+        if compiled is None: return None
+        inner, typecode = compiled
+        py_func, numpy_name = VECTOR_FUNCS[func.name]
+        return (lambda x: (getattr(numpy, numpy_name) if isinstance(x, numpy_array) else py_func)(inner(x))), 'd' if func.name == 'sqrt' else typecode
+
+    return None
+
+def vector_map(func, value):
+    data, typecode, error = to_vector(value)
+    if error: return None, error
+    if not isinstance(data, array.array):
+        return None, RTError(None, None, 'Second argument must be a list or numeric array', None)
+
+    if isinstance(func, BuiltInFunction) and func.name in VECTOR_FUNCS:
+        py_func, numpy_name = VECTOR_FUNCS[func.name]
+        compiled = (lambda x: (getattr(numpy, numpy_name) if isinstance(x, numpy_array) else py_func)(x)), 'd' if func.name == 'sqrt' else typecode
+    elif isinstance(func, Function) and len(func.arg_names) == 1:
+        compiled = compile_vector_expr(func.body_node, func.arg_names[0], typecode, func.context)
+    else:
+        compiled = None
+
+    if compiled is None:
+        # Not plain arithmetic: call the function once per element
+        results = []
+        for x in data:
+            res = func.execute([Number(x)])
+            if res.error: return None, res.error
+            if not isinstance(res.value, Number):
+                return None, RTError(None, None, 'Function must return a number', None)
+            results.append(res.value.value)
+        result_typecode = 'q' if all(isinstance(x, int) for x in results) else 'd'
+        try:
+            return TypedArray(array.array(result_typecode, results)), None
+        except OverflowError as e:
+            return None, vector_error(e, result_typecode)
+
+    apply, result_typecode = compiled
+    if numpy is not None:
+        result = numpy_vector(
+            lambda as_float: apply(numpy.asarray(to_numpy(data), dtype=numpy.float64) if as_float else to_numpy(data)),
+            result_typecode, len(data)
+        )
+        if result is not None:
+            return TypedArray(result), None
+    try:
+        return TypedArray(array.array(result_typecode, map(apply, data))), None
+    except (ArithmeticError, ValueError, TypeError) as e:
+        return None, vector_error(e, result_typecode)
+
+    
+#######################################
+# CONTEXT
+#######################################
+
+class Context:
+    def __init__(self, display_name, parent=None, parent_entry_pos=None):
+        self.display_name = display_name
+        self.parent = parent
+        self.parent_entry_pos = parent_entry_pos
+        self.symbol_table = None
+
+#######################################
+# SYMBOL TABLE
+#######################################
+
+class SymbolTable:
+    # Bumped whenever a table that other tables read through (has_children)
+    # gains or loses a name. Variable access sites cache the table a name
+    # was found in and trust it while this version is unchanged.
+    shape_version = 0
+    # Modules imported into this table by 'use': name -> Module, or None
+    # until the module is first needed (see ImportSystem.resolve)
+    imports = None
+
+    def __init__(self, parent=None):
+        self.symbols = {}
+        self.constants = set()
+        self.var_types = {}
+        self.parent = parent
+        self.has_children = False
+        if parent is not None:
+            parent.has_children = True
+
+    def reshape(self, name):
+        # Called before name is added to or removed from this table
+        if self.has_children:
+            SymbolTable.shape_version += 1
+
+    def get_variable_name(self, value):
+        for name, val in self.symbols.items():
+            if val is value:
+                return name
+        if self.parent:
+            return self.parent.get_variable_name(value)
+        return None
+
+    def lookup_table(self, name):
+        # Innermost scope defining name, or None
+        table = self
+        while table is not None:
+            if name in table.symbols:
+                return table
+            table = table.parent
+        return None
+
+    def get(self, name):
+        value = self.symbols.get(name, None)
+        if value == None and self.parent and name not in self.symbols:
+            return self.parent.get(name)
+        return value
+
+    def set(self, name, value, var_type=None):
+        if name in self.constants:
+            return False
+        
+        parent = self.parent
+        while parent:
+            if hasattr(parent, 'const') and name in parent.constants:
+                return False
+            parent = parent.parent
+        
+        if name not in self.symbols:
+            self.reshape(name)
+        self.symbols[name] = value
+        if var_type:
+            self.var_types[name] = var_type
+        return True
+    
+    def set_constant(self, name, value, var_type=None):
+        if name in self.symbols:
+            return False
+            
+        self.reshape(name)
+        self.symbols[name] = value
+        self.constants.add(name)
+        if var_type:
+            self.var_types[name] = var_type
+        return True
+    
+    def is_constant(self, name):
+        if name in self.constants:
+            return True
+        
+        parent = self.parent
+        while parent:
+            if hasattr(parent, 'const') and name in parent.constants:
+                return True
+            parent = parent.parent
+
+        return False
+    
+    def get_memory_state(self):
+        memory_state = {}
+        current = self
+        while current:
+            for name, value in current.symbols.items():
+                if name not in memory_state:
+                    memory_state[name] = value
+            current = current.parent
+        return memory_state
+    
+    def get_type(self, name):
+        if name in self.var_types:
+            return self.var_types[name]
+        parent = self.parent
+        while parent:
+            if hasattr(parent, 'var_types') and name in parent.var_types:
+                return parent.var_types[name]
+            parent = parent.parent
+            
+        return None
+
+    def remove(self, name):
+        if name in self.symbols:
+            self.reshape(name)
+            del self.symbols[name]
+            return True
+        elif self.parent:
+            return self.parent.remove(name)
+        return False
+        
+        
+class FrozenSymbolTable(SymbolTable):
+    # Read-only view sharing another table's symbols; used for the builtin
+    # scope that every Environment reads through to
+    def __init__(self, symbol_table):
+        super().__init__()
+        self.symbols = symbol_table.symbols
+        self.constants = symbol_table.constants
+        self.var_types = symbol_table.var_types
+
+    def set(self, name, value, var_type=None):
+        return False
+
+    def set_constant(self, name, value, var_type=None):
+        return False
+
+    def is_constant(self, name):
+        return True
+
+    def remove(self, name):
+        return False
+
+class Environment:
+    # Global namespace of one script. Every environment is an empty
+    # SymbolTable over the shared frozen builtin scope, so creating one is
+    # O(1) and scripts cannot see or overwrite each other's globals.
+    # fork() makes a child that reads this environment's globals and keeps
+    # its own assignments to itself.
+    builtins = None
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.symbol_table = SymbolTable(parent.symbol_table if parent else Environment.builtins)
+
+    def fork(self):
+        return Environment(self)
+
+    def context(self, display_name='<program>'):
+        context = Context(display_name)
+        context.symbol_table = self.symbol_table
+        return context
+
+#######################################
+# Import
+#######################################
+
+USE_PATTERN = re.compile(r'"(?:\\.|[^"\\])*"|(?<![A-Za-z0-9_.])use\s+([A-Za-z_][A-Za-z0-9_.]*)', re.IGNORECASE)
+
+def scan_uses(text):
+    # Module names of the 'use' statements in text, found without lexing.
+    # String literals are matched and skipped so quoted 'use' is ignored.
+    return [match.group(1).lower() for match in USE_PATTERN.finditer(text) if match.group(1)]
+
+def _parse_module_job(file_path):
+    return global_import_system.parse_module(file_path)
+
+class ImagePickler(pickle.Pickler):
+    # The builtin scope is rebuilt by every process that imports fpp, so
+    # images refer to it by name instead of copying it
+    def persistent_id(self, obj):
+        if obj is Environment.builtins: return 'builtins'
+        if obj is global_symbol_table: return 'globals'
+        return None
+
+class ImageUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        if pid == 'builtins': return Environment.builtins
+        if pid == 'globals': return global_symbol_table
+        raise pickle.UnpicklingError(f"Unknown image reference {pid!r}")
+
+class ImportSystem:
+    # Modules run once per process and importers share their globals.
+    # The parsed tree of every module is also kept in __fppcache__ next to
+    # the source, stamped with the source's mtime, size and sha256: a
+    # matching mtime and size skips reading the source at all, and a
+    # touched file whose hash still matches is restamped instead of parsed.
+    # The stamp also lists the modules the source uses, so preload() can
+    # walk the import graph from cache headers alone. Trees pickled by
+    # another fpp.py are ignored (see image_key).
+    CACHE_DIR = '__fppcache__'
+    CACHE_MAGIC = b'FPPC3'
+
+    def __init__(self):
+        self.modules = {}
+        self.loading = set()
+        self.stdlib_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stdlib')
+        self.write_cache = not os.environ.get('FPP_DONT_WRITE_CACHE')
+        self.main_dir = os.getcwd()
+        self.extra_dirs = []
+        self.env_dirs = [os.path.abspath(d) for d in os.environ.get('FPP_PATH', '').split(os.pathsep) if d]
+        self.listings = {}
+        self.pending = {}
+        self.parsed = {}
+        self.trees = {}
+        # FPP_IMPORT_WORKERS sets the preload pool size; anything but a
+        # positive integer leaves the default
+        try:
+            self.workers = int(os.environ.get('FPP_IMPORT_WORKERS', ''))
+        except ValueError:
+            self.workers = 0
+        if self.workers < 1:
+            self.workers = os.cpu_count() or 1
+
+    def configure(self, main_dir=None, extra_dirs=()):
+        # main_dir is the directory of the script being run (the working
+        # directory for the REPL); extra_dirs come from -I/--path flags
+        if main_dir is not None:
+            self.main_dir = os.path.abspath(main_dir)
+        self.extra_dirs = [os.path.abspath(d) for d in extra_dirs]
+
+    def search_path(self):
+        return [self.main_dir] + self.extra_dirs + self.env_dirs + [self.stdlib_path]
+
+    def import_module(self, module_name):
+        if module_name in self.modules:
+            return RTResult().success(self.modules[module_name])
+
+        if module_name in NATIVE_MODULES:
+            symbol_table = SymbolTable()
+            symbol_table.symbols.update(NATIVE_MODULES[module_name])
+            module = self.modules[module_name] = Module(module_name, symbol_table)
+            return RTResult().success(module)
+
+        file_path = self.find_module(module_name)
+        if file_path is None:
+            file_path = f"{module_name}.fpp"
+            return RTResult().failure(RTError(
+                Position(0, 0, 0, file_path, ""),
+                Position(0, 0, 0, file_path, ""),
+                f"Module '{module_name}' not found",
+                Context(module_name)
+            ))
+        return self._load_module(module_name, file_path)
+
+    def has_module(self, module_name):
+        return module_name in self.modules or module_name in NATIVE_MODULES or self.find_module(module_name) is not None
+
+    def resolve(self, symbol_table, name, seen=None):
+        # Looks name up in the modules imported into symbol_table and its
+        # parents, running them on first use. 'use' only registers a module
+        # (imports maps its name to None). A dotted name such as 'm.f' loads
+        # only m; any other name that misses every scope loads the registered
+        # modules in import order until one defines it, and then looks in
+        # the modules those import: a module's functions run in the caller's
+        # scope, so their names are looked up from there. Only the name looked
+        # up is bound into the importing table, so loading a module never
+        # changes what another name resolves to: builtins and the importer's
+        # own names are not shadowed. seen holds the modules already searched
+        # (imports may be circular). Returns an RTResult whose value is None
+        # when no imported module defines name.
+        res = RTResult()
+        if seen is None:
+            seen = set()
+        table = symbol_table
+        while table is not None:
+            imports = table.imports
+            if imports:
+                for module_name in list(imports):
+                    if name.startswith(module_name) and name[len(module_name):len(module_name) + 1] == '.':
+                        module = res.register(self._load(table, module_name))
+                        if res.error: return res
+                        value = module.symbol_table.symbols.get(name[len(module_name) + 1:])
+                        if value is not None:
+                            table.set(name, value)
+                            return res.success(value)
+
+                for module_name in list(imports):
+                    module = res.register(self._load(table, module_name))
+                    if res.error: return res
+                    value = module.symbol_table.symbols.get(name)
+                    if value is not None:
+                        table.set(name, value)
+                        return res.success(value)
+                    seen.add(module_name)
+
+                for module_name in list(imports):
+                    module_table = imports[module_name].symbol_table
+                    if not module_table.imports or all(imported in seen for imported in module_table.imports): continue
+                    value = res.register(self.resolve(module_table, name, seen))
+                    if res.error: return res
+                    if value is not None:
+                        table.set(name, value)
+                        return res.success(value)
+            table = table.parent
+        return res.success(None)
+
+    def _load(self, table, module_name):
+        module = table.imports[module_name]
+        if module is not None:
+            return RTResult().success(module)
+
+        result = self.import_module(module_name)
+        if result.error: return result
+        table.imports[module_name] = result.value
+        return result
+
+    def find_module(self, module_name):
+        # 'use a.b' means a/b.fpp under some directory of the search path.
+        # Directories are listed once and looked up in memory; only a miss
+        # rescans the ones that changed, so finding a module needs no stat.
+        parts = module_name.split('.')
+        path = self._find(parts)
+        if path is None and self._refresh_listings():
+            path = self._find(parts)
+        return path
+
+    def _find(self, parts):
+        for directory in self.search_path():
+            directory = os.path.join(directory, *parts[:-1])
+            listing = self.listings.get(directory)
+            if listing is None:
+                listing = self.listings[directory] = self._list_directory(directory)
+            file_name = listing[1].get(parts[-1])
+            if file_name is not None:
+                return os.path.join(directory, file_name)
+        return None
+
+    def _list_directory(self, directory):
+        # (mtime_ns, {module name: file name}). Identifiers are lowercased
+        # by the lexer, so modules are indexed by their lowercased name and
+        # an exact-case file wins over other spellings.
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+            file_names = os.listdir(directory)
+        except OSError:
+            return None, {}
+        names = {}
+        for file_name in sorted(file_names):
+            base, ext = os.path.splitext(file_name)
+            if ext != '.fpp': continue
+            if base == base.lower() or base.lower() not in names:
+                names[base.lower()] = file_name
+        return mtime, names
+
+    def _refresh_listings(self):
+        changed = False
+        for directory, (mtime, names) in list(self.listings.items()):
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                self.listings[directory] = self._list_directory(directory)
+                changed = True
+        return changed
+
+    def invalidate_caches(self):
+        # Forgets modules whose source changed since they were loaded, so
+        # the next 'use' runs the new version. Long-running sessions call
+        # this between inputs; a single script never needs to.
+        self._refresh_listings()
+        for module_name, module in list(self.modules.items()):
+            if module.stamp is None: continue
+            try:
+                st = os.stat(module.file_path)
+            except OSError:
+                del self.modules[module_name]
+                continue
+            if (st.st_mtime_ns, st.st_size) != module.stamp:
+                del self.modules[module_name]
+
+    IMAGE_MAGIC = b'FPPI1'
+
+    def image_key(self):
+        # Images and cached trees pickle interpreter objects, so they only
+        # fit the fpp.py that wrote them
+        st = os.stat(__file__)
+        return (st.st_mtime_ns, st.st_size)
+
+    def save_image(self, image_path, module_names):
+        # Runs the given modules and writes their initialised namespaces to
+        # image_path. Namespaces holding something that cannot be pickled
+        # (such as struct records) fall back to the parsed trees, which
+        # load_image runs again. Returns an error or None.
+        entries = []
+        for module_name in module_names:
+            result = self.import_module(module_name)
+            if result.error: return result.error
+            module = result.value
+            if module.stamp is None: continue
+            entries.append([module.name, module.file_path, module.stamp, module.symbol_table, None])
+
+        try:
+            payload = io.BytesIO()
+            ImagePickler(payload, pickle.HIGHEST_PROTOCOL).dump(entries)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            for entry in entries:
+                node, stamp, error = self.parse_module(entry[1])
+                if error: return error
+                entry[3:] = [None, node]
+            payload = io.BytesIO()
+            ImagePickler(payload, pickle.HIGHEST_PROTOCOL).dump(entries)
+
+        tmp_path = f"{image_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(self.IMAGE_MAGIC)
+            pickle.dump(self.image_key(), file)
+            file.write(payload.getbuffer())
+        os.replace(tmp_path, image_path)
+        return None
+
+    def load_image(self, image_path):
+        # Installs the modules of an image written by save_image. Modules
+        # whose source changed since are left to the normal import path.
+        # Returns False if the image is missing or from another fpp.py.
+        try:
+            with open(image_path, 'rb') as file:
+                if file.read(len(self.IMAGE_MAGIC)) != self.IMAGE_MAGIC: return False
+                if pickle.load(file) != self.image_key(): return False
+                entries = ImageUnpickler(file).load()
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError, IndexError, TypeError, ImportError, RecursionError):
+            return False
+
+        for module_name, file_path, stamp, symbol_table, node in entries:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            if (st.st_mtime_ns, st.st_size) != stamp: continue
+            if symbol_table is not None:
+                self.modules[module_name] = Module(module_name, symbol_table, file_path, stamp)
+            else:
+                self.parsed[file_path] = (node, stamp, None)
+        return True
+
+    def cache_path(self, file_path):
+        directory, base = os.path.split(file_path)
+        return os.path.join(directory, self.CACHE_DIR, os.path.splitext(base)[0] + '.fppc')
+
+    def preload(self, text):
+        # Parses every module that text imports, directly or not, ahead of
+        # its 'use'. Nothing is executed: the import graph comes from cache
+        # headers and scan_uses() over stale sources. Stale modules are
+        # parsed on a process pool while the caller starts running, and
+        # _load_module takes the result. Modules still run when their 'use'
+        # is reached, so each runs after the modules it depends on.
+        stale = [file_path for file_path, fresh in self.module_graph(text) if not fresh]
+        if len(stale) < 2 or self.workers < 2: return
+        import concurrent.futures
+        try:
+            executor = concurrent.futures.ProcessPoolExecutor(min(len(stale), self.workers))
+            for file_path in stale:
+                self.pending[file_path] = executor.submit(_parse_module_job, file_path)
+            executor.shutdown(wait=False)
+        except (OSError, NotImplementedError):
+            pass
+
+    def cancel_preload(self):
+        # Called when the program ends: drops the preloads of modules it
+        # never used. Queued parses are cancelled; running ones finish and
+        # only write their cache.
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+
+    def warm(self, text):
+        # Parses the modules text imports into memory, for processes that
+        # fork a worker per script and want the trees shared
+        for file_path, fresh in self.module_graph(text):
+            try:
+                self.parse_module(file_path)
+            except (OSError, UnicodeDecodeError):
+                pass
+
+    def module_graph(self, text):
+        # [(file_path, whether its disk cache is current)] for the modules
+        # text imports, directly or not, that are not loaded yet
+        graph = []
+        seen = set()
+        names = collections.deque(scan_uses(text))
+        while names:
+            module_name = names.popleft()
+            if module_name in self.modules or module_name in self.loading or module_name in NATIVE_MODULES: continue
+            file_path = self.find_module(module_name)
+            if file_path is None: continue
+            file_path = os.path.abspath(file_path)
+            if file_path in seen or file_path in self.pending: continue
+            seen.add(file_path)
+            try:
+                uses, fresh = self._dependencies(file_path)
+            except (OSError, UnicodeDecodeError):
+                continue
+            graph.append((file_path, fresh))
+            names.extend(uses)
+        return graph
+
+    def _dependencies(self, file_path):
+        # (names the module uses, whether its cache is up to date)
+        st = os.stat(file_path)
+        header, node = self._read_cache(self.cache_path(file_path), header_only=True)
+        if header is not None and (header[0], header[1]) == (st.st_mtime_ns, st.st_size):
+            return header[3], True
+        return scan_uses(self.read_source(file_path)), False
+
+    def read_source(self, file_path, data=None):
+        if data is None:
+            with open(file_path, 'rb') as file:
+                data = file.read()
+        return data.decode('utf-8-sig').replace('\r\n', '\n').replace('\r', '\n')
+
+    def parse_module(self, file_path):
+        # Returns (ast, stamp, error). The stamp is (mtime_ns, size) of the
+        # source that ast was parsed from. Trees are also kept in memory for
+        # processes that parse the same file more than once.
+        st = os.stat(file_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        tree = self.trees.get(file_path)
+        if tree is not None and tree[0] == stamp:
+            return tree[1], stamp, None
+
+        node, stamp, error = self._parse_module(file_path, stamp)
+        if node is not None:
+            self.trees[file_path] = (stamp, node)
+        return node, stamp, error
+
+    def _parse_module(self, file_path, stamp):
+        cache_path = self.cache_path(file_path)
+        header, node = self._read_cache(cache_path)
+        if header is not None and (header[0], header[1]) == stamp:
+            return node, stamp, None
+
+        with open(file_path, 'rb') as file:
+            data = file.read()
+        digest = hashlib.sha256(data).digest()
+        if header is not None and header[2] == digest:
+            self._write_cache(cache_path, stamp, digest, header[3], node)
+            return node, stamp, None
+
+        text = self.read_source(file_path, data)
+        lexer = Lexer(file_path, text)
+        tokens, error = lexer.make_tokens()
+        if error: return None, stamp, error
+
+        parser = Parser(tokens)
+        ast = parser.parse()
+        if ast.error: return None, stamp, ast.error
+
+        self._write_cache(cache_path, stamp, digest, scan_uses(text), ast.node)
+        return ast.node, stamp, None
+
+    def _read_cache(self, cache_path, header_only=False):
+        try:
+            with open(cache_path, 'rb') as file:
+                if file.read(len(self.CACHE_MAGIC)) != self.CACHE_MAGIC:
+                    return None, None
+                if pickle.load(file) != self.image_key():
+                    return None, None
+                header = pickle.load(file)
+                if header_only:
+                    return header, None
+                return header, pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError, IndexError, TypeError, ImportError, RecursionError):
+            return None, None
+
+    def _write_cache(self, cache_path, stamp, digest, uses, node):
+        # The cache is an optimisation only: a read-only tree or a tree too
+        # deep to pickle just means the module is parsed again next time.
+        if not self.write_cache: return
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, 'wb') as file:
+                file.write(self.CACHE_MAGIC)
+                pickle.dump(self.image_key(), file)
+                pickle.dump((stamp[0], stamp[1], digest, uses), file)
+                pickle.dump(node, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pickle.PicklingError, RecursionError, TypeError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _load_module(self, module_name, file_path):
+        file_path = os.path.abspath(file_path)
+        if module_name in self.loading:
+            return RTResult().failure(RTError(
+                Position(0, 0, 0, file_path, ""),
+                Position(0, 0, 0, file_path, ""),
+                f"Circular import of module '{module_name}'",
+                Context(module_name)
+            ))
+
+        parsed = self.parsed.pop(file_path, None)
+        future = self.pending.pop(file_path, None)
+        if future is not None and parsed is None:
+            try:
+                parsed = future.result()
+            except Exception:
+                parsed = None
+
+        try:
+            node, stamp, error = parsed or self.parse_module(file_path)
+        except (OSError, UnicodeDecodeError) as e:
+            return RTResult().failure(RTError(
+                Position(0, 0, 0, file_path, ""),
+                Position(0, 0, 0, file_path, ""),
+                f"Failed to import module '{module_name}': {str(e)}",
+                Context(module_name)
+            ))
+        if error: return RTResult().failure(error)
+
+        self.loading.add(module_name)
+        try:
+            context = Environment().context(module_name)
+            result = Interpreter().visit(node, context)
+        finally:
+            self.loading.discard(module_name)
+        if result.error: return result
+
+        module = Module(module_name, context.symbol_table, file_path, stamp)
+        self.modules[module_name] = module
+        return RTResult().success(module)
+            
+    def _load_py_module(self, module_name, file_path):
+        try:
+            spec = importlib.util.spec_from_file_location(module_name, file_path)
+            py_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(py_module)
+
+            symbol_table = SymbolTable()
+            for name, value in py_module.__dict__.items():
+                if callable(value) and not name.startswith('_'):
+                    symbol_table.set(name, BuiltInFunction(name))
+
+            module = Module(module_name, symbol_table)
+            self.modules[module_name] = module
+            return RTResult().success(module)
+        except Exception as e:
+            return RTResult().failure(RTError(
+                Position(0, 0, 0, file_path, ""),
+                Position(0, 0, 0, file_path, ""),
+                f"Failed to import Python module '{module_name}': {str(e)}",
+                Context(module_name)
+            ))
+
+global_import_system = ImportSystem()
+
+class Module:
+    def __init__(self, name, symbol_table, file_path=None, stamp=None):
+        self.name = name
+        self.symbol_table = symbol_table
+        self.file_path = file_path
+        self.stamp = stamp
+
+    def get_function(self, name):
+        return self.symbol_table.get(name)
+
+#######################################
+# INTERPRETER
+#######################################
+
+class Interpreter:
+    def visit(self, node, context):
+        method_name = f'visit_{type(node).__name__}'
+        method = getattr(self, method_name, self.no_visit_method)
+        return method(node, context)
+
+    def no_visit_method(self, node, context):
+        raise Exception(f'No visit_{type(node).__name__} method defined')
+
+    ###################################
+
+    def visit_NumberNode(self, node, context):
+        return RTResult().success(
+            Number(node.tok.value).set_context(context).set_pos(node.pos_start, node.pos_end)
+        )
+    
+    def visit_StringNode(self, node, context):
+        return RTResult().success(
+            String(node.tok.value).set_context(context).set_pos(node.pos_start, node.pos_end)
+        )
+        
+    def visit_ListNode(self, node, context):
+        res = RTResult()
+        elements = []
+
+        for element_node in node.elementNodes:
+            elements.append(res.register(self.visit(element_node, context)))
+            if res.should_return(): return res
+
+        return res.success(
+            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+        )
+
+    def visit_MapNode(self, node, context):
+        res = RTResult()
+        map_ = Map({})
+
+        for key_node, value_node in node.pair_nodes:
+            key = res.register(self.visit(key_node, context))
+            if res.should_return(): return res
+            value = res.register(self.visit(value_node, context))
+            if res.should_return(): return res
+
+            error = map_.set(key, value)
+            if error: return res.failure(error.set_pos(key_node.pos_start, key_node.pos_end).set_context(context))
+
+        return res.success(map_)
+
+    def visit_VarAccessNode(self, node, context):
+        res = RTResult()
+        var_name = node.var_name_tok.value
+        symbol_table = context.symbol_table
+
+        if var_name in symbol_table.symbols:
+            value = symbol_table.symbols[var_name]
+        else:
+            # Inline cache of the table holding the name, keyed by the parent
+            # table the search starts from; calls made from the same scope
+            # share that parent, so the cache also hits across calls
+            parent = symbol_table.parent
+            cache = node.cache
+            if cache is None or cache[0] is not parent or cache[1] != SymbolTable.shape_version:
+                owner = parent.lookup_table(var_name) if parent else None
+                cache = node.cache = (parent, SymbolTable.shape_version, owner)
+            owner = cache[2]
+            value = owner.symbols[var_name] if owner else None
+
+        if value is None:
+            value = res.register(global_import_system.resolve(symbol_table, var_name))
+            if res.error: return res
+
+        if value is None:
+            return res.failure(RTError(
+                node.pos_start, node.pos_end,
+                f"'{var_name}' is not defined",
+                context
+            ))
+
+        # Lists are shared by reference so append/pop act on the variable
+        if isinstance(value, BaseFunction):
+            value = value.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
+        return res.success(value)
+
+    def visit_VarRefNode(self, node, context):
+        var_name = node.var_name_tok.value
+        symbol_table = context.symbol_table.lookup_table(var_name)
+
+        if symbol_table is None:
+            return RTResult().failure(RTError(
+                node.pos_start, node.pos_end,
+                f"'{var_name}' is not defined",
+                context
+            ))
+        return RTResult().success(Reference(symbol_table, var_name))
+
+    def field_offset(self, node, index, record, context):
+        offsets = node.offsets[index]
+        offset = offsets.get(type(record))
+        if offset is None:
+            offset, error = record.field_offset(node.fields[index])
+            if error: return None, error.set_pos(node.pos_start, node.pos_end).set_context(context)
+            offsets[type(record)] = offset
+        return offset, None
+
+    def visit_FieldAccessNode(self, node, context):
+        res = RTResult()
+        value = context.symbol_table.get(node.record_name)
+
+        # Not a record: a dotted name such as 'gc.clean' or 'module.name'
+        if not isinstance(value, Record):
+            result = self.visit_VarAccessNode(node, context)
+            if not result.error or value is not None: return result
+            # The record may be a global of an imported module
+            value = RTResult().register(global_import_system.resolve(context.symbol_table, node.record_name))
+            if not isinstance(value, Record): return result
+
+        for index in range(len(node.fields)):
+            if not isinstance(value, Record):
+                return res.failure(RTError(
+                    node.pos_start, node.pos_end,
+                    f"Cannot read field '{node.fields[index]}' of a non-record value",
+                    context
+                ))
+            offset, error = self.field_offset(node, index, value, context)
+            if error: return res.failure(error)
+            value = value.slots[offset].__get__(value)
+
+        if isinstance(value, BaseFunction):
+            value = value.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
+        return res.success(value)
+
+    def visit_FieldAssignNode(self, node, context):
+        res = RTResult()
+        access_node = node.access_node
+        record = context.symbol_table.get(access_node.record_name)
+
+        # Not a record: the dotted name is an ordinary variable
+        if not isinstance(record, Record):
+            return self.visit_VarAssignNode(node.assign_node, context)
+
+        value = res.register(self.visit(node.value_node, context))
+        if res.should_return(): return res
+
+        last = len(access_node.fields) - 1
+        for index in range(last + 1):
+            if not isinstance(record, Record):
+                return res.failure(RTError(
+                    node.pos_start, node.pos_end,
+                    f"'{access_node.var_name_tok.value}' is not a record field",
+                    context
+                ))
+            offset, error = self.field_offset(access_node, index, record, context)
+            if error: return res.failure(error)
+            if index == last:
+                record.slots[offset].__set__(record, value)
+            else:
+                record = record.slots[offset].__get__(record)
+        return res.success(value)
+
+    def visit_StructDefNode(self, node, context):
+        struct = Struct(node.name_tok.value, [field_tok.value for field_tok in node.field_toks])
+        context.symbol_table.set(struct.name, struct)
+        return RTResult().success(struct)
+
+    def visit_VarAssignNode(self, node, context):
+        res = RTResult()
+        var_name = node.var_name_tok.value
+        value = res.register(self.visit(node.value_node, context))
+        if res.error: return res
+
+        if node.var_type:
+            if node.var_type == 'int':
+                if not isinstance(value, Number):
+                    return res.failure(RTError(
+                        node.pos_start, node.pos_end,
+                        f"Expected integer for variable '{var_name}'",
+                        context
+                    ))
+            elif node.var_type == 'str':
+                if not isinstance(value, String):
+                    return res.failure(RTError(
+                        node.pos_start, node.pos_end,
+                        f"Expected string for variable '{var_name}'",
+                        context
+                    ))
+            elif node.var_type == 'bool':
+                if isinstance(value, Boolean):
+                    pass
+                elif not isinstance(value, Number) and value.value not in (0, 1):
+                    value = Boolean(value.value == 1)
+                else:
+                    return res.failure(RTError(
+                        node.pos_start, node.pos_end,
+                        f"Expected boolean for variable '{var_name}'",
+                        context
+                    )) 
+            elif node.var_type == 'arr':
+                if isinstance(value, List):
+                    pass
+                else:
+                   return res.failure(RTError(
+                        node.pos_start, node.pos_end,
+                        f"Expected array for variable '{var_name}'",
+                        context
+                    )) 
+                   
+            elif node.var_type in ('intarr', 'floatarr'):
+                value, error = make_typed_array('q' if node.var_type == 'intarr' else 'd', value)
+                if error:
+                    return res.failure(error.set_pos(node.pos_start, node.pos_end).set_context(context))
+
+            elif node.var_type == 'float':
+                if isinstance(value, Number) and value.is_float():
+                    pass
+                else:
+                   return res.failure(RTError(
+                        node.pos_start, node.pos_end,
+                        f"Expected float num for variable '{var_name}'",
+                        context
+                    ))   
+
+        if node.is_const:
+            success = context.symbol_table.set_constant(var_name, value)
+            if not success:
+                return res.failure(RTError(
+                    node.pos_start, node.pos_end,
+                    f"Cannot change value of constant '{var_name}'",
+                    context
+                ))
+        else:
+            if context.symbol_table.is_constant(var_name):
+                return res.failure(RTError(
+                    node.pos_start, node.pos_end,
+                    f"Cannot change value of constant '{var_name}'",
+                    context
+                ))
+            context.symbol_table.set(var_name, value, node.var_type)
+        return res.success(value)
+
+    def visit_BinOpNode(self, node, context):
+        res = RTResult()
+        left = res.register(self.visit(node.left_node, context))
+        if res.error: return res
+        right = res.register(self.visit(node.right_node, context))
+        if res.error: return res
+
+        if node.op_tok.type == TT_PLUS:
+            result, error = left.added_to(right)
+        elif node.op_tok.type == TT_MINUS:
+            result, error = left.subbed_by(right)
+        elif node.op_tok.type == TT_MUL:
+            result, error = left.multed_by(right)
+        elif node.op_tok.type == TT_DIV:
+            result, error = left.dived_by(right)
+        elif node.op_tok.type == TT_POW:
+            result, error = left.powed_by(right)
+        elif node.op_tok.type == TT_EE:
+            result, error = left.get_comparison_eq(right)
+        elif node.op_tok.type == TT_NE:
+            result, error = left.get_comparison_ne(right)
+        elif node.op_tok.type == TT_LT:
+            result, error = left.get_comparison_lt(right)
+        elif node.op_tok.type == TT_GT:
+            result, error = left.get_comparison_gt(right)
+        elif node.op_tok.type == TT_LTE:
+            result, error = left.get_comparison_lte(right)
+        elif node.op_tok.type == TT_GTE:
+            result, error = left.get_comparison_gte(right)
+        elif node.op_tok.matches(TT_KEYWORD, 'and'):
+            result, error = left.anded_by(right)
+        elif node.op_tok.matches(TT_KEYWORD, 'or'):
+            result, error = left.ored_by(right)
+
+        if error:
+            return res.failure(error.set_pos(node.pos_start, node.pos_end).set_context(context))
+        else:
+            return res.success(result)
+
+    def visit_UnaryOpNode(self, node, context):
+        res = RTResult()
+        number = res.register(self.visit(node.node, context))
+        if res.error: return res
+
+        error = None
+
+        if node.op_tok.type == TT_MINUS:
+            number, error = number.multed_by(Number(-1))
+        if node.op_tok.matches(TT_KEYWORD, 'not'):
+            number, error = number.notted()
+
+        if error:
+            return res.failure(error.set_pos(node.pos_start, node.pos_end).set_context(context))
+        else:
+            return res.success(number)
+        
+
+    def visit_ifNode(self, node, context):
+        res = RTResult()
+        
+        for condition, expr, is_block in node.cases:
+            condition_value = res.register(self.visit(condition, context))
+            if res.error: 
+                return res
+            if condition_value.is_true():
+                expr_value = res.register(self.visit(expr, context))
+                if res.should_return(): 
+                    return res
+                return res.success(expr_value)
+        
+        if node.else_case:
+            else_expr, is_block = node.else_case
+            else_value = res.register(self.visit(else_expr, context))
+            if res.should_return(): 
+                return res
+            return res.success(else_value)
+        
+        return res.success(Number(0))
+    
+    def visit_forNode(self, node, context):
+        res = RTResult()
+        elements = []
+
+        start_value = res.register(self.visit(node.start_value_node, context))
+        if res.error: return res
+
+        end_value = res.register(self.visit(node.end_value_node, context))
+        if res.error: return res
+
+        if node.step_value_node:
+            step_value = res.register(self.visit(node.step_value_node, context))
+            if res.error: return res
+        else:
+            step_value = Number(1)
+
+        i = start_value.value
+
+        if step_value.value >= 0:
+            condition = lambda: i <= end_value.value
+        else:
+            condition = lambda: i >= end_value.value
+        
+        while condition():
+            context.symbol_table.set(node.var_name_tok.value, Number(i))
+            i += step_value.value
+
+            body_result = res.register(self.visit(node.body_node, context))
+            if res.should_return() and not res.loop_should_continue and not res.loop_should_break:
+                return res
+
+            if res.loop_should_continue:
+                continue
+
+            if res.loop_should_break:
+                break
+
+            if node.should_return_null:
+                continue
+
+            if isinstance(body_result, List) and isinstance(node.body_node, ListNode):
+                for item in body_result.elements:
+                    elements.append(item) 
+            else:
+                elements.append(body_result)
+
+
+        return res.success(
+            Number.null if node.should_return_null else
+            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+        )
+
+    def visit_forInNode(self, node, context):
+        res = RTResult()
+        elements = []
+        var_name = node.var_name_tok.value
+
+        iterable = res.register(self.visit(node.iterable_node, context))
+        if res.error: return res
+
+        iterator, error = iterable.iterate()
+        if error:
+            return res.failure(error.set_pos(node.iterable_node.pos_start, node.iterable_node.pos_end).set_context(context))
+
+        if context.symbol_table.is_constant(var_name):
+            return res.failure(RTError(
+                node.pos_start, node.pos_end,
+                f"Cannot change value of constant '{var_name}'",
+                context
+            ))
+
+        # The name is checked once, so each step is a plain dict store
+        symbols = context.symbol_table.symbols
+        if var_name not in symbols:
+            context.symbol_table.reshape(var_name)
+
+        for element in iterator:
+            symbols[var_name] = element
+
+            body_result = res.register(self.visit(node.body_node, context))
+            if res.should_return() and not res.loop_should_continue and not res.loop_should_break:
+                return res
+
+            if res.loop_should_continue:
+                continue
+
+            if res.loop_should_break:
+                break
+
+            if node.should_return_null:
+                continue
+
+            if isinstance(body_result, List) and isinstance(node.body_node, ListNode):
+                for item in body_result.elements:
+                    elements.append(item)
+            else:
+                elements.append(body_result)
+
+        if getattr(iterator, 'error', None): return res.failure(iterator.error)
+
+        return res.success(
+            Number.null if node.should_return_null else
+            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+        )
+
+    def visit_FuncDefNode(self, node, context):
+        res = RTResult()
+
+        func_name = node.var_name_tok.value if node.var_name_tok else '<lambda>'
+        body_node = node.body_node
+        arg_names = [arg_name.value for arg_name in node.arg_names_toks]
+        func_value = Function(func_name, body_node, arg_names, node.is_generator).set_context(context).set_pos(node.pos_start, node.pos_end)
+
+        if node.var_name_tok:
+            context.symbol_table.set(func_name, func_value)
+
+        return res.success(func_value)
+
+    def visit_CallNode(self, node, context):
+        res = RTResult()
+        args = []
+
+        value_to_call = res.register(self.visit(node.node_to_call, context))
+        if res.error: return res
+        value_to_call = value_to_call.copy().set_pos(node.pos_start, node.pos_end)
+
+        for arg_node in node.arg_nodes:
+            args.append(res.register(self.visit(arg_node, context)))
+            if res.error: return res
+
+        # 'swap' or 'del' was rebound to something that takes values
+        if node.takes_refs and not (isinstance(value_to_call, BuiltInFunction) and value_to_call.name in ('swap', 'del_')):
+            args = [arg.get() if isinstance(arg, Reference) else arg for arg in args]
+
+        if isinstance(value_to_call, List):
+            method_name = node.node_to_call.var_name_tok.value
+            if method_name == "add" and len(args) == 1:
+                result, error = value_to_call.added_to(args[0])
+            elif method_name == "remove" and len(args) == 1:
+                result, error = value_to_call.remove(args[0])
+            elif method_name == "with" and len(args) == 1:
+                result, error = value_to_call.with_(args[0])
+            elif method_name == "get" and len(args) == 1:
+                result, error = value_to_call.get(args[0])
+            else:
+                return res.failure(RTError(
+                    node.pos_start, node.pos_end,
+                    f"Invalid method call or arguments for list: {method_name}",
+                    context
+                ))
+
+            if error: return res.failure(error.set_pos(node.pos_start, node.pos_end).set_context(context))
+            return res.success(result)
+
+        return_value = res.register(value_to_call.execute(args))
+        if res.error: return res.failure(res.error.set_pos(node.pos_start, node.pos_end).set_context(context))
+        if return_value is None:
+            return_value =Number.null
+        if isinstance(return_value, BaseFunction):
+            return_value = return_value.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
+        return res.success(return_value)
+    
+    def visit_whileNode(self, node, context):
+        res = RTResult()
+        elements = []
+
+        while True:
+            condition = res.register(self.visit(node.condition_node, context))
+            if res.should_return(): return res
+            
+            if not condition.is_true():
+                break
+            
+            value = res.register(self.visit(node.body_node, context))
+            if res.should_return() and not res.loop_should_continue and not res.loop_should_break:
+                return res
+            
+            if res.loop_should_continue:
+                continue
+            
+            if res.loop_should_break:
+                break
+
+            if node.should_return_null:
+                continue
+
+            elements.append(value)
+        
+        return res.success(
+            Number.null if node.should_return_null else 
+            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+        )
+
+    def visit_YieldNode(self, node, context):
+        return RTResult().failure(RTError(
+            node.pos_start, node.pos_end,
+            "'yield' is only allowed as a statement inside a function",
+            context
+        ))
+
+    def visit_BreakNode(self, node, context):
+        return RTResult().success_break()
+
+    def visit_ContinueNode(self, node, context):
+        return RTResult().success_continue()
+    
+    def visit_ImportNode(self, node, context):
+        # Only registers the module; ImportSystem.resolve runs it when one
+        # of its names is first looked up
+        module_name = node.module_name_tok.value
+        symbol_table = context.symbol_table
+        if symbol_table.imports is None:
+            symbol_table.imports = {}
+        elif module_name in symbol_table.imports:
+            return RTResult().success(Number.null)
+
+        if not global_import_system.has_module(module_name):
+            return RTResult().failure(RTError(
+                node.pos_start, node.pos_end,
+                f"Module '{module_name}' not found",
+                context
+            ))
+        symbol_table.imports[module_name] = None
+        return RTResult().success(Number.null)
+
+#######################################
+# GENERATORS
+#######################################
+
+class GeneratorInterpreter(Interpreter):
+    # Runs a generator body as a Python generator, so the frame is suspended
+    # between items. Each step_ method yields the values passed to 'yield' and
+    # returns its RTResult; nodes without a step_ method cannot contain a yield
+    # statement and are evaluated by Interpreter.visit. Values of statements
+    # are never collected here because a generator body has no result.
+
+    def step(self, node, context):
+        method = getattr(self, f'step_{type(node).__name__}', None)
+        if method:
+            return (yield from method(node, context))
+        return self.visit(node, context)
+
+    ###################################
+
+    def step_YieldNode(self, node, context):
+        res = RTResult()
+        value = res.register(self.visit(node.value_node, context))
+        if res.should_return(): return res
+
+        yield value
+        return res.success(Number.null)
+
+    def step_ListNode(self, node, context):
+        res = RTResult()
+
+        for element_node in node.elementNodes:
+            res.register((yield from self.step(element_node, context)))
+            if res.should_return(): return res
+
+        return res.success(Number.null)
+
+    def step_ifNode(self, node, context):
+        res = RTResult()
+
+        for condition, expr, is_block in node.cases:
+            condition_value = res.register(self.visit(condition, context))
+            if res.should_return(): return res
+
+            if condition_value.is_true():
+                res.register((yield from self.step(expr, context)))
+                if res.should_return(): return res
+                return res.success(Number.null)
+
+        if node.else_case:
+            else_expr, is_block = node.else_case
+            res.register((yield from self.step(else_expr, context)))
+            if res.should_return(): return res
+
+        return res.success(Number.null)
+
+    def step_forNode(self, node, context):
+        res = RTResult()
+
+        start_value = res.register(self.visit(node.start_value_node, context))
+        if res.error: return res
+
+        end_value = res.register(self.visit(node.end_value_node, context))
+        if res.error: return res
+
+        if node.step_value_node:
+            step_value = res.register(self.visit(node.step_value_node, context))
+            if res.error: return res
+        else:
+            step_value = Number(1)
+
+        i = start_value.value
+
+        if step_value.value >= 0:
+            condition = lambda: i <= end_value.value
+        else:
+            condition = lambda: i >= end_value.value
+
+        while condition():
+            context.symbol_table.set(node.var_name_tok.value, Number(i))
+            i += step_value.value
+
+            res.register((yield from self.step(node.body_node, context)))
+            if res.should_return() and not res.loop_should_continue and not res.loop_should_break:
+                return res
+
+            if res.loop_should_break:
+                break
+
+        return res.success(Number.null)
+
+    def step_forInNode(self, node, context):
+        res = RTResult()
+        var_name = node.var_name_tok.value
+
+        iterable = res.register(self.visit(node.iterable_node, context))
+        if res.error: return res
+
+        iterator, error = iterable.iterate()
+        if error:
+            return res.failure(error.set_pos(node.iterable_node.pos_start, node.iterable_node.pos_end).set_context(context))
+
+        if context.symbol_table.is_constant(var_name):
+            return res.failure(RTError(
+                node.pos_start, node.pos_end,
+                f"Cannot change value of constant '{var_name}'",
+                context
+            ))
+
+        symbols = context.symbol_table.symbols
+        if var_name not in symbols:
+            context.symbol_table.reshape(var_name)
+
+        for element in iterator:
+            symbols[var_name] = element
+
+            res.register((yield from self.step(node.body_node, context)))
+            if res.should_return() and not res.loop_should_continue and not res.loop_should_break:
+                return res
+
+            if res.loop_should_break:
+                break
+
+        if getattr(iterator, 'error', None): return res.failure(iterator.error)
+
+        return res.success(Number.null)
+
+    def step_whileNode(self, node, context):
+        res = RTResult()
+
+        while True:
+            condition = res.register(self.visit(node.condition_node, context))
+            if res.should_return(): return res
+
+            if not condition.is_true():
+                break
+
+            res.register((yield from self.step(node.body_node, context)))
+            if res.should_return() and not res.loop_should_continue and not res.loop_should_break:
+                return res
+
+            if res.loop_should_break:
+                break
+
+        return res.success(Number.null)
+
+#######################################
+# RUN
+#######################################
+
+global_symbol_table = SymbolTable()
+global_symbol_table.set("null", Number(0))
+global_symbol_table.set("true", Boolean.true)
+global_symbol_table.set("false", Boolean.false)
+global_symbol_table.set("pi", Number.PI)
+global_symbol_table.set("e", Number.E)
+global_symbol_table.set("write", BuiltInFunction.write)
+global_symbol_table.set("return", BuiltInFunction.return_)
+global_symbol_table.set("tostr", BuiltInFunction.tostr)
+global_symbol_table.set("input", BuiltInFunction.input)
+global_symbol_table.set("inputn", BuiltInFunction.inputn)
+global_symbol_table.set("isnum", BuiltInFunction.is_num)
+global_symbol_table.set("isstr", BuiltInFunction.is_str)
+global_symbol_table.set("isarray", BuiltInFunction.is_array)
+global_symbol_table.set("append", BuiltInFunction.append)
+global_symbol_table.set("pop", BuiltInFunction.pop)
+global_symbol_table.set("collect", BuiltInFunction.collect)
+global_symbol_table.set("unite", BuiltInFunction.unite)
+global_symbol_table.set("exit", BuiltInFunction.exit)
+global_symbol_table.set("len", BuiltInFunction.len)
+global_symbol_table.set("sqrt", BuiltInFunction.sqrt)
+global_symbol_table.set("reverse", BuiltInFunction.reverse)
+global_symbol_table.set("root", BuiltInFunction.root)
+global_symbol_table.set("abs", BuiltInFunction.abs)
+global_symbol_table.set("round", BuiltInFunction.round)
+global_symbol_table.set("sum", BuiltInFunction.sum)
+global_symbol_table.set("type", BuiltInFunction.type)
+global_symbol_table.set("sort", BuiltInFunction.sort)
+global_symbol_table.set("sort.inplace", BuiltInFunction.sort_inplace)
+global_symbol_table.set("random", BuiltInFunction.random)
+global_symbol_table.set("random.num", BuiltInFunction.random_num)
+global_symbol_table.set("sleep", BuiltInFunction.sleep)
+global_symbol_table.set("now", BuiltInFunction.now)
+global_symbol_table.set("id", BuiltInFunction.id)
+global_symbol_table.set("split", BuiltInFunction.split)
+global_symbol_table.set("swap", BuiltInFunction.swap)
+global_symbol_table.set("comp", BuiltInFunction.comp)
+global_symbol_table.set("gc.clean", BuiltInFunction.gc_clean)
+global_symbol_table.set("gc.count", BuiltInFunction.gc_count)
+global_symbol_table.set("del", BuiltInFunction.del_)
+global_symbol_table.set("os.name", BuiltInFunction.os_name)
+global_symbol_table.set("memory", BuiltInFunction.memory)
+global_symbol_table.set("range", BuiltInFunction.range)
+global_symbol_table.set("map.get", BuiltInFunction.map_get)
+global_symbol_table.set("map.set", BuiltInFunction.map_set)
+global_symbol_table.set("map.has", BuiltInFunction.map_has)
+global_symbol_table.set("map.delete", BuiltInFunction.map_delete)
+global_symbol_table.set("map.keys", BuiltInFunction.map_keys)
+global_symbol_table.set("map.values", BuiltInFunction.map_values)
+global_symbol_table.set("map", BuiltInFunction.map)
+global_symbol_table.set("filter", BuiltInFunction.filter)
+global_symbol_table.set("reduce", BuiltInFunction.reduce)
+global_symbol_table.set("any", BuiltInFunction.any)
+global_symbol_table.set("all", BuiltInFunction.all)
+global_symbol_table.set("count", BuiltInFunction.count)
+global_symbol_table.set("bisect_left", BuiltInFunction.bisect_left)
+global_symbol_table.set("bisect_right", BuiltInFunction.bisect_right)
+global_symbol_table.set("insort", BuiltInFunction.insort)
+global_symbol_table.set("sortedset", BuiltInFunction.sortedset)
+global_symbol_table.set("sortedset.add", BuiltInFunction.sortedset_add)
+global_symbol_table.set("sortedset.remove", BuiltInFunction.sortedset_remove)
+global_symbol_table.set("sortedset.has", BuiltInFunction.sortedset_has)
+global_symbol_table.set("sortedset.range", BuiltInFunction.sortedset_range)
+global_symbol_table.set("slice", BuiltInFunction.slice)
+global_symbol_table.set("deque", BuiltInFunction.deque)
+global_symbol_table.set("deque.push", BuiltInFunction.deque_push)
+global_symbol_table.set("deque.pushleft", BuiltInFunction.deque_pushleft)
+global_symbol_table.set("deque.pop", BuiltInFunction.deque_pop)
+global_symbol_table.set("deque.popleft", BuiltInFunction.deque_popleft)
+global_symbol_table.set("heap", BuiltInFunction.heap)
+global_symbol_table.set("heap.push", BuiltInFunction.heap_push)
+global_symbol_table.set("heap.pop", BuiltInFunction.heap_pop)
+global_symbol_table.set("heap.peek", BuiltInFunction.heap_peek)
+global_symbol_table.set("vadd", BuiltInFunction.vadd)
+global_symbol_table.set("vsub", BuiltInFunction.vsub)
+global_symbol_table.set("vmul", BuiltInFunction.vmul)
+global_symbol_table.set("vdiv", BuiltInFunction.vdiv)
+global_symbol_table.set("vdot", BuiltInFunction.vdot)
+global_symbol_table.set("vmap", BuiltInFunction.vmap)
+
+Environment.builtins = FrozenSymbolTable(global_symbol_table)
+
+# Builtins, AST classes and the rest of the module live for the whole
+# process; moving them out of the collector keeps the gc.collect() at the
+# end of every run proportional to that run's own objects
+gc.freeze()
+
+def run(fn, text, context=None):
+    # Runs in a fresh Environment unless the context already has a symbol
+    # table (the REPL keeps one Environment across lines)
+    if context is None or context.symbol_table is None:
+        context = Environment().context('<code>')
+    lexer = Lexer(fn, text)
+    tokens, error = lexer.make_tokens()
+    if error: return None, error
+    
+
+    parser = Parser(tokens)
+    ast = parser.parse()
+    if ast.error: return None, ast.error
+    global_import_system.preload(text)
+
+
+    interpreter = Interpreter()
+    result = interpreter.visit(ast.node, context)
+    global_import_system.cancel_preload()
+    gc.enable()
+    gc.collect()
+
     return result.value, result.error
\ No newline at end of file
@@ -1,62 +1,96 @@
-import sys
-import fpp
-import os
-
-def run_file(filename):
-    full_path = os.path.abspath(filename)
-    
-    if not filename.endswith('.fpp'):
-        print(f"Error: File '{filename}' should have .fpp extension.")
-        return
-
-    print(f"Attempting to open file: {full_path}")
-    
-    if not os.path.exists(full_path):
-        print(f"Error: File '{full_path}' not found.")
-        print(f"Current working directory: {os.getcwd()}")
-        return
-
-    try:
-        with open(full_path, 'r', encoding='utf-8') as file:
-            script = file.read()
-    except IOError as e:
-        print(f"Error: Could not read file '{full_path}'. Details: {str(e)}")
-        return
-
-
-    lexer = fpp.Lexer(filename, script)
-    tokens, error = lexer.make_tokens()
-    if error:
-        print(error.as_string())
-        return
-
-
-    parser = fpp.Parser(tokens)
-    ast = parser.parse()
-    if ast.error:
-        return
-
-
-    interpreter = fpp.Interpreter()
-    context = fpp.Context('<program>')
-    context.symbol_table = fpp.SymbolTable()
-    result = interpreter.visit(ast.node, context)
-
-    if result.error:
-        print(result.error.as_string())
-    elif result.value:
-        if isinstance(result.value, fpp.Value):  
-            print(result.value)
-        elif hasattr(result.value, 'elements'):
-            if len(result.value.elements) == 1:
-                print(repr(result.value.elements[0]))
-            else:
-                print(repr(result.value))
-        else:
-            print(repr(result.value))
-            
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python run.py <filename>")
-    else:
-        run_file(sys.argv[1])
\ No newline at end of file
+import sys
+import fpp
+import os
+
+def parse_path_args(args):
+    # Strips leading '-I <dir>' / '--path <dir>' flags, which add module
+    # search directories, and '--image <file>', which starts from an image
+    # written by --save-image (default: $FPP_IMAGE). Returns
+    # (dirs, image, remaining args).
+    dirs = []
+    image = os.environ.get('FPP_IMAGE')
+    while len(args) > 1 and args[0] in ('-I', '--path', '--image'):
+        if args[0] == '--image':
+            image = args[1]
+        else:
+            dirs.append(args[1])
+        args = args[2:]
+    return dirs, image, args
+
+def load_image(image):
+    if image and not fpp.global_import_system.load_image(image):
+        print(f"Warning: image '{image}' is missing or was written by another version, ignoring it")
+
+def save_image(image, module_names, search_dirs):
+    fpp.global_import_system.configure(os.getcwd(), search_dirs)
+    error = fpp.global_import_system.save_image(image, module_names)
+    if error:
+        print(error.as_string())
+    else:
+        print(f"Wrote image '{image}' with modules: {', '.join(module_names)}")
+
+def run_file(filename, search_dirs=()):
+    full_path = os.path.abspath(filename)
+    
+    if not filename.endswith('.fpp'):
+        print(f"Error: File '{filename}' should have .fpp extension.")
+        return
+
+    print(f"Attempting to open file: {full_path}")
+    
+    if not os.path.exists(full_path):
+        print(f"Error: File '{full_path}' not found.")
+        print(f"Current working directory: {os.getcwd()}")
+        return
+
+    try:
+        with open(full_path, 'r', encoding='utf-8') as file:
+            script = file.read()
+    except IOError as e:
+        print(f"Error: Could not read file '{full_path}'. Details: {str(e)}")
+        return
+
+
+    fpp.global_import_system.configure(os.path.dirname(full_path), search_dirs)
+
+    # Scripts go through the module parse caches, so an unchanged script
+    # is not lexed or parsed again
+    try:
+        node, stamp, error = fpp.global_import_system.parse_module(full_path)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error: Could not read file '{full_path}'. Details: {str(e)}")
+        return
+    if error:
+        print(error.as_string())
+        return
+    fpp.global_import_system.preload(script)
+
+
+    interpreter = fpp.Interpreter()
+    context = fpp.Environment().context('<program>')
+    result = interpreter.visit(node, context)
+    fpp.global_import_system.cancel_preload()
+
+    if result.error:
+        print(result.error.as_string())
+    elif result.value:
+        if isinstance(result.value, fpp.Value):  
+            print(result.value)
+        elif hasattr(result.value, 'elements'):
+            if len(result.value.elements) == 1:
+                print(repr(result.value.elements[0]))
+            else:
+                print(repr(result.value))
+        else:
+            print(repr(result.value))
+            
+if __name__ == "__main__":
+    search_dirs, image, args = parse_path_args(sys.argv[1:])
+    if len(args) > 2 and args[0] == '--save-image':
+        save_image(args[1], args[2:], search_dirs)
+    elif len(args) != 1:
+        print("Usage: python run.py [-I <dir>]... [--image <file>] <filename>")
+        print("       python run.py [-I <dir>]... --save-image <file> <module>...")
+    else:
+        load_image(image)
+        run_file(args[0], search_dirs)
\ No newline at end of file
@@ -0,0 +1,179 @@
+import sys
+import os
+import socket
+import signal
+import traceback
+import fpp
+from run import parse_path_args, load_image, run_file
+from client import socket_path, decode_request
+
+# Long-running interpreter for client.py. The server keeps fpp imported,
+# the modules of an optional image loaded and the parse trees of every
+# script and module it has seen in memory. Each job runs in a forked child
+# with the client's stdin, stdout and stderr, so scripts cannot see each
+# other's globals or module state and an 'exit' or crash only ends the job.
+# The child first sends its pid, so the client can interrupt it, and then
+# the exit status. The wire format is described in client.py.
+
+def bind(path):
+    # The socket is created under a umask that leaves it private, so no
+    # other user can connect between bind() and listen(). Its directory is
+    # created with mode 0700 and must not belong to another user, who could
+    # otherwise replace the socket.
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, 0o700, exist_ok=True)
+    if os.stat(directory).st_uid not in (0, os.getuid()):
+        raise PermissionError(f"{directory} belongs to another user")
+
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(path)
+        else:
+            probe.close()
+            return None
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        listener.bind(path)
+    finally:
+        os.umask(umask)
+    listener.listen(64)
+    return listener
+
+def reply(conn, key, value):
+    try:
+        conn.sendall(f'{key} {value}\n'.encode())
+    except OSError:
+        pass
+
+def warm(path, dirs):
+    # Parses the script and everything it imports in the server, so every
+    # child forked for it starts with the trees in memory. This is only a
+    # warm-up: whatever fails here (a missing file, a tree too deep for the
+    # parser) is reported by the child when it parses the script again.
+    import_system = fpp.global_import_system
+    import_system.configure(os.path.dirname(path), dirs)
+    import_system.invalidate_caches()
+    try:
+        import_system.parse_module(path)
+        import_system.warm(import_system.read_source(path))
+    except Exception:
+        pass
+
+def run_job(conn, listener, fds, path, cwd, dirs):
+    status = 0
+    try:
+        listener.close()
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        for target, fd in enumerate(fds):
+            if fd != target:
+                os.dup2(fd, target)
+                os.close(fd)
+        sys.stdout.reconfigure(line_buffering=os.isatty(1))
+        reply(conn, 'pid', os.getpid())
+        os.chdir(cwd)
+        run_file(path, dirs)
+    except SystemExit as e:
+        status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except KeyboardInterrupt:
+        status = 130
+    except BaseException:
+        traceback.print_exc()
+        status = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except OSError:
+            pass
+        reply(conn, 'status', status)
+        os._exit(status)
+
+def handle(conn, listener):
+    # Returns False when the client asked the server to stop
+    try:
+        message, fds, flags, address = socket.recv_fds(conn, 65536, 3)
+        while message and not message.endswith(b'\0\0'):
+            chunk = conn.recv(65536)
+            if not chunk: break
+            message += chunk
+    except OSError:
+        return True
+
+    try:
+        fields = decode_request(message)
+        if fields == ['stop']:
+            reply(conn, 'status', 0)
+            return False
+        if len(fields) < 3 or fields[0] != 'run' or len(fds) != 3:
+            reply(conn, 'status', 2)
+            return True
+
+        command, path, cwd, *dirs = fields
+        warm(path, dirs)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            pid = os.fork()
+        except OSError:
+            reply(conn, 'status', 1)
+            return True
+        if pid == 0:
+            run_job(conn, listener, fds, path, cwd, dirs)
+        return True
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+def serve(path):
+    try:
+        listener = bind(path)
+    except OSError as e:
+        print(f"Cannot listen on {path}: {e}")
+        return 1
+    if listener is None:
+        print(f"An fpp server is already listening on {path}")
+        return 1
+
+    # Children are reaped by the kernel; SIGTERM unwinds so the socket
+    # file is removed
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"fpp server listening on {path}")
+    sys.stdout.flush()
+    try:
+        running = True
+        while running:
+            conn, address = listener.accept()
+            with conn:
+                running = handle(conn, listener)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        os.unlink(path)
+    return 0
+
+def main():
+    search_dirs, image, args = parse_path_args(sys.argv[1:])
+    path = socket_path()
+    if len(args) == 2 and args[0] == '--socket':
+        path = args[1]
+    elif args:
+        print("Usage: python server.py [-I <dir>]... [--image <file>] [--socket <path>]")
+        return 2
+
+    # Directories given to the server apply to every job, like FPP_PATH
+    import_system = fpp.global_import_system
+    import_system.env_dirs[:0] = [os.path.abspath(d) for d in search_dirs]
+    import_system.configure(os.getcwd())
+    load_image(image)
+    return serve(path)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fpp
+
+# Each test gets a fresh ImportSystem rooted in a temporary directory, so
+# modules loaded by one test are not seen by the next.
+
+class ModuleTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.saved_import_system = fpp.global_import_system
+        fpp.global_import_system = fpp.ImportSystem()
+        fpp.global_import_system.write_cache = False
+        fpp.global_import_system.configure(self.directory)
+
+    def tearDown(self):
+        fpp.global_import_system.cancel_preload()
+        fpp.global_import_system = self.saved_import_system
+        shutil.rmtree(self.directory)
+
+    def write_module(self, path, text):
+        path = os.path.join(self.directory, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as file:
+            file.write(text)
+        return path
+
+    def run_script(self, text):
+        # Returns the value of the last statement, or the error message
+        value, error = fpp.run('<test>', text)
+        if error: return error.details
+        return repr(value.elements[-1])
+
+class SearchPathTests(ModuleTestCase):
+    def test_script_directory(self):
+        self.write_module('a.fpp', 'func f() => 1\n')
+        self.assertEqual(self.run_script('use a\nf()'), '1')
+
+    def test_package_module(self):
+        self.write_module('pkg/inner.fpp', 'func g() => 2\n')
+        self.assertEqual(self.run_script('use pkg.inner\ng()'), '2')
+
+    def test_extra_directories(self):
+        self.write_module('lib/a.fpp', 'func f() => "lib"\n')
+        self.write_module('env/b.fpp', 'func g() => "env"\n')
+        import_system = fpp.global_import_system
+        import_system.configure(self.directory, [os.path.join(self.directory, 'lib')])
+        import_system.env_dirs = [os.path.join(self.directory, 'env')]
+        self.assertEqual(self.run_script('use a\nuse b\nf() + g()'), '"libenv"')
+
+    def test_script_directory_comes_first(self):
+        self.write_module('a.fpp', 'func f() => "main"\n')
+        self.write_module('lib/a.fpp', 'func f() => "lib"\n')
+        fpp.global_import_system.configure(self.directory, [os.path.join(self.directory, 'lib')])
+        self.assertEqual(self.run_script('use a\nf()'), '"main"')
+
+    def test_module_created_later_is_found(self):
+        self.assertEqual(self.run_script('use late\n1'), "Module 'late' not found")
+        self.write_module('late.fpp', 'func f() => 3\n')
+        self.assertEqual(self.run_script('use late\nf()'), '3')
+
+class LazyLoadingTests(ModuleTestCase):
+    def test_use_does_not_run_the_module(self):
+        self.write_module('a.fpp', 'func f() => 1\n')
+        self.run_script('use a\n1')
+        self.assertNotIn('a', fpp.global_import_system.modules)
+
+    def test_plain_name_loads_the_module(self):
+        self.write_module('a.fpp', 'func f() => 1\n')
+        self.assertEqual(self.run_script('use a\nf()'), '1')
+        self.assertIn('a', fpp.global_import_system.modules)
+
+    def test_dotted_name(self):
+        self.write_module('a.fpp', 'func f() => 2\n')
+        self.assertEqual(self.run_script('use a\na.f()'), '2')
+
+    def test_module_uses_its_own_imports(self):
+        self.write_module('a.fpp', 'use b\nfunc viaB(x) => bfun(x) + 1\n')
+        self.write_module('b.fpp', 'func bfun(x) => x * 10\n')
+        self.assertEqual(self.run_script('use a\nviaB(2)'), '21')
+
+    def test_circular_imports_end(self):
+        self.write_module('a.fpp', 'use b\nfunc fa() => fb() + 1\n')
+        self.write_module('b.fpp', 'use a\nfunc fb() => 1\n')
+        self.assertEqual(self.run_script('use a\nfa()'), '2')
+        self.assertEqual(self.run_script('use a\nmissing'), "'missing' is not defined")
+
+    def test_builtins_are_not_shadowed(self):
+        self.write_module('a.fpp', 'func f() => 1\nfunc len(x) => 0\n')
+        self.assertEqual(self.run_script('use a\na.f()\nlen([1, 2])'), '2')
+        self.assertEqual(self.run_script('use a\nf()\nlen([1, 2])'), '2')
+        self.assertEqual(self.run_script('use strings\nupper("a")\nreverse([1, 2])'), '2, 1')
+
+class PreloadTests(ModuleTestCase):
+    def test_worker_count(self):
+        saved = os.environ.get('FPP_IMPORT_WORKERS')
+        try:
+            for value, expected in [('3', 3), ('abc', None), ('0', None), ('-2', None), ('', None)]:
+                os.environ['FPP_IMPORT_WORKERS'] = value
+                self.assertEqual(fpp.ImportSystem().workers, expected or os.cpu_count() or 1)
+        finally:
+            if saved is None:
+                os.environ.pop('FPP_IMPORT_WORKERS', None)
+            else:
+                os.environ['FPP_IMPORT_WORKERS'] = saved
+
+    def test_preload_parses_stale_modules(self):
+        paths = [self.write_module(f'{name}.fpp', f'func f{name}() => "{name}"\n') for name in 'abc']
+        import_system = fpp.global_import_system
+        import_system.workers = 2
+        import_system.preload('use a\nuse b\nuse c\n')
+        self.assertEqual(sorted(import_system.pending), sorted(paths))
+        import_system.cancel_preload()
+        self.assertEqual(import_system.pending, {})
+
+    def test_unused_preloads_are_dropped(self):
+        for name in 'abc':
+            self.write_module(f'{name}.fpp', f'func f{name}() => "{name}"\n')
+        fpp.global_import_system.workers = 2
+        self.assertEqual(self.run_script('use a\nuse b\nuse c\nfa()'), '"a"')
+        self.assertEqual(fpp.global_import_system.pending, {})
+        self.assertIn('a', fpp.global_import_system.modules)
+        self.assertNotIn('b', fpp.global_import_system.modules)
+
+class ImageTests(ModuleTestCase):
+    def save_and_reload(self, module_names):
+        # Writes an image and installs it in a fresh ImportSystem, as a new
+        # process started with --image would
+        image_path = os.path.join(self.directory, 'modules.fppi')
+        self.assertIsNone(fpp.global_import_system.save_image(image_path, module_names))
+        fpp.global_import_system = fpp.ImportSystem()
+        fpp.global_import_system.write_cache = False
+        fpp.global_import_system.configure(self.directory)
+        return fpp.global_import_system.load_image(image_path)
+
+    def test_namespace_is_restored(self):
+        self.write_module('a.fpp', 'let items = [1, 2]\nfunc f() => 7\n')
+        self.assertTrue(self.save_and_reload(['a']))
+        self.assertIn('a', fpp.global_import_system.modules)
+        self.assertEqual(self.run_script('use a\nf()'), '7')
+        self.assertEqual(self.run_script('use a\nitems'), '1, 2')
+
+    def test_records_fall_back_to_trees(self):
+        self.write_module('a.fpp', 'struct P { x }\nlet origin = P(1)\n')
+        self.assertTrue(self.save_and_reload(['a']))
+        self.assertNotIn('a', fpp.global_import_system.modules)
+        self.assertEqual(self.run_script('use a\norigin.x'), '1')
+
+    def test_changed_module_is_not_restored(self):
+        path = self.write_module('a.fpp', 'func f() => 1\n')
+        image_path = os.path.join(self.directory, 'modules.fppi')
+        fpp.global_import_system.save_image(image_path, ['a'])
+        self.write_module('a.fpp', 'func f() => 22\n')
+        import_system = fpp.ImportSystem()
+        self.assertTrue(import_system.load_image(image_path))
+        self.assertNotIn('a', import_system.modules)
+
+    def test_image_from_another_interpreter_is_rejected(self):
+        self.write_module('a.fpp', 'func f() => 1\n')
+        image_path = os.path.join(self.directory, 'modules.fppi')
+        fpp.global_import_system.save_image(image_path, ['a'])
+        import_system = fpp.ImportSystem()
+        import_system.image_key = lambda: (0, 0)
+        self.assertFalse(import_system.load_image(image_path))
+        self.assertFalse(import_system.load_image(os.path.join(self.directory, 'missing.fppi')))
+
+class NativeModuleTests(ModuleTestCase):
+    def test_bad_arguments_are_runtime_errors(self):
+        self.assertEqual(self.run_script('use math\nmath.log(8, 1)'), 'Math error: float division by zero')
+        self.assertEqual(
+            self.run_script('use random\nrandom.int(5, 1)'),
+            'Arguments must be finite and the first must not be greater than the second'
+        )
+        self.assertEqual(self.run_script('use time\ntime.sleep(-1)'), 'Argument must be a non-negative number of seconds')
+
+    def test_valid_arguments(self):
+        self.assertEqual(self.run_script('use math\nmath.log(8, 2)'), '3.0')
+        self.assertEqual(self.run_script('use random\nrandom.int(3, 3)'), '3')
+
+if __name__ == '__main__':
+    unittest.main()
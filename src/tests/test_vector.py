@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fpp
+
+# Every case runs once with NumPy (when it is installed) and once with the
+# array.array fallback; both must give the same value or the same error.
+
+CASES = [
+    ('vdiv([1, 2, 3], [1, 0, 1])', 'Division by zero'),
+    ('vmap(func(x) => 1 / x, [1, 0, 2])', 'Vector operation failed: division by zero'),
+    ('vmap(func(x) => x / 0.0, [1.0, 2.0])', 'Vector operation failed: float division by zero'),
+    ('let intarr a = [4611686018427387904, 1]\nvadd(a, a)', 'Result does not fit in intarr'),
+    ('vmul([4611686018427387904, 1], [2, 2])', 'Result does not fit in intarr'),
+    ('vmap(func(x) => x * x, [4294967296, 3])', 'Result does not fit in intarr'),
+    ('vmap(func(x) => -x, [-9223372036854775807 - 1, 4])', 'Result does not fit in intarr'),
+    ('vmap(func(x) => x ^ -1, [2, 4])', '0.5, 0.25'),
+    ('vmap(func(x) => x ^ -1, [0, 4])', 'Vector operation failed: 0.0 cannot be raised to a negative power'),
+    ('vmap(func(x) => x ^ 30, [10, 4])', '1e+30, 1.152921504606847e+18'),
+    ('vmap(func(x) => sqrt(x), [-1, 4])', 'Vector operation failed: math domain error'),
+    ('vdot([4294967296, 1], [4294967296, 1])', '18446744073709551617'),
+    ('vadd([1, 2], 0.5)', '1.5, 2.5'),
+    ('vmap(func(x) => x > 2, [1, 5])', '0, 1'),
+    ('vmap(func(x) => x * 4611686018427387904 + len([1]), [4, 5])', 'Result does not fit in intarr'),
+    ('vmap(func(x) => x * 2 + len([1]), [4, 5])', '9, 11'),
+]
+
+def run(code):
+    value, error = fpp.run('<test>', code)
+    if error: return error.details
+    return repr(value.elements[-1])
+
+class VectorTests(unittest.TestCase):
+    def check_cases(self):
+        for code, expected in CASES:
+            with self.subTest(code=code):
+                self.assertEqual(run(code), expected)
+
+    def test_fallback(self):
+        numpy = fpp.numpy
+        fpp.numpy = None
+        try:
+            self.check_cases()
+        finally:
+            fpp.numpy = numpy
+
+    @unittest.skipIf(fpp.numpy is None, 'NumPy is not installed')
+    def test_numpy(self):
+        self.check_cases()
+
+if __name__ == '__main__':
+    unittest.main()